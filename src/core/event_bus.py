@@ -10,7 +10,7 @@ data flow and system observability through centralized event handling.
 """
 
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 import asyncio
@@ -110,6 +110,19 @@ class EventType(Enum):
     Use case: Updates position state, calculates P&L, sends notifications.
     """
 
+    ORDER_PLACED_FILLED = "order_placed_filled"
+    """
+    Emitted when a simulated order is placed and immediately filled.
+
+    Combines ORDER_PLACED and ORDER_FILLED into a single event for simulation
+    mode, where every placement is filled at once, halving publishes per trade.
+
+    Payload includes: all ORDER_PLACED fields plus fill_price, filled_size,
+                     commission.
+
+    Use case: Single subscription point for simulated trade entries.
+    """
+
     POSITION_CLOSED = "position_closed"
     """
     Emitted when a trading position is fully closed (exited).
@@ -123,6 +136,20 @@ class EventType(Enum):
     Use case: Final P&L calculation, risk limit updates, performance analytics.
     """
 
+    BACKTEST_COMPLETED = "backtest_completed"
+    """
+    Emitted when a batch of historical signals has been replayed.
+
+    Replaces the per-signal order and position events for backtests, where
+    signals are known up front and processed in one pass.
+
+    Payload includes: symbol, signal and order counts, column lists of
+                     order_ids, sides, entry/stop/take-profit prices and
+                     realized_pnl, plus size, commission and total_pnl.
+
+    Use case: Backtest reporting and strategy performance evaluation.
+    """
+
     ERROR = "error"
     """
     Emitted when a system error or exception occurs.
@@ -135,6 +162,11 @@ class EventType(Enum):
     Use case: Central error logging, critical failure notifications, system health monitoring.
     """
 
+    # Members are singletons compared by identity, so hash by identity too.
+    # Enum's default __hash__ is a Python-level hash(self._name_) call paid on
+    # every dict lookup keyed by event type (subscribers, dispatch snapshots).
+    __hash__ = object.__hash__
+
     def __str__(self) -> str:
         """
         Return the string representation of the event type.
@@ -154,13 +186,14 @@ class EventType(Enum):
         return f"<EventType.{self.name}: '{self.value}'>"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     """
     Event data structure for the event bus system.
 
     Encapsulates all information about an event occurrence, including type,
-    payload data, and metadata for tracking and debugging.
+    payload data, and metadata for tracking and debugging. Events are
+    immutable and slotted to keep per-publish allocation small.
 
     Attributes:
         event_type (EventType): The type of event being emitted
@@ -204,7 +237,7 @@ class Event:
 
         # Set timestamp to current time if not provided
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
+            object.__setattr__(self, "timestamp", datetime.utcnow())
 
     def __str__(self) -> str:
         """Return human-readable event description."""
@@ -220,6 +253,110 @@ class Event:
         )
 
 
+# Dispatch snapshot entry: (callback, is_async, predicate or None)
+_HandlerEntry = Tuple[Callable[[Event], Any], bool, Optional[Callable[[Event], bool]]]
+
+
+class _SymbolFilter:
+    """
+    Subscription predicate matching ``event.data['symbol']``.
+
+    Registered by EventBus.subscribe_symbol(). The bus recognizes it and
+    indexes the subscriber by symbol, so dispatch does one dict lookup per
+    event instead of calling a predicate per subscriber.
+    """
+
+    __slots__ = ("symbol",)
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+
+    def __call__(self, event: Event) -> bool:
+        return event.data.get("symbol") == self.symbol
+
+
+class _EventBatcher:
+    """
+    Coalesces events for one batch subscriber.
+
+    Registered on the bus through its ``deliver`` coroutine, so batching rides
+    on the normal dispatch path. The buffer is handed to the callback once it
+    holds ``max_batch`` events or ``flush_ms`` after the first buffered event,
+    whichever comes first.
+
+    Batches are always delivered from a separate task, so the callback is
+    not bound by the 1.0s handler timeout that wraps ``deliver``. A lock
+    keeps batches in order, and flush() awaits every delivery in flight.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[List[Event]], Union[None, Awaitable[None]]],
+        max_batch: int,
+        flush_ms: float
+    ):
+        self._callback = callback
+        self._is_async = asyncio.iscoroutinefunction(callback)
+        self._max_batch = max_batch
+        self._flush_delay = flush_ms / 1000.0
+        self._buffer: List[Event] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Deliveries in flight, serialised by _lock so batches arrive in order
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    async def deliver(self, event: Event) -> None:
+        """Buffer one event, handing the batch off once it is full."""
+        self._buffer.append(event)
+        if len(self._buffer) >= self._max_batch:
+            self.cancel()
+            self._spawn_delivery()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._flush_delay, self._on_timer
+            )
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        if self._buffer:
+            self._spawn_delivery()
+
+    def _spawn_delivery(self) -> None:
+        """Move the buffer into a delivery task and track it."""
+        batch, self._buffer = self._buffer, []
+        task = asyncio.create_task(self._deliver_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _deliver_batch(self, batch: List[Event]) -> None:
+        """Hand one batch to the callback, logging instead of raising."""
+        async with self._lock:
+            try:
+                if self._is_async:
+                    await self._callback(batch)
+                else:
+                    self._callback(batch)
+            except Exception as e:
+                logger.error(
+                    "Error in batch subscriber {} for {} event(s): {}",
+                    getattr(self._callback, "__name__", self._callback), len(batch), e
+                )
+
+    async def flush(self) -> None:
+        """Deliver all buffered events and wait for every delivery in flight."""
+        self.cancel()
+        if self._buffer:
+            self._spawn_delivery()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def cancel(self) -> None:
+        """Cancel the pending flush timer, if any."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
 class EventBus:
     """
     Central event bus for publish-subscribe event handling.
@@ -249,16 +386,49 @@ class EventBus:
         Candle closed: 45000
     """
 
-    def __init__(self):
-        """Initialize the event bus with empty subscriber lists and async queue."""
+    def __init__(self, inline_dispatch: bool = False):
+        """
+        Initialize the event bus with empty subscriber lists and async queue.
+
+        Args:
+            inline_dispatch (bool): If True, publish() and publish_batch()
+                dispatch on the caller's coroutine instead of queueing, and
+                handlers run one after another without a task, thread or
+                timeout per call. Meant for fast test runs; handlers of one
+                event no longer run concurrently. Defaults to False.
+        """
         self._subscribers: Dict[EventType, List[Callable[[Event], None]]] = {
             event_type: [] for event_type in EventType
         }
+        # Optional per-subscriber predicates, keyed by callback
+        self._predicates: Dict[EventType, Dict[Callable, Callable[[Event], bool]]] = {
+            event_type: {} for event_type in EventType
+        }
+        # Dispatch snapshot per event type, rebuilt on (un)subscribe so
+        # _dispatch never inspects callbacks
+        self._handlers: Dict[EventType, Tuple[_HandlerEntry, ...]] = {
+            event_type: () for event_type in EventType
+        }
+        # Symbol-filtered subscribers indexed by symbol
+        self._symbol_handlers: Dict[EventType, Dict[str, Tuple[_HandlerEntry, ...]]] = {
+            event_type: {} for event_type in EventType
+        }
+        # Subscribers for every event type, and their dispatch snapshot
+        self._global_subscribers: List[Callable[[Event], None]] = []
+        self._global_handlers: Tuple[_HandlerEntry, ...] = ()
+        # Batch subscribers keyed by (event_type, callback)
+        self._batchers: Dict[Tuple[EventType, Callable], _EventBatcher] = {}
+        self._inline_dispatch: bool = inline_dispatch
         self._queue: asyncio.Queue = None  # Created in start() to use correct event loop
         self._running: bool = False
         self._task: asyncio.Task = None
 
-    def subscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
+    def subscribe(
+        self,
+        event_type: EventType,
+        callback: Callable[[Event], None],
+        predicate: Optional[Callable[[Event], bool]] = None
+    ) -> None:
         """
         Subscribe to a specific event type.
 
@@ -266,6 +436,9 @@ class EventBus:
             event_type (EventType): The event type to subscribe to
             callback (Callable): Function to call when event occurs.
                                Must accept an Event parameter.
+            predicate (Callable, optional): Filter evaluated before the
+                               callback is scheduled; the callback only
+                               receives events for which it returns True.
 
         Raises:
             TypeError: If event_type is not an EventType enum member
@@ -273,12 +446,42 @@ class EventBus:
         Examples:
             >>> bus = EventBus()
             >>> bus.subscribe(EventType.ERROR, lambda e: print(f"Error: {e.data}"))
+            >>> bus.subscribe(
+            ...     EventType.CANDLE_CLOSED, on_candle,
+            ...     predicate=lambda e: e.data['interval'] == '15m'
+            ... )
         """
         if not isinstance(event_type, EventType):
             raise TypeError(f"event_type must be EventType enum, got {type(event_type)}")
 
         if callback not in self._subscribers[event_type]:
             self._subscribers[event_type].append(callback)
+            if predicate is not None:
+                self._predicates[event_type][callback] = predicate
+            self._refresh_handlers(event_type)
+
+    def subscribe_symbol(
+        self,
+        event_type: EventType,
+        symbol: str,
+        callback: Callable[[Event], None]
+    ) -> None:
+        """
+        Subscribe to events whose ``data['symbol']`` equals symbol.
+
+        Equivalent to subscribe() with a symbol predicate, but subscribers are
+        indexed by symbol so events for other symbols cost one dict lookup
+        rather than a predicate call per subscriber. Remove with unsubscribe().
+
+        Args:
+            event_type (EventType): The event type to subscribe to
+            symbol (str): Symbol to match, e.g. 'BTCUSDT'
+            callback (Callable): Function to call for matching events
+
+        Examples:
+            >>> bus.subscribe_symbol(EventType.CANDLE_CLOSED, 'BTCUSDT', on_btc_candle)
+        """
+        self.subscribe(event_type, callback, predicate=_SymbolFilter(symbol))
 
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """
@@ -296,6 +499,133 @@ class EventBus:
         """
         if callback in self._subscribers[event_type]:
             self._subscribers[event_type].remove(callback)
+            self._predicates[event_type].pop(callback, None)
+            self._refresh_handlers(event_type)
+
+    def subscribe_all(self, callback: Callable[[Event], None]) -> None:
+        """
+        Subscribe to every event type with a single registration.
+
+        Global subscribers run alongside the per-type subscribers of each
+        dispatched event and count towards subscriber_count() and
+        has_subscribers() for every type.
+
+        Args:
+            callback (Callable): Function to call for every event
+
+        Examples:
+            >>> bus.subscribe_all(lambda e: print(e.event_type.name))
+        """
+        if callback not in self._global_subscribers:
+            self._global_subscribers.append(callback)
+            self._refresh_global_handlers()
+
+    def unsubscribe_all(self, callback: Callable[[Event], None]) -> None:
+        """
+        Remove a subscriber registered with subscribe_all().
+
+        Args:
+            callback (Callable): The callback passed to subscribe_all()
+        """
+        if callback in self._global_subscribers:
+            self._global_subscribers.remove(callback)
+            self._refresh_global_handlers()
+
+    def _refresh_global_handlers(self) -> None:
+        """Rebuild the dispatch snapshot for global subscribers."""
+        self._global_handlers = tuple(
+            (callback, asyncio.iscoroutinefunction(callback), None)
+            for callback in self._global_subscribers
+        )
+
+    def subscribe_batch(
+        self,
+        event_type: EventType,
+        callback: Callable[[List[Event]], Union[None, Awaitable[None]]],
+        max_batch: int = 32,
+        flush_ms: float = 50
+    ) -> None:
+        """
+        Subscribe to an event type with batched delivery.
+
+        Events published on the async queue are buffered and handed to the
+        callback as a list once ``max_batch`` events have accumulated or
+        ``flush_ms`` milliseconds after the first buffered event, whichever
+        comes first. Remaining events are flushed by stop(). Batching applies
+        to publish() only; emit() does not reach batch subscribers.
+
+        Args:
+            event_type (EventType): The event type to subscribe to
+            callback (Callable): Sync or async function accepting List[Event]
+            max_batch (int): Flush as soon as this many events are buffered
+            flush_ms (float): Maximum time an event waits in the buffer
+
+        Raises:
+            TypeError: If event_type is not an EventType enum member
+            ValueError: If max_batch < 1 or flush_ms < 0
+
+        Examples:
+            >>> async def on_candles(events):
+            ...     print(f"{len(events)} candles closed")
+            >>> bus.subscribe_batch(EventType.CANDLE_CLOSED, on_candles, max_batch=16)
+        """
+        if not isinstance(event_type, EventType):
+            raise TypeError(f"event_type must be EventType enum, got {type(event_type)}")
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be >= 1, got {max_batch}")
+        if flush_ms < 0:
+            raise ValueError(f"flush_ms must be >= 0, got {flush_ms}")
+
+        key = (event_type, callback)
+        if key in self._batchers:
+            return
+
+        batcher = _EventBatcher(callback, max_batch, flush_ms)
+        self._batchers[key] = batcher
+        self.subscribe(event_type, batcher.deliver)
+
+    def unsubscribe_batch(
+        self,
+        event_type: EventType,
+        callback: Callable[[List[Event]], Union[None, Awaitable[None]]]
+    ) -> None:
+        """
+        Remove a batch subscriber.
+
+        Events still buffered for the subscriber are dropped; call
+        flush_batches() first to deliver them.
+
+        Args:
+            event_type (EventType): The event type to unsubscribe from
+            callback (Callable): The batch callback passed to subscribe_batch()
+        """
+        batcher = self._batchers.pop((event_type, callback), None)
+        if batcher is not None:
+            batcher.cancel()
+            self.unsubscribe(event_type, batcher.deliver)
+
+    async def flush_batches(self) -> None:
+        """Deliver every buffered batch and wait for deliveries in flight."""
+        for batcher in list(self._batchers.values()):
+            await batcher.flush()
+
+    def _refresh_handlers(self, event_type: EventType) -> None:
+        """Rebuild the dispatch snapshots for one event type."""
+        predicates = self._predicates[event_type]
+        handlers = []
+        by_symbol: Dict[str, List[_HandlerEntry]] = {}
+        for callback in self._subscribers[event_type]:
+            is_async = asyncio.iscoroutinefunction(callback)
+            predicate = predicates.get(callback)
+            if isinstance(predicate, _SymbolFilter):
+                by_symbol.setdefault(predicate.symbol, []).append((callback, is_async, None))
+            else:
+                handlers.append((callback, is_async, predicate))
+
+        self._handlers[event_type] = tuple(handlers)
+        self._symbol_handlers[event_type] = {
+            symbol: tuple(entries) for symbol, entries in by_symbol.items()
+        }
 
     def emit(self, event: Event) -> None:
         """
@@ -319,9 +649,17 @@ class EventBus:
         if not isinstance(event, Event):
             raise TypeError(f"event must be Event instance, got {type(event)}")
 
-        # Call all subscribers for this event type
-        for callback in self._subscribers[event.event_type]:
+        predicates = self._predicates[event.event_type]
+
+        # Call all subscribers for this event type, then global subscribers
+        for callback in self._subscribers[event.event_type] + self._global_subscribers:
+            # Batch subscribers are async and only fed through publish()
+            if isinstance(getattr(callback, "__self__", None), _EventBatcher):
+                continue
             try:
+                predicate = predicates.get(callback)
+                if predicate is not None and not predicate(event):
+                    continue
                 callback(event)
             except Exception as e:
                 # Log error but don't break other subscribers
@@ -344,12 +682,33 @@ class EventBus:
             >>> bus.subscriber_count(EventType.CANDLE_CLOSED)
             0
         """
-        return len(self._subscribers[event_type])
+        return len(self._subscribers[event_type]) + len(self._global_subscribers)
+
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """
+        Check whether any subscriber is registered for an event type.
+
+        Publishers can use this to skip building events nobody listens to.
+
+        Args:
+            event_type (EventType): The event type to check
+
+        Returns:
+            bool: True if at least one subscriber is registered
+
+        Examples:
+            >>> bus = EventBus()
+            >>> bus.has_subscribers(EventType.ORDER_PLACED)
+            False
+        """
+        return bool(self._subscribers.get(event_type) or self._global_subscribers)
 
     def clear_subscribers(self, event_type: EventType = None) -> None:
         """
         Clear subscribers for a specific event type or all events.
 
+        Clearing all events also removes subscribe_all() subscribers.
+
         Args:
             event_type (EventType, optional): Event type to clear.
                                             If None, clears all subscribers.
@@ -363,8 +722,21 @@ class EventBus:
             # Clear all subscribers
             for event_type in EventType:
                 self._subscribers[event_type].clear()
+                self._predicates[event_type].clear()
+                self._handlers[event_type] = ()
+                self._symbol_handlers[event_type] = {}
+            for batcher in self._batchers.values():
+                batcher.cancel()
+            self._batchers.clear()
+            self._global_subscribers.clear()
+            self._global_handlers = ()
         else:
             self._subscribers[event_type].clear()
+            self._predicates[event_type].clear()
+            self._handlers[event_type] = ()
+            self._symbol_handlers[event_type] = {}
+            for key in [key for key in self._batchers if key[0] is event_type]:
+                self._batchers.pop(key).cancel()
 
     async def publish(self, event: Event) -> None:
         """
@@ -386,14 +758,100 @@ class EventBus:
             >>> event = Event(EventType.CANDLE_CLOSED, {'price': 45000}, 'data')
             >>> await bus.publish(event)  # Non-blocking publish
         """
+        if self._inline_dispatch:
+            self._check_publish(event)
+            await self._dispatch(event)
+        else:
+            self.publish_nowait(event)
+
+    def publish_nowait(self, event: Event) -> None:
+        """
+        Publish an event to the async queue without awaiting.
+
+        Synchronous counterpart of publish() for callers that enqueue many
+        events in a loop: nothing yields to the event loop, so the events are
+        dispatched once the caller next awaits (for example on drain()).
+        Events are always queued, even with inline_dispatch.
+
+        Args:
+            event (Event): The event to publish
+
+        Raises:
+            TypeError: If event is not an Event instance
+            RuntimeError: If event bus is not started
+
+        Examples:
+            >>> for candle in candles:
+            ...     bus.publish_nowait(Event(EventType.CANDLE_CLOSED, candle, 'data'))
+            >>> await bus.drain()
+        """
+        self._check_publish(event)
+
+        # Non-blocking queue insertion
+        self._queue.put_nowait(event)
+
+    def _check_publish(self, event: Event) -> None:
+        """Raise if event cannot be published on this bus."""
         if not isinstance(event, Event):
             raise TypeError(f"event must be Event instance, got {type(event)}")
 
         if self._queue is None:
             raise RuntimeError("Event bus not started. Call start() first.")
 
-        # Non-blocking queue insertion
-        self._queue.put_nowait(event)
+    async def drain(self) -> None:
+        """
+        Wait until every queued event has been dispatched.
+
+        Events published by handlers while draining are queued too, so this
+        returns only once the whole cascade has been processed.
+
+        Raises:
+            RuntimeError: If event bus is not started
+
+        Examples:
+            >>> bus.publish_nowait(event)
+            >>> await bus.drain()  # All handlers have run
+        """
+        if self._queue is None:
+            raise RuntimeError("Event bus not started. Call start() first.")
+
+        await self._queue.join()
+
+    async def publish_batch(self, events: Iterable[Event]) -> None:
+        """
+        Publish several events to the async queue in one call.
+
+        Equivalent to awaiting publish() for each event in order, without a
+        coroutine round-trip per event. Events are validated before any is
+        queued, so an invalid event leaves the queue untouched.
+
+        Args:
+            events (Iterable[Event]): Events to publish, in order
+
+        Raises:
+            TypeError: If any item is not an Event instance
+            RuntimeError: If event bus is not started
+
+        Examples:
+            >>> events = [Event(EventType.CANDLE_CLOSED, c, 'data') for c in candles]
+            >>> await bus.publish_batch(events)
+        """
+        events = list(events)
+        for event in events:
+            if not isinstance(event, Event):
+                raise TypeError(f"event must be Event instance, got {type(event)}")
+
+        if self._queue is None:
+            raise RuntimeError("Event bus not started. Call start() first.")
+
+        if self._inline_dispatch:
+            for event in events:
+                await self._dispatch(event)
+            return
+
+        put = self._queue.put_nowait
+        for event in events:
+            put(event)
 
     async def start(self) -> None:
         """
@@ -452,12 +910,21 @@ class EventBus:
         """
         Dispatch an event to all subscribers with timeout protection.
 
-        Calls all registered callbacks for the event type, supporting both
-        synchronous and asynchronous handlers. Each handler is protected by
-        a 1.0s timeout to prevent hanging.
+        Calls all registered callbacks for the event type concurrently,
+        supporting both synchronous and asynchronous handlers. Each handler is
+        protected by a 1.0s timeout to prevent hanging, and a failing handler
+        does not affect the others. Handlers of one event run in no
+        guaranteed order; events themselves are still dispatched one at a
+        time in publish order.
 
         Async handlers are awaited directly with timeout protection.
         Sync handlers are executed in a thread pool to avoid blocking the event loop.
+        Subscribers whose predicate rejects the event are skipped before any
+        coroutine or thread is scheduled; symbol subscribers are looked up by
+        ``event.data['symbol']``.
+
+        With inline_dispatch, handlers are instead called one after another
+        in subscription order, without timeout or thread pool.
 
         Args:
             event (Event): The event to dispatch
@@ -473,37 +940,86 @@ class EventBus:
             >>> bus.subscribe(EventType.CANDLE_CLOSED, sync_handler)
             >>> await bus._dispatch(event)  # Both handlers called with timeout
         """
-        handlers = self._subscribers[event.event_type]
-        handler_count = len(handlers)
+        handlers = self._handlers[event.event_type]
+        by_symbol = self._symbol_handlers[event.event_type]
+        if by_symbol:
+            matched = by_symbol.get(event.data.get("symbol"))
+            if matched:
+                handlers = handlers + matched
+        if self._global_handlers:
+            handlers = handlers + self._global_handlers
 
         logger.debug(
-            f"Dispatching event {event.event_type.value} to {handler_count} handler(s)"
+            "Dispatching event {} to {} handler(s)",
+            event.event_type.value, len(handlers)
         )
 
-        for callback in handlers:
-            try:
-                # Check if handler is async coroutine function
-                if asyncio.iscoroutinefunction(callback):
-                    # Async handler: await with timeout
-                    await asyncio.wait_for(callback(event), timeout=1.0)
-                else:
-                    # Sync handler: run in thread pool with timeout
-                    await asyncio.wait_for(
-                        asyncio.to_thread(callback, event),
-                        timeout=1.0
+        selected = []
+        for callback, is_async, predicate in handlers:
+            if predicate is not None:
+                try:
+                    if not predicate(event):
+                        continue
+                except Exception as e:
+                    logger.error(
+                        f"Error in event predicate for {callback.__name__} "
+                        f"for {event.event_type.value}: {e}"
                     )
-            except asyncio.TimeoutError:
-                # Handler exceeded timeout - log warning but continue
-                logger.warning(
-                    f"Handler {callback.__name__} for event {event.event_type.value} "
-                    f"exceeded 1.0s timeout"
-                )
-            except Exception as e:
-                # Log error but don't break other subscribers
-                logger.error(
-                    f"Error in event subscriber {callback.__name__} "
-                    f"for {event.event_type.value}: {e}"
+                    continue
+            selected.append((callback, is_async))
+
+        if self._inline_dispatch:
+            for callback, is_async in selected:
+                await self._invoke_inline(callback, is_async, event)
+            return
+
+        calls = [self._invoke(callback, is_async, event) for callback, is_async in selected]
+
+        # Handlers run concurrently, so per-event latency is the slowest
+        # handler rather than the sum; a lone handler skips gather()
+        if len(calls) == 1:
+            await calls[0]
+        elif calls:
+            await asyncio.gather(*calls, return_exceptions=True)
+
+    async def _invoke(self, callback: Callable[[Event], Any], is_async: bool, event: Event) -> None:
+        """Run one handler with timeout protection, logging instead of raising."""
+        try:
+            # Handler kind was resolved once at subscribe time
+            if is_async:
+                # Async handler: await with timeout
+                await asyncio.wait_for(callback(event), timeout=1.0)
+            else:
+                # Sync handler: run in thread pool with timeout
+                await asyncio.wait_for(
+                    asyncio.to_thread(callback, event),
+                    timeout=1.0
                 )
+        except asyncio.TimeoutError:
+            # Handler exceeded timeout - log warning but continue
+            logger.warning(
+                f"Handler {callback.__name__} for event {event.event_type.value} "
+                f"exceeded 1.0s timeout"
+            )
+        except Exception as e:
+            # Log error but don't break other subscribers
+            logger.error(
+                f"Error in event subscriber {callback.__name__} "
+                f"for {event.event_type.value}: {e}"
+            )
+
+    async def _invoke_inline(self, callback: Callable[[Event], Any], is_async: bool, event: Event) -> None:
+        """Run one handler directly on the current coroutine, logging instead of raising."""
+        try:
+            if is_async:
+                await callback(event)
+            else:
+                callback(event)
+        except Exception as e:
+            logger.error(
+                f"Error in event subscriber {callback.__name__} "
+                f"for {event.event_type.value}: {e}"
+            )
 
     async def stop(self) -> None:
         """
@@ -512,7 +1028,8 @@ class EventBus:
         This method gracefully shuts down the event bus by:
         1. Setting the running flag to False
         2. Waiting for all queued events to be processed (with timeout)
-        3. Cancelling the processing task
+        3. Flushing events buffered for batch subscribers
+        4. Cancelling the processing task
 
         No events are lost during shutdown (unless timeout is reached).
 
@@ -533,6 +1050,8 @@ class EventBus:
         except asyncio.TimeoutError:
             logger.warning("Event queue did not drain within 5s timeout")
 
+        await self.flush_batches()
+
         # Cancel the processing task
         if self._task:
             self._task.cancel()
@@ -52,6 +52,10 @@ class EventProcessor(ABC):
         >>> await processor.stop()
     """
 
+    # Declared so subclasses that define their own __slots__ get instances
+    # without a per-instance __dict__.
+    __slots__ = ("event_bus", "_is_started")
+
     def __init__(self, event_bus: EventBus):
         """
         Initialize the processor with event bus dependency.
@@ -5,13 +5,54 @@ This module defines core trading entities for ICT (Inner Circle Trader) methodol
 - OrderBlock: Institutional order zones (support/resistance)
 - FVG: Fair Value Gaps (price inefficiencies)
 - Position: Active trading positions with risk parameters
+- Side: Integer encoding of position direction for hot-path comparisons
+- Direction: Integer encoding of pattern direction for hot-path comparisons
 """
 
+from enum import IntEnum
 from pydantic import BaseModel, Field, model_validator
 from typing import Literal
 from datetime import datetime
 
 
+class Side(IntEnum):
+    """
+    Integer-encoded position direction.
+
+    Used on hot paths in place of the "long"/"short" strings so direction
+    checks are a single int compare. The integer values also allow
+    branchless sign arithmetic: ``1 - 2 * side`` is +1 for LONG, -1 for SHORT.
+
+    Examples:
+        >>> Side.LONG
+        <Side.LONG: 0>
+        >>> 1 - 2 * Side.SHORT
+        -1
+    """
+
+    LONG = 0
+    SHORT = 1
+
+
+class Direction(IntEnum):
+    """
+    Integer-encoded pattern direction.
+
+    Used on hot paths in place of the "bullish"/"bearish" strings so
+    direction checks are a single int compare and per-direction state can
+    be indexed by the value directly.
+
+    Examples:
+        >>> Direction.BULLISH
+        <Direction.BULLISH: 0>
+        >>> ("long", "short")[Direction.BEARISH]
+        'short'
+    """
+
+    BULLISH = 0
+    BEARISH = 1
+
+
 class OrderBlock(BaseModel):
     """
     Immutable Order Block representation.
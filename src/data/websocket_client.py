@@ -617,8 +617,9 @@ class BinanceWebSocket:
                 await self.event_bus.publish(event)
 
                 logger.debug(
-                    f"Candle closed for {self.symbol} ({self.interval}): "
-                    f"O={open_price} H={high_price} L={low_price} C={close_price} V={volume}"
+                    "Candle closed for {} ({}): O={} H={} L={} C={} V={}",
+                    self.symbol, self.interval,
+                    open_price, high_price, low_price, close_price, volume
                 )
 
         except Exception as e:
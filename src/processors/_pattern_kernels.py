@@ -0,0 +1,80 @@
+"""
+Numeric kernels for ICT pattern detection.
+
+Pure scalar functions holding the arithmetic of Order Block and Fair Value
+Gap detection. They take and return only floats and bools, so callers in
+PatternProcessor keep model construction, logging and publishing while the
+hot arithmetic stays free of dict lookups and object allocation.
+"""
+
+from typing import Tuple
+
+
+def _ob_kernel(
+    open_price: float,
+    high: float,
+    low: float,
+    close: float,
+    min_ratio: float
+) -> Tuple[bool, bool, float, float, float]:
+    """
+    Evaluate a single candle as an Order Block.
+
+    Args:
+        open_price (float): Candle open
+        high (float): Candle high
+        low (float): Candle low
+        close (float): Candle close
+        min_ratio (float): Minimum body-to-range ratio
+
+    Returns:
+        Tuple: (is_ob, is_bullish, top, bottom, body_ratio)
+    """
+    total_range = high - low
+
+    # Skip zero-range candles (doji, etc.)
+    if total_range == 0:
+        return False, False, high, low, 0.0
+
+    body_ratio = abs(close - open_price) / total_range
+    return body_ratio >= min_ratio, close > open_price, high, low, body_ratio
+
+
+def _fvg_kernel(
+    high_0: float,
+    low_0: float,
+    high_2: float,
+    low_2: float,
+    min_gap_percent: float
+) -> Tuple[bool, bool, float, float, float]:
+    """
+    Evaluate the outer candles of a 3-candle window as a Fair Value Gap.
+
+    Bullish FVG: candle[0].high < candle[2].low
+    Bearish FVG: candle[0].low > candle[2].high
+
+    Args:
+        high_0 (float): Oldest candle high
+        low_0 (float): Oldest candle low
+        high_2 (float): Most recent candle high
+        low_2 (float): Most recent candle low
+        min_gap_percent (float): Minimum gap size as % of price
+
+    Returns:
+        Tuple: (is_fvg, is_bullish, top, bottom, gap_percent)
+    """
+    if high_0 < low_2:
+        is_bullish = True
+        top = low_2
+        bottom = high_0
+    elif low_0 > high_2:
+        is_bullish = False
+        top = low_0
+        bottom = high_2
+    else:
+        # No gap detected
+        return False, False, 0.0, 0.0, 0.0
+
+    # Gap percentage relative to the gap midpoint price
+    gap_percent = (top - bottom) / ((top + bottom) / 2) * 100
+    return gap_percent >= min_gap_percent, is_bullish, top, bottom, gap_percent
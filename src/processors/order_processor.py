@@ -9,16 +9,93 @@ This module implements order lifecycle management:
 
 The processor subscribes to ENTRY_SIGNAL events and manages the complete
 order lifecycle, emitting ORDER_PLACED, ORDER_FILLED, and POSITION_CLOSED
-events as orders progress through their lifecycle.
+events as orders progress through their lifecycle. In simulation mode the
+placement and fill are published together as ORDER_PLACED_FILLED.
 """
 
-from typing import Dict, Any, Optional
+import sys
+from itertools import compress, count, islice
+from typing import Dict, Any, List, Optional, Sequence, Union
 from datetime import datetime
+from time import time_ns
 from loguru import logger
 
 from ..core.event_processor import EventProcessor
 from ..core.event_bus import EventBus, Event, EventType
-from ..core.models import Position
+from ..core.models import Position, Side
+
+# Hot-path aliases: bound once at import to skip global/attribute lookups
+# on every published event.
+_EVT_PLACED = EventType.ORDER_PLACED
+_EVT_FILLED = EventType.ORDER_FILLED
+_EVT_PLACED_FILLED = EventType.ORDER_PLACED_FILLED
+_EVT_CLOSED = EventType.POSITION_CLOSED
+_EVT_BACKTEST = EventType.BACKTEST_COMPLETED
+_EVT_ERROR = EventType.ERROR
+
+# Interned event source shared by every published event
+_SRC = sys.intern("OrderProcessor")
+
+_ORDER_ID_PREFIX = "order_"
+
+
+def _format_order_id(order_seq: int) -> str:
+    """Render an integer order sequence number as its public "order_N" ID."""
+    return f"{_ORDER_ID_PREFIX}{order_seq}"
+
+
+# Signal directions mapped to Side once, so later checks are int compares
+_SIDE_BY_DIRECTION = {"long": Side.LONG, "short": Side.SHORT}
+
+
+def _validate_prices(
+    side: Side,
+    entry: float,
+    stop_loss: float,
+    take_profit: float
+) -> bool:
+    """
+    Check numeric signal constraints for a position side.
+
+    Prices must be positive, and stop loss / take profit must sit on the
+    correct sides of the entry price (SL < entry < TP for longs,
+    TP < entry < SL for shorts).
+
+    Args:
+        side (Side): Side.LONG or Side.SHORT
+        entry (float): Entry price
+        stop_loss (float): Stop loss price
+        take_profit (float): Take profit price
+
+    Returns:
+        bool: True if all constraints hold
+    """
+    if entry <= 0 or stop_loss <= 0 or take_profit <= 0:
+        return False
+    if side == Side.LONG:
+        return stop_loss < entry < take_profit
+    return take_profit < entry < stop_loss
+
+
+def _validate_prices_batch(
+    sides: Sequence[Side],
+    entries: Sequence[float],
+    stop_losses: Sequence[float],
+    take_profits: Sequence[float]
+) -> List[bool]:
+    """
+    Validate many signals at once from column-oriented inputs.
+
+    Intended for backtest replays where signals are known up front and
+    kept as parallel columns rather than one dict per signal.
+
+    Returns:
+        List[bool]: Validation result per signal, in input order
+    """
+    return [
+        _validate_prices(d, e, sl, tp)
+        for d, e, sl, tp in zip(sides, entries, stop_losses, take_profits)
+    ]
 
 
 class OrderProcessor(EventProcessor):
@@ -37,11 +114,18 @@ class OrderProcessor(EventProcessor):
     For MVP, orders are immediately filled at the requested price.
     Future versions will integrate with real exchange APIs.
 
+    Payload timestamps on emitted events are integer nanoseconds since the
+    Unix epoch (``time.time_ns()``); only the Position model holds a datetime.
+
     Configuration:
         symbol (str): Trading symbol (default: "BTCUSDT")
         max_position_size (float): Maximum position size (default: 0.1)
+        commission_rate (float): Simulated commission per unit size (default: 0.001)
         enable_simulation (bool): Use simulated fills (default: True)
         auto_close_positions (bool): Auto-close for testing (default: False)
+        emit_legacy_fill_events (bool): In simulation, publish separate
+            ORDER_PLACED and ORDER_FILLED events instead of a single
+            ORDER_PLACED_FILLED (default: False)
 
     Examples:
         >>> bus = EventBus()
@@ -52,6 +136,22 @@ class OrderProcessor(EventProcessor):
         >>> await processor.stop()
     """
 
+    __slots__ = (
+        "_config",
+        "_positions",
+        "_order_id_iter",
+        "_orders_placed",
+        "_orders_filled",
+        "_positions_closed",
+        "_symbol",
+        "_max_position_size",
+        "_enable_simulation",
+        "_auto_close",
+        "_emit_legacy_fill_events",
+        "_commission_rate",
+        "_fixed_commission",
+    )
+
     def __init__(
         self,
         event_bus: EventBus,
@@ -70,40 +170,78 @@ class OrderProcessor(EventProcessor):
         default_config = {
             "symbol": "BTCUSDT",
             "max_position_size": 0.1,  # BTC
+            "commission_rate": 0.001,  # 0.1% commission
             "enable_simulation": True,
             "auto_close_positions": False,  # For testing
+            "emit_legacy_fill_events": False,
         }
 
         # Merge with user config
         self._config = {**default_config, **(config or {})}
 
         # State initialization
-        self._positions: Optional[Dict[str, Position]] = None
-        self._order_id_counter: int = 0
+        self._positions: Dict[int, Position] = {}
+        self._order_id_iter = count(1)
         self._orders_placed: int = 0
         self._orders_filled: int = 0
         self._positions_closed: int = 0
 
+        # Hot-path configuration cache (refreshed in _on_start)
+        self._symbol: str = self._config["symbol"]
+        self._max_position_size: float = self._config["max_position_size"]
+        self._enable_simulation: bool = self._config["enable_simulation"]
+        self._auto_close: bool = self._config["auto_close_positions"]
+        self._emit_legacy_fill_events: bool = self._config["emit_legacy_fill_events"]
+        self._commission_rate: float = self._config["commission_rate"]
+        # Computed in _on_start; None marks a processor that was never started
+        self._fixed_commission: Optional[float] = None
+
     async def _on_start(self) -> None:
         """Initialize processor state on startup."""
-        self._positions = {}
-        self._order_id_counter = 0
-        self._orders_placed = 0
-        self._orders_filled = 0
-        self._positions_closed = 0
+        self._symbol = self._config["symbol"]
+        self._enable_simulation = self._config["enable_simulation"]
+        self._auto_close = self._config["auto_close_positions"]
+        self._emit_legacy_fill_events = self._config["emit_legacy_fill_events"]
+
+        # Position size is fixed in MVP, so the commission for a full-size
+        # fill is computed once here instead of on every fill.
+        self._max_position_size = self._config["max_position_size"]
+        self._commission_rate = self._config["commission_rate"]
+        self._fixed_commission = self._max_position_size * self._commission_rate
+
+        self.reset()
         logger.info("OrderProcessor state initialized")
 
     async def _on_stop(self) -> None:
         """Cleanup processor state on shutdown."""
+        # Log any open positions
         if self._positions:
-            # Log any open positions
-            if len(self._positions) > 0:
-                logger.warning(
-                    f"Shutting down with {len(self._positions)} open position(s)"
-                )
+            logger.warning(
+                "Shutting down with {} open position(s)", len(self._positions)
+            )
             self._positions.clear()
         logger.info("OrderProcessor state cleaned up")
 
+    def reset(self) -> None:
+        """
+        Drop open positions and restart order ids and counters.
+
+        Configuration and event subscriptions are left as they are. Like the
+        other processors' reset(), this requires start() to have run once.
+
+        Raises:
+            RuntimeError: If the processor state has not been initialized
+                (start() was never called)
+        """
+        if self._fixed_commission is None:
+            raise RuntimeError("OrderProcessor not started. Call start() first.")
+
+        self._positions.clear()
+        self._order_id_iter = count(1)
+        self._orders_placed = 0
+        self._orders_filled = 0
+        self._positions_closed = 0
+
     def _register_handlers(self) -> None:
         """Register handler for ENTRY_SIGNAL events."""
         self.event_bus.subscribe(EventType.ENTRY_SIGNAL, self._on_entry_signal)
@@ -122,10 +260,13 @@ class OrderProcessor(EventProcessor):
         1. Validate signal data
         2. Check position sizing limits
         3. Place order (simulated)
-        4. Emit ORDER_PLACED event
-        5. Simulate fill (MVP only)
-        6. Emit ORDER_FILLED event
-        7. Create and track Position
+        4. Simulate fill (MVP only)
+        5. Emit ORDER_PLACED_FILLED (or ORDER_PLACED when not simulating)
+        6. Create and track Position
+
+        This is the single error boundary for the order path: helpers below
+        run without their own try/except, so any failure is logged here and
+        reported as an ERROR event.
 
         Args:
             event (Event): ENTRY_SIGNAL event with signal data
@@ -133,31 +274,28 @@ class OrderProcessor(EventProcessor):
         try:
             signal = event.data
 
-            # Validate signal data
-            if not self._validate_signal(signal):
-                logger.warning(f"Invalid signal received: {signal}")
+            # Validate signal data (direction is decoded to Side once here)
+            side = self._validate_signal(signal)
+            if side is None:
+                logger.warning("Invalid signal received: {}", signal)
                 return
 
-            # Generate order ID
-            order_id = self._generate_order_id()
+            # Generate order sequence number (string ID built only for events)
+            order_seq = self._generate_order_id()
 
             # Place order
-            order = await self._place_order(order_id, signal)
-            if not order:
-                return
-
-            # Emit ORDER_PLACED event
-            await self._publish_order_placed(order)
+            order = await self._place_order(order_seq, signal)
 
-            # Simulate order fill (MVP)
-            if self._config["enable_simulation"]:
-                await self._simulate_fill(order)
+            if self._enable_simulation:
+                # Simulate order fill (MVP); placement is published with it
+                await self._fill_and_track(order, order_seq, side)
+            else:
+                await self._publish_order_placed(order)
 
         except Exception as e:
-            logger.error(f"Error handling ENTRY_SIGNAL: {e}")
             await self._publish_error(e, "entry_signal_processing")
 
-    def _validate_signal(self, signal: Dict[str, Any]) -> bool:
+    def _validate_signal(self, signal: Dict[str, Any]) -> Optional[Side]:
         """
         Validate signal data structure and values.
 
@@ -165,7 +303,7 @@ class OrderProcessor(EventProcessor):
             signal (Dict): Signal data from event
 
         Returns:
-            bool: True if valid, False otherwise
+            Side or None: Decoded signal direction if valid, None otherwise
         """
         required_fields = [
             "direction", "entry_price", "stop_loss",
@@ -175,54 +313,48 @@ class OrderProcessor(EventProcessor):
         # Check required fields
         for field in required_fields:
             if field not in signal:
-                logger.warning(f"Missing required signal field: {field}")
-                return False
+                logger.warning("Missing required signal field: {}", field)
+                return None
 
         # Validate direction
-        if signal["direction"] not in ["long", "short"]:
-            logger.warning(f"Invalid direction: {signal['direction']}")
-            return False
-
-        # Validate prices are positive
-        price_fields = ["entry_price", "stop_loss", "take_profit"]
-        for field in price_fields:
-            if signal[field] <= 0:
-                logger.warning(f"Invalid {field}: {signal[field]}")
-                return False
-
-        # Validate risk-reward logic
-        if signal["direction"] == "long":
-            if signal["stop_loss"] >= signal["entry_price"]:
-                logger.warning("Long signal: stop_loss must be < entry_price")
-                return False
-            if signal["take_profit"] <= signal["entry_price"]:
-                logger.warning("Long signal: take_profit must be > entry_price")
-                return False
-        else:  # short
-            if signal["stop_loss"] <= signal["entry_price"]:
-                logger.warning("Short signal: stop_loss must be > entry_price")
-                return False
-            if signal["take_profit"] >= signal["entry_price"]:
-                logger.warning("Short signal: take_profit must be < entry_price")
-                return False
-
-        return True
-
-    def _generate_order_id(self) -> str:
+        side = _SIDE_BY_DIRECTION.get(signal["direction"])
+        if side is None:
+            logger.warning("Invalid direction: {}", signal["direction"])
+            return None
+
+        # Validate prices are positive and SL/TP sit on the correct sides
+        if not _validate_prices(
+            side,
+            signal["entry_price"],
+            signal["stop_loss"],
+            signal["take_profit"]
+        ):
+            logger.warning(
+                "Invalid {} signal prices: entry={}, stop_loss={}, take_profit={}",
+                signal["direction"], signal["entry_price"],
+                signal["stop_loss"], signal["take_profit"]
+            )
+            return None
+
+        return side
+
+    def _generate_order_id(self) -> int:
         """
-        Generate unique order ID.
+        Generate unique order sequence number.
+
+        Positions are keyed by this integer; the public "order_N" string
+        form is only rendered where IDs leave the processor (events, logs).
 
         Returns:
-            str: Order ID in format "order_N"
+            int: Monotonically increasing order sequence number
         """
-        self._order_id_counter += 1
-        return f"order_{self._order_id_counter}"
+        return next(self._order_id_iter)
 
     async def _place_order(
         self,
-        order_id: str,
+        order_seq: int,
         signal: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Dict[str, Any]:
         """
         Place an order based on signal.
 
@@ -230,265 +362,347 @@ class OrderProcessor(EventProcessor):
         real exchange APIs (Binance, etc.).
 
         Args:
-            order_id (str): Unique order identifier
+            order_seq (int): Unique order sequence number
             signal (Dict): Signal data
 
         Returns:
-            Dict or None: Order data if successful
+            Dict: Order data
         """
-        try:
-            # Calculate position size (simplified)
-            position_size = self._config["max_position_size"]
-
-            # Build order data
-            order = {
-                "order_id": order_id,
-                "symbol": self._config["symbol"],
-                "side": signal["direction"],
-                "type": "MARKET",  # Simplified for MVP
-                "entry_price": signal["entry_price"],
-                "size": position_size,
-                "stop_loss": signal["stop_loss"],
-                "take_profit": signal["take_profit"],
-                "status": "PLACED",
-                "timestamp": datetime.utcnow(),
-                "signal_confidence": signal.get("confidence", 0),
-                "signal_reason": signal.get("reason", "")
-            }
-
-            self._orders_placed += 1
-
-            logger.info(
-                f"Placed {order['side']} order {order_id}: "
-                f"{order['size']} {order['symbol']} @ {order['entry_price']:.2f}"
-            )
+        order_id = _format_order_id(order_seq)
+
+        # Calculate position size (simplified)
+        position_size = self._max_position_size
+
+        # Build order data
+        order = {
+            "order_id": order_id,
+            "symbol": self._symbol,
+            "side": signal["direction"],
+            "type": "MARKET",  # Simplified for MVP
+            "entry_price": signal["entry_price"],
+            "size": position_size,
+            "stop_loss": signal["stop_loss"],
+            "take_profit": signal["take_profit"],
+            "status": "PLACED",
+            "timestamp": time_ns(),
+            "signal_confidence": signal.get("confidence", 0),
+            "signal_reason": signal.get("reason", "")
+        }
 
-            return order
+        self._orders_placed += 1
 
-        except Exception as e:
-            logger.error(f"Failed to place order: {e}")
-            return None
+        logger.info(
+            "Placed {} order {}: {} {} @ {:.2f}",
+            order["side"], order_id, position_size, self._symbol,
+            order["entry_price"]
+        )
+
+        return order
 
     async def _publish_order_placed(self, order: Dict[str, Any]) -> None:
         """
         Publish ORDER_PLACED event to queue.
 
+        Skipped when nothing subscribes to ORDER_PLACED.
+
         Args:
             order (Dict): Order data
         """
-        try:
-            event = Event(
-                event_type=EventType.ORDER_PLACED,
-                data=order,
-                source="OrderProcessor"
-            )
+        if not self.event_bus.has_subscribers(_EVT_PLACED):
+            return
 
-            await self.event_bus.publish(event)
-            logger.debug(f"ORDER_PLACED event published for {order['order_id']}")
+        event = Event(
+            event_type=_EVT_PLACED,
+            data=order,
+            source=_SRC
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to publish ORDER_PLACED: {e}")
+        await self.event_bus.publish(event)
+        logger.debug("ORDER_PLACED event published for {}", order["order_id"])
 
-    async def _simulate_fill(self, order: Dict[str, Any]) -> None:
+    async def _publish_order_placed_filled(
+        self,
+        order: Dict[str, Any],
+        fill_data: Dict[str, Any]
+    ) -> None:
         """
-        Simulate immediate order fill (MVP only).
+        Publish combined ORDER_PLACED_FILLED event to queue.
 
-        In production, this would listen for exchange fill notifications.
-        For MVP, we immediately fill at the requested price.
+        Skipped when nothing subscribes to ORDER_PLACED_FILLED.
 
         Args:
             order (Dict): Order data
-        """
-        try:
-            # Simulate fill
-            fill_data = {
-                "order_id": order["order_id"],
-                "symbol": order["symbol"],
-                "side": order["side"],
-                "fill_price": order["entry_price"],
-                "filled_size": order["size"],
-                "commission": order["size"] * 0.001,  # 0.1% commission
-                "timestamp": datetime.utcnow()
-            }
-
-            self._orders_filled += 1
-
-            logger.info(
-                f"Simulated fill for {order['order_id']}: "
-                f"{fill_data['filled_size']} @ {fill_data['fill_price']:.2f}"
-            )
-
-            # Emit ORDER_FILLED event
-            await self._publish_order_filled(fill_data)
-
-            # Create position
-            await self._create_position(order, fill_data)
-
-        except Exception as e:
-            logger.error(f"Failed to simulate fill: {e}")
-
-    async def _publish_order_filled(self, fill_data: Dict[str, Any]) -> None:
-        """
-        Publish ORDER_FILLED event to queue.
-
-        Args:
             fill_data (Dict): Fill data
         """
-        try:
-            event = Event(
-                event_type=EventType.ORDER_FILLED,
-                data=fill_data,
-                source="OrderProcessor"
-            )
-
-            await self.event_bus.publish(event)
-            logger.debug(f"ORDER_FILLED event published for {fill_data['order_id']}")
-
-        except Exception as e:
-            logger.error(f"Failed to publish ORDER_FILLED: {e}")
-
-    async def _create_position(
+        if not self.event_bus.has_subscribers(_EVT_PLACED_FILLED):
+            return
+
+        event = Event(
+            event_type=_EVT_PLACED_FILLED,
+            data={
+                **order,
+                "status": "FILLED",
+                "fill_price": fill_data["fill_price"],
+                "filled_size": fill_data["filled_size"],
+                "commission": fill_data["commission"],
+            },
+            source=_SRC
+        )
+
+        await self.event_bus.publish(event)
+        logger.debug(
+            "ORDER_PLACED_FILLED event published for {}", order["order_id"]
+        )
+
+    async def _fill_and_track(
         self,
         order: Dict[str, Any],
-        fill_data: Dict[str, Any]
+        order_seq: int,
+        side: Side
     ) -> None:
         """
-        Create Position model from order and fill data.
+        Simulate immediate order fill and start tracking the position (MVP only).
+
+        Fill simulation, fill publication and Position creation are fused
+        into one coroutine so the fill price and timestamp are computed once
+        and shared by the event payload and the Position model. Placement and
+        fill go out as one ORDER_PLACED_FILLED event unless
+        emit_legacy_fill_events is set.
+
+        In production, this would listen for exchange fill notifications.
+        For MVP, we immediately fill at the requested price.
 
         Args:
             order (Dict): Order data
-            fill_data (Dict): Fill data
+            order_seq (int): Order sequence number used as the position key
+            side (Side): Decoded order direction
         """
-        try:
-            # Create Position model
-            position = Position(
-                symbol=order["symbol"],
-                side=order["side"],
-                entry_price=fill_data["fill_price"],
-                size=fill_data["filled_size"],
-                stop_loss=order["stop_loss"],
-                take_profit=order["take_profit"],
-                timestamp=fill_data["timestamp"]
-            )
-
-            # Store position
-            self._positions[order["order_id"]] = position
-
-            # Calculate risk-reward
-            rr_ratio = position.risk_reward_ratio()
+        order_id = order["order_id"]
+        fill_price = order["entry_price"]
+        size = order["size"]
+        timestamp = time_ns()
+        if size == self._max_position_size:
+            commission = self._fixed_commission
+        else:
+            commission = size * self._commission_rate
+
+        fill_data = {
+            "order_id": order_id,
+            "symbol": order["symbol"],
+            "side": order["side"],
+            "fill_price": fill_price,
+            "filled_size": size,
+            "commission": commission,
+            "timestamp": timestamp
+        }
 
-            logger.info(
-                f"Created position {order['order_id']}: "
-                f"{position.side} {position.size} {position.symbol} @ "
-                f"{position.entry_price:.2f} (R:R {rr_ratio:.2f})"
-            )
+        self._orders_filled += 1
 
-            # Auto-close if enabled (for testing)
-            if self._config["auto_close_positions"]:
-                await self._close_position(order["order_id"], position, "AUTO_CLOSE")
+        logger.info("Simulated fill for {}: {} @ {:.2f}", order_id, size, fill_price)
 
-        except Exception as e:
-            logger.error(f"Failed to create position: {e}")
+        if self._emit_legacy_fill_events:
+            await self._publish_order_placed(order)
+            if self.event_bus.has_subscribers(_EVT_FILLED):
+                await self.event_bus.publish(
+                    Event(event_type=_EVT_FILLED, data=fill_data, source=_SRC)
+                )
+                logger.debug("ORDER_FILLED event published for {}", order_id)
+        else:
+            await self._publish_order_placed_filled(order, fill_data)
+
+        # Create and store position
+        position = Position(
+            symbol=order["symbol"],
+            side=order["side"],
+            entry_price=fill_price,
+            size=size,
+            stop_loss=order["stop_loss"],
+            take_profit=order["take_profit"],
+            timestamp=datetime.utcfromtimestamp(timestamp / 1e9)
+        )
+        self._positions[order_seq] = position
+
+        # R:R is only computed when INFO is actually emitted
+        logger.opt(lazy=True).info(
+            "Created position {}: {} {} {} @ {:.2f} (R:R {:.2f})",
+            lambda: order_id,
+            lambda: position.side,
+            lambda: size,
+            lambda: position.symbol,
+            lambda: fill_price,
+            position.risk_reward_ratio,
+        )
+
+        # Auto-close if enabled (for testing)
+        if self._auto_close:
+            await self._close_position(order_seq, position, side, "AUTO_CLOSE")
 
     async def _close_position(
         self,
-        order_id: str,
+        order_seq: int,
         position: Position,
+        side: Side,
         reason: str
     ) -> None:
         """
         Close a position and emit POSITION_CLOSED event.
 
         Args:
-            order_id (str): Order identifier
+            order_seq (int): Order sequence number
             position (Position): Position to close
+            side (Side): Position direction
             reason (str): Close reason
         """
-        try:
-            # Calculate P&L (simplified - assumes take profit hit)
-            if position.side == "long":
-                exit_price = position.take_profit
-                pnl = (exit_price - position.entry_price) * position.size
-            else:  # short
-                exit_price = position.take_profit
-                pnl = (position.entry_price - exit_price) * position.size
-
-            # Build close data
-            close_data = {
-                "order_id": order_id,
-                "symbol": position.symbol,
-                "side": position.side,
-                "entry_price": position.entry_price,
-                "exit_price": exit_price,
-                "size": position.size,
-                "realized_pnl": pnl,
-                "close_reason": reason,
-                "timestamp": datetime.utcnow()
-            }
-
-            # Remove from active positions
-            if order_id in self._positions:
-                del self._positions[order_id]
-
-            self._positions_closed += 1
-
-            logger.info(
-                f"Closed position {order_id}: "
-                f"P&L=${pnl:.2f}, Reason={reason}"
-            )
+        order_id = _format_order_id(order_seq)
+
+        # Calculate P&L (simplified - assumes take profit hit);
+        # sign is +1 for longs and -1 for shorts
+        exit_price = position.take_profit
+        pnl = (1 - 2 * side) * (exit_price - position.entry_price) * position.size
+
+        # Build close data
+        close_data = {
+            "order_id": order_id,
+            "symbol": position.symbol,
+            "side": position.side,
+            "entry_price": position.entry_price,
+            "exit_price": exit_price,
+            "size": position.size,
+            "realized_pnl": pnl,
+            "close_reason": reason,
+            "timestamp": time_ns()
+        }
 
-            # Emit POSITION_CLOSED event
-            await self._publish_position_closed(close_data)
+        # Remove from active positions
+        self._positions.pop(order_seq, None)
 
-        except Exception as e:
-            logger.error(f"Failed to close position: {e}")
+        self._positions_closed += 1
+
+        logger.info("Closed position {}: P&L=${:.2f}, Reason={}", order_id, pnl, reason)
+
+        # Emit POSITION_CLOSED event
+        await self._publish_position_closed(close_data)
 
     async def _publish_position_closed(self, close_data: Dict[str, Any]) -> None:
         """
         Publish POSITION_CLOSED event to queue.
 
+        Skipped when nothing subscribes to POSITION_CLOSED.
+
         Args:
             close_data (Dict): Position close data
         """
-        try:
-            event = Event(
-                event_type=EventType.POSITION_CLOSED,
-                data=close_data,
-                source="OrderProcessor"
-            )
+        if not self.event_bus.has_subscribers(_EVT_CLOSED):
+            return
 
-            await self.event_bus.publish(event)
-            logger.debug(f"POSITION_CLOSED event published for {close_data['order_id']}")
+        event = Event(
+            event_type=_EVT_CLOSED,
+            data=close_data,
+            source=_SRC
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to publish POSITION_CLOSED: {e}")
+        await self.event_bus.publish(event)
+        logger.debug(
+            "POSITION_CLOSED event published for {}", close_data["order_id"]
+        )
 
-    async def _publish_error(self, error: Exception, context: str) -> None:
+    async def process_signals_batch(
+        self,
+        sides: Sequence[Side],
+        entries: Sequence[float],
+        stop_losses: Sequence[float],
+        take_profits: Sequence[float]
+    ) -> Dict[str, Any]:
         """
-        Publish ERROR event to queue for system errors.
+        Replay a batch of historical entry signals (backtesting only).
+
+        Signals are passed as parallel columns and processed in one pass
+        instead of one ENTRY_SIGNAL round-trip each. Every valid signal is
+        filled at its entry price with max_position_size and closed at its
+        take profit, matching the auto-close simplification. Results are
+        kept column-oriented, nothing is added to the live position map,
+        and a single BACKTEST_COMPLETED event is published.
 
         Args:
-            error (Exception): The error that occurred
-            context (str): Context where error occurred
+            sides (Sequence[Side]): Signal directions
+            entries (Sequence[float]): Entry prices
+            stop_losses (Sequence[float]): Stop loss prices
+            take_profits (Sequence[float]): Take profit prices
+
+        Returns:
+            Dict: BACKTEST_COMPLETED payload with per-order columns
         """
-        try:
-            event = Event(
-                event_type=EventType.ERROR,
-                data={
-                    "error_type": type(error).__name__,
-                    "error_message": str(error),
-                    "component": "OrderProcessor",
-                    "context": context,
-                    "timestamp": datetime.utcnow()
-                },
-                source="OrderProcessor"
+        valid = _validate_prices_batch(sides, entries, stop_losses, take_profits)
+        order_sides = list(compress(sides, valid))
+        order_entries = list(compress(entries, valid))
+        order_stops = list(compress(stop_losses, valid))
+        order_targets = list(compress(take_profits, valid))
+        n_orders = len(order_sides)
+
+        size = self._max_position_size
+        pnls = [
+            (1 - 2 * side) * (tp - entry) * size
+            for side, entry, tp in zip(order_sides, order_entries, order_targets)
+        ]
+
+        order_seqs = islice(self._order_id_iter, n_orders)
+        self._orders_placed += n_orders
+        self._orders_filled += n_orders
+        self._positions_closed += n_orders
+
+        result = {
+            "symbol": self._symbol,
+            "signals": len(valid),
+            "orders": n_orders,
+            "order_ids": [_format_order_id(seq) for seq in order_seqs],
+            "sides": order_sides,
+            "entry_price": order_entries,
+            "stop_loss": order_stops,
+            "take_profit": order_targets,
+            "realized_pnl": pnls,
+            "size": size,
+            "commission": size * self._commission_rate,
+            "total_pnl": sum(pnls),
+            "timestamp": time_ns()
+        }
+
+        logger.info(
+            "Backtest replayed {} of {} signal(s): P&L=${:.2f}",
+            n_orders, len(valid), result["total_pnl"]
+        )
+
+        if self.event_bus.has_subscribers(_EVT_BACKTEST):
+            await self.event_bus.publish(
+                Event(event_type=_EVT_BACKTEST, data=result, source=_SRC)
             )
 
-            await self.event_bus.publish(event)
-            logger.debug(f"ERROR event published: {context}")
+        return result
 
-        except Exception as e:
-            logger.error(f"Failed to publish ERROR event: {e}")
+    async def _publish_error(self, error: Exception, context: str) -> None:
+        """
+        Log an error with its traceback and publish an ERROR event.
+
+        Cold path: must be called from within an ``except`` block so the
+        active traceback is logged. A failure to publish propagates to the
+        caller instead of being swallowed here.
+
+        Args:
+            error (Exception): The error that occurred
+            context (str): Context where error occurred
+        """
+        logger.opt(depth=1).exception("Error in {}: {}", context, error)
+
+        await self.event_bus.publish(Event(
+            event_type=_EVT_ERROR,
+            data={
+                "error_type": type(error).__name__,
+                "error_message": str(error),
+                "component": _SRC,
+                "context": context,
+                "timestamp": time_ns()
+            },
+            source=_SRC
+        ))
 
     @property
     def orders_placed_count(self) -> int:
@@ -508,16 +722,24 @@ class OrderProcessor(EventProcessor):
     @property
     def open_positions_count(self) -> int:
         """Get number of currently open positions."""
-        return len(self._positions) if self._positions else 0
+        return len(self._positions)
 
-    def get_position(self, order_id: str) -> Optional[Position]:
+    def get_position(self, order_id: Union[str, int]) -> Optional[Position]:
         """
         Get position by order ID.
 
         Args:
-            order_id (str): Order identifier
+            order_id (str | int): Order identifier ("order_N") or its
+                integer sequence number N
 
         Returns:
             Position or None: Position if exists
         """
-        return self._positions.get(order_id) if self._positions else None
+        if isinstance(order_id, str):
+            if not order_id.startswith(_ORDER_ID_PREFIX):
+                return None
+            try:
+                order_id = int(order_id[len(_ORDER_ID_PREFIX):])
+            except ValueError:
+                return None
+        return self._positions.get(order_id)
@@ -10,14 +10,33 @@ to identify these key patterns, emitting ORDER_BLOCK_DETECTED and FVG_DETECTED
 events when patterns are found.
 """
 
-from typing import Dict, Any, List, Optional
-from collections import deque
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from datetime import datetime
 from loguru import logger
 
 from ..core.event_processor import EventProcessor
 from ..core.event_bus import EventBus, Event, EventType
 from ..core.models import OrderBlock, FVG
+from ._pattern_kernels import _ob_kernel, _fvg_kernel
+
+# Hot-path aliases: bound once at import to skip global/attribute lookups
+# on every candle and published event.
+_EVT_CANDLE = EventType.CANDLE_CLOSED
+_EVT_OB = EventType.ORDER_BLOCK_DETECTED
+_EVT_FVG = EventType.FVG_DETECTED
+
+# Interned event source shared by every published event
+_SRC = sys.intern("PatternProcessor")
+
+# Pattern type by kernel direction flag: False -> bearish, True -> bullish
+_PATTERN_TYPES = ("bearish", "bullish")
+
+# Fields every CANDLE_CLOSED payload must carry, in unpack order
+_REQUIRED_CANDLE_FIELDS = ("open", "high", "low", "close", "volume", "timestamp")
 
 
 class PatternProcessor(EventProcessor):
@@ -28,13 +47,16 @@ class PatternProcessor(EventProcessor):
     - Order Blocks: Strong institutional zones marked by large-bodied candles
     - FVGs: Price gaps created by rapid market movement
 
-    The processor maintains a sliding window of recent candles for analysis
-    and automatically cleans up old patterns to prevent memory leaks.
+    Order Blocks need only the current candle and FVGs only the high/low of
+    the candle two steps back, so instead of a candle history the processor
+    keeps the highs and lows of the previous two candles in rolling scalars.
+    Old patterns are cleaned up automatically to prevent memory leaks.
 
     Configuration:
         min_order_block_body_ratio (float): Minimum body-to-range ratio (default: 0.6)
         min_fvg_gap_percent (float): Minimum gap size as % of price (default: 0.3)
-        max_candle_history (int): Maximum candles to keep in memory (default: 100)
+        max_candle_history (int): Unused; kept for configuration
+            compatibility since no candle history is stored (default: 100)
         pattern_ttl_candles (int): Pattern validity lifetime in candles (default: 50)
 
     Examples:
@@ -71,7 +93,7 @@ class PatternProcessor(EventProcessor):
         default_config = {
             "min_order_block_body_ratio": 0.6,  # 60% body to range ratio
             "min_fvg_gap_percent": 0.3,  # 0.3% of price for meaningful gap
-            "max_candle_history": 100,  # Memory management
+            "max_candle_history": 100,  # Unused (no history is stored)
             "pattern_ttl_candles": 50,  # Pattern validity lifetime
         }
 
@@ -79,39 +101,79 @@ class PatternProcessor(EventProcessor):
         self._config = {**default_config, **(config or {})}
 
         # State initialization (actual objects created in _on_start)
-        self._candle_history: Optional[deque] = None
-        self._detected_order_blocks: Optional[List] = None
-        self._detected_fvgs: Optional[List] = None
+        # Rolling FVG window: highs/lows of the previous two candles
+        self._prev1_high: float = 0.0
+        self._prev1_low: float = 0.0
+        self._prev2_high: float = 0.0
+        self._prev2_low: float = 0.0
+        # Detected patterns: model list + parallel detection-candle column
+        self._ob_patterns: Optional[List[OrderBlock]] = None
+        self._ob_detected_at: Optional[array] = None
+        self._fvg_patterns: Optional[List[FVG]] = None
+        self._fvg_detected_at: Optional[array] = None
         self._candle_count: int = 0
 
+        # Hot-path configuration cache (refreshed in _on_start)
+        self._min_ob_ratio: float = float(self._config["min_order_block_body_ratio"])
+        self._min_fvg_pct: float = float(self._config["min_fvg_gap_percent"])
+        self._ttl: int = int(self._config["pattern_ttl_candles"])
+
     async def _on_start(self) -> None:
         """Initialize processor state on startup."""
-        self._candle_history = deque(
-            maxlen=self._config["max_candle_history"]
-        )
-        self._detected_order_blocks = []
-        self._detected_fvgs = []
+        self._min_ob_ratio = float(self._config["min_order_block_body_ratio"])
+        self._min_fvg_pct = float(self._config["min_fvg_gap_percent"])
+        self._ttl = int(self._config["pattern_ttl_candles"])
+
+        self._prev1_high = self._prev1_low = 0.0
+        self._prev2_high = self._prev2_low = 0.0
+        self._ob_patterns = []
+        self._ob_detected_at = array("q")
+        self._fvg_patterns = []
+        self._fvg_detected_at = array("q")
         self._candle_count = 0
         logger.info("PatternProcessor state initialized")
 
     async def _on_stop(self) -> None:
         """Cleanup processor state on shutdown."""
-        if self._candle_history:
-            self._candle_history.clear()
-        if self._detected_order_blocks:
-            self._detected_order_blocks.clear()
-        if self._detected_fvgs:
-            self._detected_fvgs.clear()
+        if self._ob_patterns:
+            self._ob_patterns.clear()
+            del self._ob_detected_at[:]
+        if self._fvg_patterns:
+            self._fvg_patterns.clear()
+            del self._fvg_detected_at[:]
         logger.info("PatternProcessor state cleaned up")
 
+    def reset(self) -> None:
+        """
+        Clear the candle window, detected patterns and counters in place.
+
+        Intended for backtest parameter sweeps: the pattern columns are
+        reused instead of rebuilding the processor. Configuration and event
+        subscriptions are left as they are.
+
+        Raises:
+            RuntimeError: If the processor state has not been initialized
+                (start() was never called)
+        """
+        if self._ob_patterns is None:
+            raise RuntimeError("PatternProcessor not started. Call start() first.")
+
+        self._prev1_high = self._prev1_low = 0.0
+        self._prev2_high = self._prev2_low = 0.0
+        self._candle_count = 0
+        self._ob_patterns.clear()
+        del self._ob_detected_at[:]
+        self._fvg_patterns.clear()
+        del self._fvg_detected_at[:]
+
     def _register_handlers(self) -> None:
         """Register handler for CANDLE_CLOSED events."""
-        self.event_bus.subscribe(EventType.CANDLE_CLOSED, self._on_candle_closed)
+        self.event_bus.subscribe(_EVT_CANDLE, self._on_candle_closed)
         logger.debug("PatternProcessor registered for CANDLE_CLOSED events")
 
     def _unregister_handlers(self) -> None:
         """Unregister handler from CANDLE_CLOSED events."""
-        self.event_bus.unsubscribe(EventType.CANDLE_CLOSED, self._on_candle_closed)
+        self.event_bus.unsubscribe(_EVT_CANDLE, self._on_candle_closed)
         logger.debug("PatternProcessor unregistered from CANDLE_CLOSED events")
 
     async def _on_candle_closed(self, event: Event) -> None:
@@ -120,7 +182,7 @@ class PatternProcessor(EventProcessor):
 
         Processing flow:
         1. Validate candle data
-        2. Add to history
+        2. Roll the 3-candle high/low window
         3. Detect Order Block from current candle
         4. Detect FVG from last 3 candles (if enough history)
         5. Emit pattern events
@@ -134,26 +196,42 @@ class PatternProcessor(EventProcessor):
 
             # Validate candle data structure
             if not self._validate_candle(candle_data):
-                logger.warning(f"Invalid candle data received: {candle_data}")
+                logger.warning("Invalid candle data received: {}", candle_data)
                 return
 
-            # Add to history
-            self._candle_history.append(candle_data)
+            open_price = candle_data["open"]
+            high = candle_data["high"]
+            low = candle_data["low"]
+            close = candle_data["close"]
+            timestamp = candle_data["timestamp"]
             self._candle_count += 1
 
-            logger.debug(
-                f"Processing candle {self._candle_count}: "
-                f"{candle_data.get('symbol')} @ {candle_data.get('close')}"
+            # Roll the window: t-2 is read out before t-1 and t shift in
+            high_0 = self._prev2_high
+            low_0 = self._prev2_low
+            self._prev2_high = self._prev1_high
+            self._prev2_low = self._prev1_low
+            self._prev1_high = high
+            self._prev1_low = low
+
+            # Lazy: the dict lookups only run when DEBUG is emitted
+            logger.opt(lazy=True).debug(
+                "Processing candle {}: {} @ {}",
+                lambda: self._candle_count,
+                lambda: candle_data.get("symbol"),
+                lambda: candle_data.get("close")
             )
 
             # Detect Order Block from current candle
-            order_block = self._detect_order_block(candle_data)
+            order_block = self._detect_order_block(
+                open_price, high, low, close, timestamp
+            )
             if order_block:
                 await self._publish_order_block(order_block)
 
             # Detect FVG (requires at least 3 candles)
-            if len(self._candle_history) >= 3:
-                fvg = self._detect_fvg()
+            if self._candle_count >= 3:
+                fvg = self._detect_fvg(high_0, low_0, high, low, timestamp)
                 if fvg:
                     await self._publish_fvg(fvg)
 
@@ -161,49 +239,48 @@ class PatternProcessor(EventProcessor):
             self._cleanup_old_patterns()
 
         except Exception as e:
-            logger.error(f"Error processing candle in PatternProcessor: {e}")
+            logger.error("Error processing candle in PatternProcessor: {}", e)
 
     def _validate_candle(self, candle_data: Dict[str, Any]) -> bool:
         """
         Validate candle data structure and values.
 
+        The common (valid) case is a single field unpack plus one combined
+        predicate; detailed reasons are only worked out for the warning on
+        the rare failure path.
+
         Args:
             candle_data (Dict): Candle data from event
 
         Returns:
             bool: True if valid, False otherwise
         """
-        required_fields = ["open", "high", "low", "close", "volume", "timestamp"]
-
-        # Check required fields exist
-        for field in required_fields:
-            if field not in candle_data:
-                logger.warning(f"Missing required field: {field}")
-                return False
-
-        # Validate price values are positive
-        price_fields = ["open", "high", "low", "close"]
-        for field in price_fields:
-            if candle_data[field] <= 0:
-                logger.warning(f"Invalid {field} price: {candle_data[field]}")
-                return False
-
-        # Validate high >= low
-        if candle_data["high"] < candle_data["low"]:
-            logger.warning(
-                f"Invalid price range: high {candle_data['high']} < "
-                f"low {candle_data['low']}"
+        try:
+            open_price, high, low, close, volume, _ = (
+                candle_data[field] for field in _REQUIRED_CANDLE_FIELDS
             )
+        except KeyError as e:
+            logger.warning("Missing required field: {}", e.args[0])
             return False
 
-        # Validate volume is non-negative
-        if candle_data["volume"] < 0:
-            logger.warning(f"Invalid volume: {candle_data['volume']}")
-            return False
+        # Positive prices (high >= low > 0 covers high), non-negative volume
+        if open_price > 0 and close > 0 and low > 0 and high >= low and volume >= 0:
+            return True
 
-        return True
+        logger.warning(
+            "Invalid candle values: open={}, high={}, low={}, close={}, volume={}",
+            open_price, high, low, close, volume
+        )
+        return False
 
-    def _detect_order_block(self, candle_data: Dict[str, Any]) -> Optional[OrderBlock]:
+    def _detect_order_block(
+        self,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        timestamp: datetime
+    ) -> Optional[OrderBlock]:
         """
         Detect Order Block from a single candle.
 
@@ -213,166 +290,190 @@ class PatternProcessor(EventProcessor):
         - Represent institutional order zones
 
         Args:
-            candle_data (Dict): Candle OHLC data
+            open_price (float): Candle open
+            high (float): Candle high
+            low (float): Candle low
+            close (float): Candle close
+            timestamp (datetime): Candle timestamp
 
         Returns:
             OrderBlock or None: Detected order block if found
         """
-        open_price = candle_data["open"]
-        high = candle_data["high"]
-        low = candle_data["low"]
-        close = candle_data["close"]
-        timestamp = candle_data["timestamp"]
-
-        # Calculate candle metrics
-        body_size = abs(close - open_price)
-        total_range = high - low
-
-        # Skip zero-range candles (doji, etc.)
-        if total_range == 0:
-            return None
-
-        # Calculate body ratio
-        body_ratio = body_size / total_range
-
-        # Check if strong candle (meets minimum body ratio)
-        min_ratio = self._config["min_order_block_body_ratio"]
-        if body_ratio < min_ratio:
+        is_ob, is_bullish, ob_top, ob_bottom, body_ratio = _ob_kernel(
+            open_price, high, low, close, self._min_ob_ratio
+        )
+        if not is_ob:
             return None
 
-        # Determine bullish or bearish
-        if close > open_price:
-            # Bullish order block
-            ob_type = "bullish"
-            ob_bottom = low
-            ob_top = high
-        else:
-            # Bearish order block
-            ob_type = "bearish"
-            ob_bottom = low
-            ob_top = high
-
-        # Create OrderBlock model
-        try:
-            order_block = OrderBlock(
-                type=ob_type,
-                top=ob_top,
-                bottom=ob_bottom,
-                timestamp=timestamp,
-                touches=0,
-                is_valid=True
-            )
+        ob_type = _PATTERN_TYPES[is_bullish]
+
+        # Create OrderBlock model (inputs are validated; failures propagate
+        # to the handler in _on_candle_closed)
+        order_block = OrderBlock(
+            type=ob_type,
+            top=ob_top,
+            bottom=ob_bottom,
+            timestamp=timestamp,
+            touches=0,
+            is_valid=True
+        )
 
-            logger.info(
-                f"Detected {ob_type} Order Block: "
-                f"{ob_bottom:.2f} - {ob_top:.2f} (body ratio: {body_ratio:.2%})"
-            )
+        logger.info(
+            "Detected {} Order Block: {:.2f} - {:.2f} (body ratio: {:.2%})",
+            ob_type, ob_bottom, ob_top, body_ratio
+        )
 
-            return order_block
+        return order_block
 
-        except Exception as e:
-            logger.error(f"Failed to create OrderBlock model: {e}")
-            return None
-
-    def _detect_fvg(self) -> Optional[FVG]:
+    def _detect_fvg(
+        self,
+        high_0: float,
+        low_0: float,
+        high_2: float,
+        low_2: float,
+        timestamp: datetime
+    ) -> Optional[FVG]:
         """
-        Detect Fair Value Gap from last 3 candles.
+        Detect Fair Value Gap from the last 3 candles.
 
         FVG detection requires:
-        - At least 3 candles in history
+        - At least 3 candles seen (checked by the caller)
         - Gap between candle[0] and candle[2] (middle candle creates gap)
         - Gap size exceeds minimum threshold
 
         Bullish FVG: candle[0].high < candle[2].low
         Bearish FVG: candle[0].low > candle[2].high
 
+        Args:
+            high_0 (float): High of the candle two steps back
+            low_0 (float): Low of the candle two steps back
+            high_2 (float): High of the current candle
+            low_2 (float): Low of the current candle
+            timestamp (datetime): Current candle timestamp
+
         Returns:
             FVG or None: Detected FVG if found
         """
-        if len(self._candle_history) < 3:
+        is_fvg, is_bullish, fvg_top, fvg_bottom, gap_percent = _fvg_kernel(
+            high_0, low_0, high_2, low_2, self._min_fvg_pct
+        )
+        if not is_fvg:
             return None
 
-        # Get last 3 candles
-        candles = list(self._candle_history)[-3:]
-        candle_0 = candles[0]  # Oldest
-        candle_1 = candles[1]  # Middle (creates the gap)
-        candle_2 = candles[2]  # Most recent
-
-        # Check for bullish FVG
-        if candle_0["high"] < candle_2["low"]:
-            fvg_type = "bullish"
-            fvg_bottom = candle_0["high"]
-            fvg_top = candle_2["low"]
-            gap_size = fvg_top - fvg_bottom
-
-        # Check for bearish FVG
-        elif candle_0["low"] > candle_2["high"]:
-            fvg_type = "bearish"
-            fvg_top = candle_0["low"]
-            fvg_bottom = candle_2["high"]
-            gap_size = fvg_top - fvg_bottom
-
-        else:
-            # No gap detected
-            return None
+        fvg_type = _PATTERN_TYPES[is_bullish]
+
+        # Create FVG model (inputs are validated; failures propagate to the
+        # handler in _on_candle_closed)
+        fvg = FVG(
+            type=fvg_type,
+            top=fvg_top,
+            bottom=fvg_bottom,
+            timestamp=timestamp,
+            filled_percent=0.0,
+            is_valid=True
+        )
 
-        # Calculate gap percentage relative to price
-        avg_price = (fvg_top + fvg_bottom) / 2
-        gap_percent = (gap_size / avg_price) * 100
+        logger.info(
+            "Detected {} FVG: {:.2f} - {:.2f} (gap: {:.2%})",
+            fvg_type, fvg_bottom, fvg_top, gap_percent
+        )
 
-        # Check if gap meets minimum size threshold
-        min_gap_percent = self._config["min_fvg_gap_percent"]
-        if gap_percent < min_gap_percent:
-            return None
+        return fvg
 
-        # Create FVG model
-        try:
-            fvg = FVG(
-                type=fvg_type,
-                top=fvg_top,
-                bottom=fvg_bottom,
-                timestamp=candle_2["timestamp"],
-                filled_percent=0.0,
-                is_valid=True
-            )
+    def detect_batch(
+        self,
+        opens: Sequence[float],
+        highs: Sequence[float],
+        lows: Sequence[float],
+        closes: Sequence[float],
+        timestamps: Sequence[datetime]
+    ) -> Tuple[List[OrderBlock], List[FVG]]:
+        """
+        Detect patterns over a whole candle series (backtest replay path).
 
-            logger.info(
-                f"Detected {fvg_type} FVG: "
-                f"{fvg_bottom:.2f} - {fvg_top:.2f} "
-                f"(gap: {gap_percent:.2%})"
-            )
+        Runs the same kernels as the live path in one pass over parallel
+        column inputs, building models only for hits. Live processor state
+        (history, detected patterns, counters) is left untouched and no
+        events are published; _on_candle_closed remains the live path.
 
-            return fvg
+        Args:
+            opens (Sequence[float]): Candle opens, oldest first
+            highs (Sequence[float]): Candle highs
+            lows (Sequence[float]): Candle lows
+            closes (Sequence[float]): Candle closes
+            timestamps (Sequence[datetime]): Candle timestamps
 
-        except Exception as e:
-            logger.error(f"Failed to create FVG model: {e}")
-            return None
+        Returns:
+            Tuple: (order_blocks, fvgs) in candle order
+        """
+        min_ratio = self._min_ob_ratio
+        min_gap_percent = self._min_fvg_pct
+
+        order_blocks = []
+        for open_price, high, low, close, timestamp in zip(
+            opens, highs, lows, closes, timestamps
+        ):
+            is_ob, is_bullish, top, bottom, _ = _ob_kernel(
+                open_price, high, low, close, min_ratio
+            )
+            if is_ob:
+                order_blocks.append(OrderBlock(
+                    type=_PATTERN_TYPES[is_bullish],
+                    top=top,
+                    bottom=bottom,
+                    timestamp=timestamp
+                ))
+
+        # Pair each candle with the one two steps later
+        fvgs = []
+        for high_0, low_0, high_2, low_2, timestamp in zip(
+            highs, lows, islice(highs, 2, None), islice(lows, 2, None),
+            islice(timestamps, 2, None)
+        ):
+            is_fvg, is_bullish, top, bottom, _ = _fvg_kernel(
+                high_0, low_0, high_2, low_2, min_gap_percent
+            )
+            if is_fvg:
+                fvgs.append(FVG(
+                    type=_PATTERN_TYPES[is_bullish],
+                    top=top,
+                    bottom=bottom,
+                    timestamp=timestamp
+                ))
+
+        return order_blocks, fvgs
 
     async def _publish_order_block(self, order_block: OrderBlock) -> None:
         """
         Publish ORDER_BLOCK_DETECTED event to queue.
 
+        The pattern is always tracked; the event itself is skipped when
+        nothing subscribes to ORDER_BLOCK_DETECTED.
+
         Args:
             order_block (OrderBlock): Detected order block
         """
         try:
             # Store in detected patterns
-            self._detected_order_blocks.append({
-                "pattern": order_block,
-                "detected_at_candle": self._candle_count
-            })
+            self._ob_patterns.append(order_block)
+            self._ob_detected_at.append(self._candle_count)
+
+            # Nobody listening: tracking above is all that is needed
+            if not self.event_bus.has_subscribers(_EVT_OB):
+                return
 
-            # Create event with order block data
+            # Flat fields for subscribers plus the (frozen) model itself;
+            # no model_dump() copy is made per detection
             event = Event(
-                event_type=EventType.ORDER_BLOCK_DETECTED,
+                event_type=_EVT_OB,
                 data={
                     "type": order_block.type,
                     "top": order_block.top,
                     "bottom": order_block.bottom,
                     "timestamp": order_block.timestamp,
-                    "order_block": order_block.model_dump()
+                    "order_block": order_block
                 },
-                source="PatternProcessor"
+                source=_SRC
             )
 
             # Publish event
@@ -380,33 +481,39 @@ class PatternProcessor(EventProcessor):
             logger.debug("ORDER_BLOCK_DETECTED event published")
 
         except Exception as e:
-            logger.error(f"Failed to publish ORDER_BLOCK_DETECTED event: {e}")
+            logger.error("Failed to publish ORDER_BLOCK_DETECTED event: {}", e)
 
     async def _publish_fvg(self, fvg: FVG) -> None:
         """
         Publish FVG_DETECTED event to queue.
 
+        The pattern is always tracked; the event itself is skipped when
+        nothing subscribes to FVG_DETECTED.
+
         Args:
             fvg (FVG): Detected fair value gap
         """
         try:
             # Store in detected patterns
-            self._detected_fvgs.append({
-                "pattern": fvg,
-                "detected_at_candle": self._candle_count
-            })
+            self._fvg_patterns.append(fvg)
+            self._fvg_detected_at.append(self._candle_count)
+
+            # Nobody listening: tracking above is all that is needed
+            if not self.event_bus.has_subscribers(_EVT_FVG):
+                return
 
-            # Create event with FVG data
+            # Flat fields for subscribers plus the (frozen) model itself;
+            # no model_dump() copy is made per detection
             event = Event(
-                event_type=EventType.FVG_DETECTED,
+                event_type=_EVT_FVG,
                 data={
                     "type": fvg.type,
                     "top": fvg.top,
                     "bottom": fvg.bottom,
                     "timestamp": fvg.timestamp,
-                    "fvg": fvg.model_dump()
+                    "fvg": fvg
                 },
-                source="PatternProcessor"
+                source=_SRC
             )
 
             # Publish event
@@ -414,38 +521,35 @@ class PatternProcessor(EventProcessor):
             logger.debug("FVG_DETECTED event published")
 
         except Exception as e:
-            logger.error(f"Failed to publish FVG_DETECTED event: {e}")
+            logger.error("Failed to publish FVG_DETECTED event: {}", e)
 
     def _cleanup_old_patterns(self) -> None:
         """
         Remove patterns older than TTL to prevent memory leaks.
 
         Patterns are considered expired if they were detected more than
-        pattern_ttl_candles ago.
+        pattern_ttl_candles ago. Detection candles are appended in
+        increasing order, so the expired entries form a prefix found by
+        binary search and dropped with one slice deletion per column.
         """
-        ttl = self._config["pattern_ttl_candles"]
-        cutoff_candle = self._candle_count - ttl
+        cutoff_candle = self._candle_count - self._ttl
 
         # Cleanup old order blocks
-        initial_ob_count = len(self._detected_order_blocks)
-        self._detected_order_blocks = [
-            item for item in self._detected_order_blocks
-            if item["detected_at_candle"] > cutoff_candle
-        ]
-        removed_obs = initial_ob_count - len(self._detected_order_blocks)
+        removed_obs = bisect_right(self._ob_detected_at, cutoff_candle)
+        if removed_obs:
+            del self._ob_patterns[:removed_obs]
+            del self._ob_detected_at[:removed_obs]
 
         # Cleanup old FVGs
-        initial_fvg_count = len(self._detected_fvgs)
-        self._detected_fvgs = [
-            item for item in self._detected_fvgs
-            if item["detected_at_candle"] > cutoff_candle
-        ]
-        removed_fvgs = initial_fvg_count - len(self._detected_fvgs)
+        removed_fvgs = bisect_right(self._fvg_detected_at, cutoff_candle)
+        if removed_fvgs:
+            del self._fvg_patterns[:removed_fvgs]
+            del self._fvg_detected_at[:removed_fvgs]
 
         if removed_obs > 0 or removed_fvgs > 0:
             logger.debug(
-                f"Cleaned up {removed_obs} old Order Blocks and "
-                f"{removed_fvgs} old FVGs"
+                "Cleaned up {} old Order Blocks and {} old FVGs",
+                removed_obs, removed_fvgs
             )
 
     @property
@@ -456,9 +560,9 @@ class PatternProcessor(EventProcessor):
     @property
     def order_block_count(self) -> int:
         """Get number of active order blocks."""
-        return len(self._detected_order_blocks) if self._detected_order_blocks else 0
+        return len(self._ob_patterns) if self._ob_patterns else 0
 
     @property
     def fvg_count(self) -> int:
         """Get number of active FVGs."""
-        return len(self._detected_fvgs) if self._detected_fvgs else 0
+        return len(self._fvg_patterns) if self._fvg_patterns else 0
@@ -11,12 +11,100 @@ The processor waits for pattern confirmations and generates signals
 only when multiple patterns align in the same direction.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Tuple
+from collections import deque
+from time import monotonic_ns
 from loguru import logger
 
 from ..core.event_processor import EventProcessor
 from ..core.event_bus import EventBus, Event, EventType
+from ..core.models import Direction
+
+# Pattern types mapped to Direction once at ingest, so later checks and
+# bucket lookups are int operations
+_DIRECTION_BY_TYPE = {"bullish": Direction.BULLISH, "bearish": Direction.BEARISH}
+
+# Hot-path aliases for the two subscribed event types
+_EVT_OB = EventType.ORDER_BLOCK_DETECTED
+_EVT_FVG = EventType.FVG_DETECTED
+
+# Log label by "is Order Block" flag: False -> FVG, True -> Order Block
+_PATTERN_LABELS = ("FVG", "Order Block")
+
+# Signal direction and reason label by pattern Direction value
+_SIGNAL_DIRECTIONS = ("long", "short")
+_DIRECTION_LABELS = ("Bullish", "Bearish")
+
+
+class _PatternBucket:
+    """
+    Pending patterns of one type and direction, stored column-wise.
+
+    Bottoms, tops and ingest times live in parallel deques of plain floats
+    and ints; the event payload dicts are not retained, so confluence
+    checks and signal generation never go back to dict lookups. Midpoints
+    and ranges are derived once at ingest for reuse by every pair the
+    pattern takes part in. All columns share the same maxlen and therefore
+    drop their oldest entry in lockstep.
+    """
+
+    __slots__ = ("bottoms", "tops", "mids", "ranges", "received_ns")
+
+    def __init__(self, maxlen: int) -> None:
+        self.bottoms: deque = deque(maxlen=maxlen)
+        self.tops: deque = deque(maxlen=maxlen)
+        self.mids: deque = deque(maxlen=maxlen)
+        self.ranges: deque = deque(maxlen=maxlen)
+        self.received_ns: deque = deque(maxlen=maxlen)
+
+    def __len__(self) -> int:
+        return len(self.received_ns)
+
+    def append(self, bottom: float, top: float, received_ns: int) -> None:
+        """Store a pattern at the right end of every column."""
+        self.bottoms.append(bottom)
+        self.tops.append(top)
+        self.mids.append((top + bottom) / 2)
+        self.ranges.append(top - bottom)
+        self.received_ns.append(received_ns)
+
+    def remove(self, index: int) -> None:
+        """Delete the pattern at a position from every column."""
+        del self.bottoms[index]
+        del self.tops[index]
+        del self.mids[index]
+        del self.ranges[index]
+        del self.received_ns[index]
+
+    def evict_expired(self, cutoff_ns: int) -> int:
+        """
+        Pop patterns received at or before cutoff_ns.
+
+        Ingest times come from a monotonic clock, so the expired patterns
+        always form a prefix.
+
+        Returns:
+            int: Number of patterns removed
+        """
+        received_ns = self.received_ns
+        removed = 0
+        while received_ns and received_ns[0] <= cutoff_ns:
+            received_ns.popleft()
+            removed += 1
+        for _ in range(removed):
+            self.bottoms.popleft()
+            self.tops.popleft()
+            self.mids.popleft()
+            self.ranges.popleft()
+        return removed
+
+    def clear(self) -> None:
+        """Drop every stored pattern."""
+        self.bottoms.clear()
+        self.tops.clear()
+        self.mids.clear()
+        self.ranges.clear()
+        self.received_ns.clear()
 
 
 class SignalProcessor(EventProcessor):
@@ -37,7 +125,10 @@ class SignalProcessor(EventProcessor):
         min_risk_reward (float): Minimum R:R ratio (default: 2.0)
         require_confluence (bool): Require multiple patterns (default: True)
         pattern_proximity_percent (float): Max distance between patterns (default: 1.0)
-        signal_timeout_seconds (int): Max age for pattern combination (default: 300)
+        signal_timeout_seconds (int): Max time a pattern waits for confluence
+            after it is received (default: 300)
+        max_pending_patterns (int): Hard cap on stored patterns per type and
+            direction; the oldest is dropped when full (default: 1000)
 
     Examples:
         >>> bus = EventBus()
@@ -69,238 +160,288 @@ class SignalProcessor(EventProcessor):
             "require_confluence": True,  # Require multiple patterns
             "pattern_proximity_percent": 1.0,  # 1% max distance
             "signal_timeout_seconds": 300,  # 5 minutes
+            "max_pending_patterns": 1000,  # Memory ceiling per type/direction
         }
 
         # Merge with user config
         self._config = {**default_config, **(config or {})}
 
         # State initialization
-        self._recent_order_blocks: Optional[List] = None
-        self._recent_fvgs: Optional[List] = None
+        # Pending patterns indexed by Direction value so confluence only
+        # ever pairs patterns of the same direction
+        self._ob_by_dir: Optional[Tuple[_PatternBucket, ...]] = None
+        self._fvg_by_dir: Optional[Tuple[_PatternBucket, ...]] = None
         self._signal_count: int = 0
 
+        # Config values read on hot paths, cached as attributes
+        self._min_confidence: float = 0.0
+        self._min_risk_reward: float = 0.0
+        self._proximity_percent: float = 0.0
+        self._proximity_factor: float = 0.0
+        self._timeout_ns: int = 0
+        self._apply_config()
+
     async def _on_start(self) -> None:
         """Initialize processor state on startup."""
-        self._recent_order_blocks = []
-        self._recent_fvgs = []
+        maxlen = self._config["max_pending_patterns"]
+        self._ob_by_dir = tuple(_PatternBucket(maxlen) for _ in Direction)
+        self._fvg_by_dir = tuple(_PatternBucket(maxlen) for _ in Direction)
         self._signal_count = 0
+        self._apply_config()
         logger.info("SignalProcessor state initialized")
 
     async def _on_stop(self) -> None:
         """Cleanup processor state on shutdown."""
-        if self._recent_order_blocks:
-            self._recent_order_blocks.clear()
-        if self._recent_fvgs:
-            self._recent_fvgs.clear()
+        for buckets in (self._ob_by_dir, self._fvg_by_dir):
+            if buckets:
+                for bucket in buckets:
+                    bucket.clear()
         logger.info("SignalProcessor state cleaned up")
 
-    def _register_handlers(self) -> None:
-        """Register handlers for pattern detection events."""
-        self.event_bus.subscribe(
-            EventType.ORDER_BLOCK_DETECTED,
-            self._on_order_block_detected
-        )
-        self.event_bus.subscribe(
-            EventType.FVG_DETECTED,
-            self._on_fvg_detected
-        )
-        logger.debug("SignalProcessor registered for pattern events")
-
-    def _unregister_handlers(self) -> None:
-        """Unregister handlers from pattern detection events."""
-        self.event_bus.unsubscribe(
-            EventType.ORDER_BLOCK_DETECTED,
-            self._on_order_block_detected
-        )
-        self.event_bus.unsubscribe(
-            EventType.FVG_DETECTED,
-            self._on_fvg_detected
-        )
-        logger.debug("SignalProcessor unregistered from pattern events")
-
-    async def _on_order_block_detected(self, event: Event) -> None:
+    def reset(self) -> None:
         """
-        Handle ORDER_BLOCK_DETECTED event.
+        Drop pending patterns and the signal counter in place.
 
-        Stores the order block and checks for confluence with recent FVGs.
+        Pattern buckets are reused rather than rebuilt. Configuration and
+        event subscriptions are left as they are.
 
-        Args:
-            event (Event): ORDER_BLOCK_DETECTED event
+        Raises:
+            RuntimeError: If the processor state has not been initialized
+                (start() was never called)
         """
-        try:
-            pattern_data = event.data
-            self._recent_order_blocks.append({
-                "data": pattern_data,
-                "timestamp": event.timestamp
-            })
+        if self._ob_by_dir is None:
+            raise RuntimeError("SignalProcessor not started. Call start() first.")
 
-            logger.debug(
-                f"Stored Order Block: {pattern_data['type']} @ "
-                f"{pattern_data['bottom']:.2f}-{pattern_data['top']:.2f}"
-            )
-
-            # Check for confluence with recent FVGs
-            await self._check_confluence()
+        for buckets in (self._ob_by_dir, self._fvg_by_dir):
+            for bucket in buckets:
+                bucket.clear()
+        self._signal_count = 0
 
-            # Cleanup old patterns
-            self._cleanup_old_patterns()
+    def _register_handlers(self) -> None:
+        """Register the pattern handler for both pattern detection events."""
+        self.event_bus.subscribe(_EVT_OB, self._on_pattern_detected)
+        self.event_bus.subscribe(_EVT_FVG, self._on_pattern_detected)
+        logger.debug("SignalProcessor registered for pattern events")
 
-        except Exception as e:
-            logger.error(f"Error handling ORDER_BLOCK_DETECTED: {e}")
+    def _unregister_handlers(self) -> None:
+        """Unregister the pattern handler from pattern detection events."""
+        self.event_bus.unsubscribe(_EVT_OB, self._on_pattern_detected)
+        self.event_bus.unsubscribe(_EVT_FVG, self._on_pattern_detected)
+        logger.debug("SignalProcessor unregistered from pattern events")
 
-    async def _on_fvg_detected(self, event: Event) -> None:
+    async def _on_pattern_detected(self, event: Event) -> None:
         """
-        Handle FVG_DETECTED event.
+        Handle ORDER_BLOCK_DETECTED and FVG_DETECTED events.
 
-        Stores the FVG and checks for confluence with recent Order Blocks.
+        Stores the pattern in the bucket for its type and direction, then
+        checks for confluence with recent patterns of the other type.
 
         Args:
-            event (Event): FVG_DETECTED event
+            event (Event): ORDER_BLOCK_DETECTED or FVG_DETECTED event
         """
         try:
+            is_ob = event.event_type is _EVT_OB
+            own, others = (
+                (self._ob_by_dir, self._fvg_by_dir) if is_ob
+                else (self._fvg_by_dir, self._ob_by_dir)
+            )
+
+            # Unpack the payload once; only these scalars are stored
             pattern_data = event.data
-            self._recent_fvgs.append({
-                "data": pattern_data,
-                "timestamp": event.timestamp
-            })
+            pattern_type = pattern_data["type"]
+            bottom = pattern_data["bottom"]
+            top = pattern_data["top"]
+            direction = _DIRECTION_BY_TYPE[pattern_type]
+            now_ns = monotonic_ns()
+            own[direction].append(bottom, top, now_ns)
 
             logger.debug(
-                f"Stored FVG: {pattern_data['type']} @ "
-                f"{pattern_data['bottom']:.2f}-{pattern_data['top']:.2f}"
+                "Stored {}: {} @ {:.2f}-{:.2f}",
+                _PATTERN_LABELS[is_ob], pattern_type, bottom, top
             )
 
-            # Check for confluence with recent Order Blocks
-            await self._check_confluence()
+            # Drop expired patterns first so they can never pair up
+            self._cleanup_old_patterns(now_ns)
 
-            # Cleanup old patterns
-            self._cleanup_old_patterns()
+            # Check for confluence with recent patterns of the other type in
+            # the same direction, skipping it while there is nothing to pair with
+            if others[direction]:
+                signal = self._check_confluence(direction, incoming_is_ob=is_ob)
+                if signal:
+                    await self._publish_signal(signal)
 
         except Exception as e:
-            logger.error(f"Error handling FVG_DETECTED: {e}")
+            logger.error("Error handling {}: {}", event.event_type.name, e)
 
-    async def _check_confluence(self) -> None:
+    def _check_confluence(
+        self,
+        direction: Direction,
+        incoming_is_ob: bool
+    ) -> Optional[Dict[str, Any]]:
         """
-        Check for pattern confluence and generate signals.
+        Check for pattern confluence and generate a signal.
 
         Confluence criteria:
         - Same direction (bullish/bearish)
         - Patterns overlap or are within proximity threshold
         - Meets minimum confidence score
         - Meets minimum risk-reward ratio
+
+        Every stored pair was already checked when its newer pattern arrived
+        and cannot have changed since, so only the incoming pattern (the last
+        one in its bucket) is paired against the opposite pattern type.
+        Counterparts outside its proximity envelope are skipped with two
+        comparisons before the exact proximity test runs.
+
+        The check itself never suspends; the caller publishes the returned
+        signal, so events without confluence skip the coroutine round trip.
+
+        Args:
+            direction (Direction): Direction bucket to scan
+            incoming_is_ob (bool): True if the new pattern is an Order Block
+
+        Returns:
+            Dict or None: Signal data if a confluent pair was found
         """
-        # If confluence required, need at least one of each pattern type
-        if self._config["require_confluence"]:
-            if not self._recent_order_blocks or not self._recent_fvgs:
-                return
-
-        # Find matching pattern combinations
-        for ob_item in self._recent_order_blocks:
-            for fvg_item in self._recent_fvgs:
-                ob_data = ob_item["data"]
-                fvg_data = fvg_item["data"]
-
-                # Check if same direction
-                if ob_data["type"] != fvg_data["type"]:
-                    continue
-
-                # Check proximity
-                if not self._patterns_are_nearby(ob_data, fvg_data):
-                    continue
-
-                # Generate signal
-                signal = self._generate_signal(ob_data, fvg_data)
-                if signal:
-                    await self._publish_signal(signal)
-                    # Remove used patterns to avoid duplicate signals
-                    self._recent_order_blocks.remove(ob_item)
-                    self._recent_fvgs.remove(fvg_item)
-                    return  # Only one signal per check
+        order_blocks = self._ob_by_dir[direction]
+        fvgs = self._fvg_by_dir[direction]
+        incoming, counterparts = (
+            (order_blocks, fvgs) if incoming_is_ob else (fvgs, order_blocks)
+        )
 
-    def _patterns_are_nearby(
-        self,
-        ob_data: Dict[str, Any],
-        fvg_data: Dict[str, Any]
-    ) -> bool:
+        # A signal always pairs one pattern of each type, whatever
+        # require_confluence says; the incoming pattern may also have
+        # expired during cleanup
+        if not incoming or not counterparts:
+            return None
+
+        last = len(incoming) - 1
+        new_bottom = incoming.bottoms[last]
+        new_top = incoming.tops[last]
+
+        # Proximity envelope: counterparts must start below the upper bound
+        # and end above the lower bound to be within the threshold
+        factor = self._proximity_factor
+        upper = new_top * factor
+        lower = new_bottom / factor
+
+        for index, (bottom, top) in enumerate(zip(counterparts.bottoms, counterparts.tops)):
+            if bottom > upper or top < lower:
+                continue
+
+            if incoming_is_ob:
+                ob, ob_index, fvg, fvg_index = incoming, last, counterparts, index
+                ob_bottom, ob_top, fvg_bottom, fvg_top = new_bottom, new_top, bottom, top
+            else:
+                ob, ob_index, fvg, fvg_index = counterparts, index, incoming, last
+                ob_bottom, ob_top, fvg_bottom, fvg_top = bottom, top, new_bottom, new_top
+
+            # Check proximity and generate signal in one pass
+            signal = self._evaluate_pair(
+                direction, ob_bottom, ob_top, fvg_bottom, fvg_top,
+                fvg.mids[fvg_index], ob.ranges[ob_index], fvg.ranges[fvg_index]
+            )
+            if signal:
+                # Remove used patterns (by position) to avoid duplicate signals
+                incoming.remove(last)
+                counterparts.remove(index)
+                return signal  # Only one signal per check
+
+        return None
+
+    def _apply_config(self) -> None:
         """
-        Check if two patterns are close enough for confluence.
+        Cache config values used per event as plain attributes.
 
-        Patterns are considered nearby if they overlap or are within
-        the proximity threshold percentage.
+        Called at construction and again on start, so config changes made
+        before start() still take effect.
+        """
+        config = self._config
+        self._min_confidence = config["min_confidence"]
+        self._min_risk_reward = config["min_risk_reward"]
+        self._proximity_percent = config["pattern_proximity_percent"]
+        self._proximity_factor = self._compute_proximity_factor()
+        self._timeout_ns = config["signal_timeout_seconds"] * 1_000_000_000
+
+    def _compute_proximity_factor(self) -> float:
+        """
+        Convert pattern_proximity_percent into a price envelope factor.
 
-        Args:
-            ob_data (Dict): Order Block data
-            fvg_data (Dict): FVG data
+        The gap between prices a < b is within p% of their midpoint when
+        b <= a * (1 + p/200) / (1 - p/200), so the returned factor bounds
+        the counterpart range on both sides of a pattern.
 
         Returns:
-            bool: True if patterns are nearby
+            float: Envelope factor (inf when every distance qualifies)
         """
-        ob_top = ob_data["top"]
-        ob_bottom = ob_data["bottom"]
-        fvg_top = fvg_data["top"]
-        fvg_bottom = fvg_data["bottom"]
-
-        # Check for overlap
-        if (ob_bottom <= fvg_top and ob_top >= fvg_bottom):
-            return True
-
-        # Calculate distance between patterns
-        if ob_bottom > fvg_top:
-            # OB is above FVG
-            distance = ob_bottom - fvg_top
-            reference_price = (ob_bottom + fvg_top) / 2
-        else:
-            # FVG is above OB
-            distance = fvg_bottom - ob_top
-            reference_price = (fvg_bottom + ob_top) / 2
-
-        # Calculate distance as percentage
-        distance_percent = (distance / reference_price) * 100
-
-        # Check if within proximity threshold
-        max_proximity = self._config["pattern_proximity_percent"]
-        return distance_percent <= max_proximity
-
-    def _generate_signal(
+        half = self._proximity_percent / 200
+        if half >= 1:
+            return float("inf")
+        return (1 + half) / (1 - half)
+
+    def _evaluate_pair(
         self,
-        ob_data: Dict[str, Any],
-        fvg_data: Dict[str, Any]
+        direction: Direction,
+        ob_bottom: float,
+        ob_top: float,
+        fvg_bottom: float,
+        fvg_top: float,
+        fvg_mid: float,
+        ob_range: float,
+        fvg_range: float
     ) -> Optional[Dict[str, Any]]:
         """
-        Generate trade signal from pattern combination.
+        Evaluate an Order Block + FVG pair and generate a trade signal.
 
-        Calculates entry price, stop loss, and take profit levels based on
-        pattern positions and risk-reward requirements.
+        Proximity, stop loss placement and confidence are all derived from
+        the same bounds of the two ranges, which are computed once:
+        - Patterns are nearby if they overlap or the gap between them is
+          within the proximity threshold percentage
+        - Entry is the FVG 50% retracement; stop loss sits beyond both
+          patterns and take profit follows from the minimum risk-reward
+        - Confidence starts at 70 and gains up to +20 for overlap relative
+          to the smaller pattern, capped at 100
 
         Args:
-            ob_data (Dict): Order Block data
-            fvg_data (Dict): FVG data
+            direction (Direction): Shared direction of both patterns
+            ob_bottom (float): Order Block bottom
+            ob_top (float): Order Block top
+            fvg_bottom (float): FVG bottom
+            fvg_top (float): FVG top
+            fvg_mid (float): FVG midpoint (50% retracement)
+            ob_range (float): Order Block height
+            fvg_range (float): FVG height
 
         Returns:
             Dict or None: Signal data if valid, None otherwise
         """
-        direction = ob_data["type"]  # Both patterns have same type
-
-        # Calculate entry price (FVG 50% retracement or OB boundary)
-        fvg_mid = (fvg_data["top"] + fvg_data["bottom"]) / 2
-
-        if direction == "bullish":
-            # Long signal
-            entry_price = fvg_mid
-            stop_loss = min(ob_data["bottom"], fvg_data["bottom"]) * 0.999  # Below both patterns
-
-            # Calculate take profit based on risk-reward
+        # Inner bounds: the overlap when positive, the gap when negative
+        overlap_top = min(ob_top, fvg_top)
+        overlap_bottom = max(ob_bottom, fvg_bottom)
+        overlap = overlap_top - overlap_bottom
+
+        # Check proximity (patterns that do not overlap must be close enough)
+        if overlap < 0:
+            distance = -overlap
+            reference_price = (overlap_bottom + overlap_top) / 2
+            distance_percent = (distance / reference_price) * 100
+            if distance_percent > self._proximity_percent:
+                return None
+            overlap = 0.0
+
+        min_rr = self._min_risk_reward
+
+        # Entry price is the FVG 50% retracement
+        entry_price = fvg_mid
+        if direction == Direction.BULLISH:
+            # Long signal: stop below both patterns
+            stop_loss = min(ob_bottom, fvg_bottom) * 0.999
             risk = entry_price - stop_loss
-            min_rr = self._config["min_risk_reward"]
             take_profit = entry_price + (risk * min_rr)
-
         else:  # bearish
-            # Short signal
-            entry_price = fvg_mid
-            stop_loss = max(ob_data["top"], fvg_data["top"]) * 1.001  # Above both patterns
-
-            # Calculate take profit based on risk-reward
+            # Short signal: stop above both patterns
+            stop_loss = max(ob_top, fvg_top) * 1.001
             risk = stop_loss - entry_price
-            min_rr = self._config["min_risk_reward"]
             take_profit = entry_price - (risk * min_rr)
 
         # Calculate risk-reward ratio
@@ -309,27 +450,31 @@ class SignalProcessor(EventProcessor):
         risk_reward_ratio = reward_amount / risk_amount if risk_amount > 0 else 0
 
         # Validate risk-reward meets minimum
-        if risk_reward_ratio < self._config["min_risk_reward"]:
+        if risk_reward_ratio < min_rr:
             logger.debug(
-                f"Signal rejected: R:R {risk_reward_ratio:.2f} < "
-                f"minimum {self._config['min_risk_reward']}"
+                "Signal rejected: R:R {:.2f} < minimum {}",
+                risk_reward_ratio, min_rr
             )
             return None
 
-        # Calculate confidence score
-        confidence = self._calculate_confidence(ob_data, fvg_data)
+        # Confidence: base for confluence plus overlap bonus
+        confidence = 70.0
+        smaller_range = min(ob_range, fvg_range)
+        if smaller_range > 0:
+            confidence += (overlap / smaller_range) * 20  # Up to +20 for full overlap
+        confidence = min(100.0, confidence)
 
         # Validate confidence meets minimum
-        if confidence < self._config["min_confidence"]:
+        if confidence < self._min_confidence:
             logger.debug(
-                f"Signal rejected: Confidence {confidence:.1f} < "
-                f"minimum {self._config['min_confidence']}"
+                "Signal rejected: Confidence {:.1f} < minimum {}",
+                confidence, self._min_confidence
             )
             return None
 
         # Build signal data
         signal = {
-            "direction": "long" if direction == "bullish" else "short",
+            "direction": _SIGNAL_DIRECTIONS[direction],
             "entry_price": entry_price,
             "stop_loss": stop_loss,
             "take_profit": take_profit,
@@ -337,59 +482,21 @@ class SignalProcessor(EventProcessor):
             "confidence": confidence,
             "patterns": ["order_block", "fvg"],
             "reason": (
-                f"{direction.capitalize()} confluence: Order Block "
-                f"({ob_data['bottom']:.2f}-{ob_data['top']:.2f}) + "
-                f"FVG ({fvg_data['bottom']:.2f}-{fvg_data['top']:.2f})"
+                f"{_DIRECTION_LABELS[direction]} confluence: Order Block "
+                f"({ob_bottom:.2f}-{ob_top:.2f}) + "
+                f"FVG ({fvg_bottom:.2f}-{fvg_top:.2f})"
             )
         }
 
         logger.info(
-            f"Generated {signal['direction']} signal: Entry={entry_price:.2f}, "
-            f"SL={stop_loss:.2f}, TP={take_profit:.2f}, "
-            f"R:R={risk_reward_ratio:.2f}, Confidence={confidence:.1f}"
+            "Generated {} signal: Entry={:.2f}, SL={:.2f}, TP={:.2f}, "
+            "R:R={:.2f}, Confidence={:.1f}",
+            signal["direction"], entry_price, stop_loss, take_profit,
+            risk_reward_ratio, confidence
         )
 
         return signal
 
-    def _calculate_confidence(
-        self,
-        ob_data: Dict[str, Any],
-        fvg_data: Dict[str, Any]
-    ) -> float:
-        """
-        Calculate confidence score for signal (0-100).
-
-        Factors:
-        - Pattern overlap (more overlap = higher confidence)
-        - Pattern freshness (recent = higher confidence)
-
-        Args:
-            ob_data (Dict): Order Block data
-            fvg_data (Dict): FVG data
-
-        Returns:
-            float: Confidence score 0-100
-        """
-        confidence = 70.0  # Base confidence for confluence
-
-        # Check for overlap (bonus confidence)
-        ob_range = ob_data["top"] - ob_data["bottom"]
-        fvg_range = fvg_data["top"] - fvg_data["bottom"]
-
-        # Calculate overlap
-        overlap_top = min(ob_data["top"], fvg_data["top"])
-        overlap_bottom = max(ob_data["bottom"], fvg_data["bottom"])
-        overlap = max(0, overlap_top - overlap_bottom)
-
-        # Overlap percentage (relative to smaller pattern)
-        smaller_range = min(ob_range, fvg_range)
-        if smaller_range > 0:
-            overlap_percent = overlap / smaller_range
-            confidence += overlap_percent * 20  # Up to +20 for full overlap
-
-        # Cap at 100
-        return min(100.0, confidence)
-
     async def _publish_signal(self, signal: Dict[str, Any]) -> None:
         """
         Publish ENTRY_SIGNAL event to queue.
@@ -407,38 +514,36 @@ class SignalProcessor(EventProcessor):
             )
 
             await self.event_bus.publish(event)
-            logger.info(f"ENTRY_SIGNAL #{self._signal_count} published")
+            logger.info("ENTRY_SIGNAL #{} published", self._signal_count)
 
         except Exception as e:
-            logger.error(f"Failed to publish ENTRY_SIGNAL: {e}")
+            logger.error("Failed to publish ENTRY_SIGNAL: {}", e)
 
-    def _cleanup_old_patterns(self) -> None:
+    def _cleanup_old_patterns(self, now_ns: int) -> None:
         """
         Remove patterns older than timeout to prevent stale signals.
+
+        Args:
+            now_ns (int): Current monotonic clock reading in nanoseconds
         """
-        timeout = timedelta(seconds=self._config["signal_timeout_seconds"])
-        cutoff_time = datetime.utcnow() - timeout
+        cutoff_ns = now_ns - self._timeout_ns
 
         # Cleanup old order blocks
-        initial_ob_count = len(self._recent_order_blocks)
-        self._recent_order_blocks = [
-            item for item in self._recent_order_blocks
-            if item["timestamp"] > cutoff_time
-        ]
-        removed_obs = initial_ob_count - len(self._recent_order_blocks)
+        removed_obs = sum(
+            bucket.evict_expired(cutoff_ns)
+            for bucket in self._ob_by_dir
+        )
 
         # Cleanup old FVGs
-        initial_fvg_count = len(self._recent_fvgs)
-        self._recent_fvgs = [
-            item for item in self._recent_fvgs
-            if item["timestamp"] > cutoff_time
-        ]
-        removed_fvgs = initial_fvg_count - len(self._recent_fvgs)
+        removed_fvgs = sum(
+            bucket.evict_expired(cutoff_ns)
+            for bucket in self._fvg_by_dir
+        )
 
         if removed_obs > 0 or removed_fvgs > 0:
             logger.debug(
-                f"Cleaned up {removed_obs} old Order Blocks and "
-                f"{removed_fvgs} old FVGs (timeout: {timeout})"
+                "Cleaned up {} old Order Blocks and {} old FVGs (timeout: {}s)",
+                removed_obs, removed_fvgs, self._config["signal_timeout_seconds"]
             )
 
     @property
@@ -449,9 +554,13 @@ class SignalProcessor(EventProcessor):
     @property
     def pending_order_blocks(self) -> int:
         """Get number of order blocks awaiting confluence."""
-        return len(self._recent_order_blocks) if self._recent_order_blocks else 0
+        if not self._ob_by_dir:
+            return 0
+        return sum(len(bucket) for bucket in self._ob_by_dir)
 
     @property
     def pending_fvgs(self) -> int:
         """Get number of FVGs awaiting confluence."""
-        return len(self._recent_fvgs) if self._recent_fvgs else 0
+        if not self._fvg_by_dir:
+            return 0
+        return sum(len(bucket) for bucket in self._fvg_by_dir)
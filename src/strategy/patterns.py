@@ -3,9 +3,62 @@ Candlestick pattern analysis helper functions.
 
 This module provides utility functions for analyzing candlestick patterns,
 including body ratio calculations, candle direction detection, and data validation.
+
+Column-oriented counterparts (validate_candles, calculate_body_ratios,
+is_bullish_candles, is_bearish_candles, get_candle_body_sizes,
+analyze_candles) evaluate whole candle sequences in one pass for
+backtests and historical scans.
+They accept any mapping of OHLC columns, or a CandleSeries holding the
+columns as packed float arrays.
 """
 
-from typing import Dict, Any
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+_OHLC_FIELDS = ('open', 'high', 'low', 'close')
+# Result keys shared by analyze_candle and analyze_candles
+_ANALYSIS_KEYS = ('valid', 'body_ratio', 'body_size', 'is_bullish', 'is_bearish')
+
+
+def _unpack(candle: Dict[str, Any]) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Validate a candle and convert its OHLC values to floats in one pass.
+
+    Args:
+        candle: Dictionary containing OHLC data
+
+    Returns:
+        (open, high, low, close) as floats, or None if a field is missing,
+        non-numeric, or high < low
+    """
+    try:
+        open_price = float(candle['open'])
+        high = float(candle['high'])
+        low = float(candle['low'])
+        close = float(candle['close'])
+    except (KeyError, ValueError, TypeError):
+        return None
+
+    # Verify high >= low
+    if not high >= low:
+        return None
+    return open_price, high, low, close
+
+
+def _body_ratio(open_price: float, high: float, low: float, close: float) -> float:
+    """
+    Body ratio kernel on plain floats, for callers that already hold OHLC values.
+
+    Returns 0.0 for zero-range and inverted (high < low) candles.
+    """
+    total_range = high - low
+
+    # Handle zero division for zero-range candles
+    if total_range <= 0:
+        return 0.0
+
+    return abs(close - open_price) / total_range
 
 
 def validate_candle_data(candle: Dict[str, Any]) -> bool:
@@ -26,23 +79,7 @@ def validate_candle_data(candle: Dict[str, Any]) -> bool:
         >>> validate_candle_data({'open': 100, 'close': 103})
         False
     """
-    required_fields = ['open', 'high', 'low', 'close']
-
-    # Check if all required fields exist
-    if not all(field in candle for field in required_fields):
-        return False
-
-    try:
-        # Validate all values are numeric by attempting conversion
-        _ = float(candle['open'])
-        high = float(candle['high'])
-        low = float(candle['low'])
-        _ = float(candle['close'])
-
-        # Verify high >= low
-        return high >= low
-    except (ValueError, TypeError):
-        return False
+    return _unpack(candle) is not None
 
 
 def calculate_body_ratio(candle: Dict[str, Any]) -> float:
@@ -65,26 +102,10 @@ def calculate_body_ratio(candle: Dict[str, Any]) -> float:
         >>> calculate_body_ratio({'open': 100, 'high': 100, 'low': 100, 'close': 100})
         0.0
     """
-    if not validate_candle_data(candle):
-        return 0.0
-
-    try:
-        open_price = float(candle['open'])
-        high = float(candle['high'])
-        low = float(candle['low'])
-        close = float(candle['close'])
-
-        total_range = high - low
-
-        # Handle zero division for zero-range candles
-        if total_range == 0:
-            return 0.0
-
-        body_size = abs(close - open_price)
-        return body_size / total_range
-
-    except (ValueError, TypeError, ZeroDivisionError):
+    ohlc = _unpack(candle)
+    if ohlc is None:
         return 0.0
+    return _body_ratio(*ohlc)
 
 
 def is_bullish_candle(candle: Dict[str, Any]) -> bool:
@@ -103,13 +124,8 @@ def is_bullish_candle(candle: Dict[str, Any]) -> bool:
         >>> is_bullish_candle({'open': 100, 'high': 105, 'low': 99, 'close': 98})
         False
     """
-    if not validate_candle_data(candle):
-        return False
-
-    try:
-        return float(candle['close']) > float(candle['open'])
-    except (ValueError, TypeError):
-        return False
+    ohlc = _unpack(candle)
+    return ohlc is not None and ohlc[3] > ohlc[0]
 
 
 def is_bearish_candle(candle: Dict[str, Any]) -> bool:
@@ -128,13 +144,8 @@ def is_bearish_candle(candle: Dict[str, Any]) -> bool:
         >>> is_bearish_candle({'open': 100, 'high': 105, 'low': 99, 'close': 103})
         False
     """
-    if not validate_candle_data(candle):
-        return False
-
-    try:
-        return float(candle['close']) < float(candle['open'])
-    except (ValueError, TypeError):
-        return False
+    ohlc = _unpack(candle)
+    return ohlc is not None and ohlc[3] < ohlc[0]
 
 
 def get_candle_body_size(candle: Dict[str, Any]) -> float:
@@ -154,12 +165,386 @@ def get_candle_body_size(candle: Dict[str, Any]) -> float:
         >>> get_candle_body_size({'open': 100, 'high': 105, 'low': 99, 'close': 98})
         2.0
     """
-    if not validate_candle_data(candle):
+    ohlc = _unpack(candle)
+    if ohlc is None:
         return 0.0
+    return abs(ohlc[3] - ohlc[0])
+
+
+def analyze_candle(candle: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute every single-candle metric from one validation pass.
+
+    Equivalent to calling validate_candle_data, calculate_body_ratio,
+    get_candle_body_size, is_bullish_candle and is_bearish_candle
+    separately, but the candle is unpacked and validated only once.
+
+    Args:
+        candle: Dictionary containing OHLC data
+
+    Returns:
+        Dictionary with keys 'valid', 'body_ratio', 'body_size',
+        'is_bullish' and 'is_bearish'. Invalid candles report 0.0 and False.
+
+    Examples:
+        >>> analyze_candle({'open': 100, 'high': 110, 'low': 95, 'close': 105})['body_size']
+        5.0
+        >>> analyze_candle({'open': 100, 'close': 103})['valid']
+        False
+    """
+    ohlc = _unpack(candle)
+    if ohlc is None:
+        return {
+            'valid': False,
+            'body_ratio': 0.0,
+            'body_size': 0.0,
+            'is_bullish': False,
+            'is_bearish': False,
+        }
+
+    open_price, _, _, close = ohlc
+    return {
+        'valid': True,
+        'body_ratio': _body_ratio(*ohlc),
+        'body_size': abs(close - open_price),
+        'is_bullish': close > open_price,
+        'is_bearish': close < open_price,
+    }
+
+
+@dataclass(frozen=True)
+class CandleSeries:
+    """
+    Column-oriented (structure-of-arrays) OHLC buffer.
+
+    Each field is a packed array of C doubles, so a scan over one field
+    reads contiguous memory instead of one dict per candle. The column
+    helpers use the arrays as-is, skipping their per-call float conversion.
+    Indexing by field name (series['close']) returns the matching column.
+
+    Attributes:
+        open: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+
+    Examples:
+        >>> series = CandleSeries.from_candles([
+        ...     {'open': 100, 'high': 110, 'low': 95, 'close': 105},
+        ...     {'open': 105, 'high': 106, 'low': 98, 'close': 99},
+        ... ])
+        >>> len(series), series['close'][1]
+        (2, 99.0)
+        >>> is_bullish_candles(series)
+        [True, False]
+    """
+
+    open: array
+    high: array
+    low: array
+    close: array
+
+    def __post_init__(self):
+        if not len(self.open) == len(self.high) == len(self.low) == len(self.close):
+            raise ValueError("OHLC columns must have equal length")
+
+    @classmethod
+    def from_columns(cls, candles: Mapping[str, Sequence[Any]]) -> "CandleSeries":
+        """
+        Build a series from a mapping of OHLC columns (e.g. a dict of lists).
+
+        Raises:
+            KeyError: If a required column is missing
+            ValueError: If a value is non-numeric or the columns differ in length
+            TypeError: If a value is None or another non-numeric type
+        """
+        return cls(*(array('d', map(float, candles[field])) for field in _OHLC_FIELDS))
+
+    @classmethod
+    def from_candles(cls, candles: Iterable[Mapping[str, Any]]) -> "CandleSeries":
+        """
+        Build a series from per-candle dicts.
+
+        Raises:
+            KeyError: If a candle lacks an OHLC field
+            ValueError: If a value is a non-numeric string
+            TypeError: If a value is None or another non-numeric type
+        """
+        opens, highs, lows, closes = (array('d') for _ in _OHLC_FIELDS)
+        for candle in candles:
+            opens.append(float(candle['open']))
+            highs.append(float(candle['high']))
+            lows.append(float(candle['low']))
+            closes.append(float(candle['close']))
+        return cls(opens, highs, lows, closes)
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def __getitem__(self, field: str) -> array:
+        if field not in _OHLC_FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+
+def _raw_columns(candles: Mapping[str, Sequence[Any]]) -> List[Sequence[Any]]:
+    """
+    Fetch the OHLC columns, checking they have equal length.
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If the columns differ in length
+    """
+    columns = [candles[field] for field in _OHLC_FIELDS]
+    if len({len(column) for column in columns}) > 1:
+        raise ValueError("OHLC columns must have equal length")
+    return columns
+
+
+def _ohlc_columns(
+    candles: Mapping[str, Sequence[Any]]
+) -> Optional[Tuple[Sequence[float], Sequence[float], Sequence[float], Sequence[float]]]:
+    """
+    Convert OHLC columns to float lists in one pass per column.
+
+    A CandleSeries already holds floats, so its arrays are returned as-is.
+
+    Args:
+        candles: Mapping of 'open', 'high', 'low', 'close' to equal-length columns
+
+    Returns:
+        (opens, highs, lows, closes), or None if any value is non-numeric
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If the columns differ in length
+    """
+    if isinstance(candles, CandleSeries):
+        return candles.open, candles.high, candles.low, candles.close
 
+    columns = _raw_columns(candles)
     try:
-        open_price = float(candle['open'])
-        close = float(candle['close'])
-        return abs(close - open_price)
+        opens, highs, lows, closes = (list(map(float, column)) for column in columns)
     except (ValueError, TypeError):
-        return 0.0
+        return None
+    return opens, highs, lows, closes
+
+
+def _candle_rows(candles: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Rebuild per-candle dicts for the scalar fallback on non-numeric columns."""
+    columns = _raw_columns(candles)
+    return [dict(zip(_OHLC_FIELDS, row)) for row in zip(*columns)]
+
+
+def validate_candles(candles: Mapping[str, Sequence[Any]]) -> List[bool]:
+    """
+    Validate a column-oriented candle sequence.
+
+    Equivalent to calling validate_candle_data on every row. Numeric columns
+    are checked with a single comparison pass; columns holding non-numeric
+    values fall back to the per-candle check.
+
+    Args:
+        candles: Mapping of 'open', 'high', 'low', 'close' to equal-length
+            columns (e.g. a dict of lists or a pandas DataFrame)
+
+    Returns:
+        Validation result per candle, in input order
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If the columns differ in length
+
+    Examples:
+        >>> validate_candles({'open': [100, 100], 'high': [105, 99],
+        ...                   'low': [99, 105], 'close': [103, 103]})
+        [True, False]
+    """
+    columns = _ohlc_columns(candles)
+    if columns is None:
+        return [validate_candle_data(candle) for candle in _candle_rows(candles)]
+
+    _, highs, lows, _ = columns
+    return [high >= low for high, low in zip(highs, lows)]
+
+
+def calculate_body_ratios(candles: Mapping[str, Sequence[Any]]) -> List[float]:
+    """
+    Calculate body ratios for a column-oriented candle sequence.
+
+    Equivalent to calling calculate_body_ratio on every row: invalid and
+    zero-range candles yield 0.0.
+
+    Args:
+        candles: Mapping of 'open', 'high', 'low', 'close' to equal-length columns
+
+    Returns:
+        Body ratio per candle, in input order
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If the columns differ in length
+
+    Examples:
+        >>> calculate_body_ratios({'open': [100, 100], 'high': [110, 100],
+        ...                        'low': [95, 100], 'close': [105, 100]})
+        [0.3333333333333333, 0.0]
+    """
+    columns = _ohlc_columns(candles)
+    if columns is None:
+        return [calculate_body_ratio(candle) for candle in _candle_rows(candles)]
+
+    return [
+        abs(close - open_price) / (high - low) if high > low else 0.0
+        for open_price, high, low, close in zip(*columns)
+    ]
+
+
+def is_bullish_candles(candles: Mapping[str, Sequence[Any]]) -> List[bool]:
+    """
+    Flag bullish candles (close > open) in a column-oriented sequence.
+
+    Equivalent to calling is_bullish_candle on every row: invalid candles
+    are never bullish.
+
+    Args:
+        candles: Mapping of 'open', 'high', 'low', 'close' to equal-length columns
+
+    Returns:
+        True per candle where close > open, in input order
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If the columns differ in length
+
+    Examples:
+        >>> is_bullish_candles({'open': [100, 100], 'high': [105, 105],
+        ...                     'low': [99, 99], 'close': [103, 98]})
+        [True, False]
+    """
+    columns = _ohlc_columns(candles)
+    if columns is None:
+        return [is_bullish_candle(candle) for candle in _candle_rows(candles)]
+
+    return [
+        high >= low and close > open_price
+        for open_price, high, low, close in zip(*columns)
+    ]
+
+
+def is_bearish_candles(candles: Mapping[str, Sequence[Any]]) -> List[bool]:
+    """
+    Flag bearish candles (close < open) in a column-oriented sequence.
+
+    Equivalent to calling is_bearish_candle on every row: invalid candles
+    are never bearish.
+
+    Args:
+        candles: Mapping of 'open', 'high', 'low', 'close' to equal-length columns
+
+    Returns:
+        True per candle where close < open, in input order
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If the columns differ in length
+
+    Examples:
+        >>> is_bearish_candles({'open': [100, 100], 'high': [105, 105],
+        ...                     'low': [99, 99], 'close': [103, 98]})
+        [False, True]
+    """
+    columns = _ohlc_columns(candles)
+    if columns is None:
+        return [is_bearish_candle(candle) for candle in _candle_rows(candles)]
+
+    return [
+        high >= low and close < open_price
+        for open_price, high, low, close in zip(*columns)
+    ]
+
+
+def get_candle_body_sizes(candles: Mapping[str, Sequence[Any]]) -> List[float]:
+    """
+    Calculate body sizes for a column-oriented candle sequence.
+
+    Equivalent to calling get_candle_body_size on every row: invalid
+    candles yield 0.0.
+
+    Args:
+        candles: Mapping of 'open', 'high', 'low', 'close' to equal-length columns
+
+    Returns:
+        Absolute difference between close and open per candle, in input order
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If the columns differ in length
+
+    Examples:
+        >>> get_candle_body_sizes({'open': [100, 100], 'high': [105, 99],
+        ...                        'low': [99, 105], 'close': [103, 98]})
+        [3.0, 0.0]
+    """
+    columns = _ohlc_columns(candles)
+    if columns is None:
+        return [get_candle_body_size(candle) for candle in _candle_rows(candles)]
+
+    return [
+        abs(close - open_price) if high >= low else 0.0
+        for open_price, high, low, close in zip(*columns)
+    ]
+
+
+def analyze_candles(candles: Mapping[str, Sequence[Any]]) -> Dict[str, List[Any]]:
+    """
+    Compute every single-candle metric for a column-oriented sequence.
+
+    Column counterpart of analyze_candle: one pass over the columns fills
+    all five result lists, instead of one pass per column helper. Invalid
+    candles report 0.0 and False, as in the per-candle helpers.
+
+    Args:
+        candles: Mapping of 'open', 'high', 'low', 'close' to equal-length columns
+
+    Returns:
+        Dictionary with list values, in input order, under the keys 'valid',
+        'body_ratio', 'body_size', 'is_bullish' and 'is_bearish'
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If the columns differ in length
+
+    Examples:
+        >>> analyze_candles({'open': [100, 100], 'high': [110, 99],
+        ...                  'low': [95, 105], 'close': [105, 103]})['body_size']
+        [5.0, 0.0]
+    """
+    columns = _ohlc_columns(candles)
+    if columns is None:
+        rows = [analyze_candle(candle) for candle in _candle_rows(candles)]
+        return {key: [row[key] for row in rows] for key in _ANALYSIS_KEYS}
+
+    valid, body_ratio, body_size, is_bullish, is_bearish = [], [], [], [], []
+    for open_price, high, low, close in zip(*columns):
+        if high >= low:
+            body = abs(close - open_price)
+            valid.append(True)
+            body_ratio.append(body / (high - low) if high > low else 0.0)
+            body_size.append(body)
+            is_bullish.append(close > open_price)
+            is_bearish.append(close < open_price)
+        else:
+            valid.append(False)
+            body_ratio.append(0.0)
+            body_size.append(0.0)
+            is_bullish.append(False)
+            is_bearish.append(False)
+
+    return {
+        'valid': valid,
+        'body_ratio': body_ratio,
+        'body_size': body_size,
+        'is_bullish': is_bullish,
+        'is_bearish': is_bearish,
+    }
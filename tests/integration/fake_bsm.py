@@ -0,0 +1,151 @@
+"""
+Fake Binance transport for WebSocket tests that do not need the testnet.
+
+Stands in for python-binance's AsyncClient and BinanceSocketManager so a
+BinanceWebSocket can run its real connect / stream / handle / shutdown code
+against precanned kline frames. Each candle is delivered as an in-progress
+update followed by its closed frame, a few milliseconds apart, so a test
+that would wait minutes for real candles finishes almost immediately.
+
+Usage:
+    monkeypatch.setattr("src.data.websocket_client.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(
+        "src.data.websocket_client.BinanceSocketManager", FakeBinanceSocketManager
+    )
+"""
+
+import asyncio
+from typing import List, Optional, Sequence, Tuple
+
+# Candle length per interval in milliseconds
+_INTERVAL_MS = {'1m': 60_000, '5m': 300_000, '15m': 900_000, '1h': 3_600_000}
+
+# (open, high, low, close, volume) of the candles every fake stream delivers
+DEFAULT_CANDLES: List[Tuple[float, float, float, float, float]] = [
+    (45000.0, 45100.0, 44900.0, 45050.0, 100.5),
+    (45050.0, 45200.0, 45000.0, 45150.0, 80.25),
+    (45150.0, 45160.0, 44950.0, 45000.0, 120.0),
+]
+
+# First candle close time (2024-01-01 00:01:00 UTC) in milliseconds
+_START_MS = 1_704_067_260_000
+
+
+def kline_frame(
+    symbol: str,
+    interval: str,
+    close_time: int,
+    ohlcv: Tuple[float, float, float, float, float],
+    closed: bool
+) -> dict:
+    """Build a Binance-shaped kline message (prices as strings, like the API)."""
+    open_price, high, low, close, volume = ohlcv
+    return {
+        'e': 'kline',
+        'E': close_time,
+        's': symbol,
+        'k': {
+            't': close_time - _INTERVAL_MS.get(interval, 60_000) + 1,
+            'T': close_time,
+            's': symbol,
+            'i': interval,
+            'o': str(open_price),
+            'h': str(high),
+            'l': str(low),
+            'c': str(close),
+            'v': str(volume),
+            'x': closed,
+        },
+    }
+
+
+class FakeKlineStream:
+    """
+    Async context manager mimicking a kline socket.
+
+    recv() returns the precanned frames in order, one per cadence tick, then
+    keeps returning in-progress updates of the last candle so the client's
+    receive loop stays alive until stop() is called. With drop_after set,
+    recv() raises ConnectionError once that many frames have been served,
+    simulating a dropped connection.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        interval: str,
+        candles: Sequence[Tuple[float, float, float, float, float]],
+        cadence: float,
+        drop_after: Optional[int] = None
+    ):
+        self.cadence = cadence
+        self.drop_after = drop_after
+        self._frames: List[dict] = []
+        step = _INTERVAL_MS.get(interval, 60_000)
+        for index, ohlcv in enumerate(candles):
+            close_time = _START_MS + index * step
+            self._frames.append(kline_frame(symbol, interval, close_time, ohlcv, closed=False))
+            self._frames.append(kline_frame(symbol, interval, close_time, ohlcv, closed=True))
+        self._heartbeat = dict(self._frames[-1], k=dict(self._frames[-1]['k'], x=False))
+        self._next = 0
+
+    async def __aenter__(self) -> "FakeKlineStream":
+        return self
+
+    async def __aexit__(self, _exc_type, _exc_val, _exc_tb) -> bool:
+        return False
+
+    async def recv(self) -> dict:
+        """Return the next frame after one cadence tick."""
+        await asyncio.sleep(self.cadence)
+        if self.drop_after is not None and self._next >= self.drop_after:
+            raise ConnectionError("Fake kline stream dropped")
+        if self._next < len(self._frames):
+            frame = self._frames[self._next]
+            self._next += 1
+            return frame
+        return self._heartbeat
+
+
+class FakeBinanceSocketManager:
+    """Drop-in for BinanceSocketManager that serves FakeKlineStreams."""
+
+    candles = DEFAULT_CANDLES
+    cadence = 0.005  # Seconds between frames
+    drop_first_after: Optional[int] = None  # Frames before the first stream drops
+
+    def __init__(self, client: "FakeAsyncClient"):
+        self.client = client
+        self.streams_opened = 0
+
+    def kline_futures_socket(self, symbol: str, interval: str) -> FakeKlineStream:
+        """Open a fake futures kline stream."""
+        drop_after = self.drop_first_after if self.streams_opened == 0 else None
+        self.streams_opened += 1
+        return FakeKlineStream(symbol, interval, self.candles, self.cadence, drop_after)
+
+    kline_socket = kline_futures_socket
+
+
+class FakeAsyncClient:
+    """Drop-in for AsyncClient that never touches the network."""
+
+    def __init__(self, api_key: str, api_secret: str, testnet: bool):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.testnet = testnet
+        self.closed = False
+
+    @classmethod
+    async def create(
+        cls,
+        api_key: str = None,
+        api_secret: str = None,
+        testnet: bool = False
+    ) -> "FakeAsyncClient":
+        """Mirror AsyncClient.create()."""
+        return cls(api_key, api_secret, testnet)
+
+    async def close_connection(self) -> None:
+        """Mirror AsyncClient.close_connection()."""
+        self.closed = True
@@ -0,0 +1,27 @@
+"""
+Shared helpers for integration tests that run a BinanceWebSocket stream.
+"""
+
+import asyncio
+
+from src.data.websocket_client import BinanceWebSocket
+
+
+async def drain_stream(
+    ws: BinanceWebSocket,
+    stream_task: asyncio.Task,
+    timeout: float = 0.5
+) -> None:
+    """
+    Stop a running kline stream and reap its task.
+
+    stop() clears the running flag, and start_kline_stream() returns after
+    the next received frame, so the task normally finishes well within
+    timeout. If it does not, wait_for() cancels it and waits for the
+    cancellation to finish.
+    """
+    await ws.stop()
+    try:
+        await asyncio.wait_for(stream_task, timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
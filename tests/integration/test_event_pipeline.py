@@ -4,7 +4,7 @@ Integration tests for full event processing pipeline.
 Tests cover the complete event flow:
 CANDLE_CLOSED → PatternProcessor → ORDER_BLOCK/FVG_DETECTED
              → SignalProcessor → ENTRY_SIGNAL
-             → OrderProcessor → ORDER_PLACED → ORDER_FILLED → POSITION_CLOSED
+             → OrderProcessor → ORDER_PLACED_FILLED → POSITION_CLOSED
 
 Verifies:
 - End-to-end event flow
@@ -16,8 +16,10 @@ Verifies:
 import pytest
 import pytest_asyncio
 import asyncio
+import os
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import chain, repeat
+from typing import List, Dict
 
 from src.core.event_bus import EventBus, Event, EventType
 from src.core.event_processor import EventOrchestrator
@@ -26,16 +28,27 @@ from src.processors.signal_processor import SignalProcessor
 from src.processors.order_processor import OrderProcessor
 
 
-@pytest_asyncio.fixture
-async def event_pipeline():
+# Every test runs on the module's event loop, where the shared pipeline lives
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# FAST_TEST_BUS=1 runs the pipeline on an inline-dispatch bus for quicker
+# dev-loop iterations; tests that rely on queued concurrency are skipped
+FAST_TEST_BUS = os.getenv("FAST_TEST_BUS") == "1"
+
+# Snapshot of the enum members, iterated when building the tracker's buckets
+_ALL_EVENT_TYPES = tuple(EventType)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_pipeline():
     """
-    Create full event processing pipeline with all components.
+    Create full event processing pipeline with all components, once per module.
 
     Returns:
-        Tuple: (event_bus, orchestrator, event_tracker)
+        Tuple: (event_bus, orchestrator, event_tracker, processors)
     """
     # Create event bus
-    bus = EventBus()
+    bus = EventBus(inline_dispatch=FAST_TEST_BUS)
     await bus.start()
 
     # Create orchestrator
@@ -45,10 +58,10 @@ async def event_pipeline():
     pattern_processor = PatternProcessor(bus)
     signal_processor = SignalProcessor(bus)
     order_processor = OrderProcessor(bus, config={"auto_close_positions": True})
+    processors = (pattern_processor, signal_processor, order_processor)
 
-    orchestrator.register(pattern_processor)
-    orchestrator.register(signal_processor)
-    orchestrator.register(order_processor)
+    for processor in processors:
+        orchestrator.register(processor)
 
     # Start all processors
     await orchestrator.start_all()
@@ -57,7 +70,7 @@ async def event_pipeline():
     event_tracker = EventTracker(bus)
     await event_tracker.start()
 
-    yield bus, orchestrator, event_tracker
+    yield bus, orchestrator, event_tracker, processors
 
     # Cleanup
     await orchestrator.stop_all()
@@ -65,28 +78,83 @@ async def event_pipeline():
     await bus.stop()
 
 
+@pytest_asyncio.fixture(loop_scope="module")
+async def event_pipeline(shared_pipeline):
+    """
+    Hand a test the shared pipeline with clean processor and tracker state.
+
+    Waits for anything still queued by the previous test, then resets every
+    processor and clears the tracker, so counts in each test start at zero.
+
+    Returns:
+        Tuple: (event_bus, orchestrator, event_tracker)
+    """
+    bus, orchestrator, tracker, processors = shared_pipeline
+
+    await tracker.wait_idle()
+    for processor in processors:
+        processor.reset()
+    tracker.clear()
+
+    yield bus, orchestrator, tracker
+
+
 class EventTracker:
-    """Helper class to track all events for verification."""
+    """
+    Helper class to track all events for verification.
+
+    Tests wait on completion instead of sleeping: wait_for() returns once
+    enough events of a type have arrived, and wait_idle() once the bus has
+    dispatched everything queued, including events published downstream.
+    """
 
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
         self.events: Dict[EventType, List[Event]] = {
-            event_type: [] for event_type in EventType
+            event_type: [] for event_type in _ALL_EVENT_TYPES
         }
+        self._arrived = asyncio.Condition()
 
     async def start(self):
         """Subscribe to all event types."""
-        for event_type in EventType:
-            self.event_bus.subscribe(event_type, self._track_event)
+        self.event_bus.subscribe_all(self._track_event)
 
     async def stop(self):
         """Unsubscribe from all event types."""
-        for event_type in EventType:
-            self.event_bus.unsubscribe(event_type, self._track_event)
+        self.event_bus.unsubscribe_all(self._track_event)
 
     async def _track_event(self, event: Event):
         """Track received event."""
-        self.events[event.event_type].append(event)
+        async with self._arrived:
+            self.events[event.event_type].append(event)
+            self._arrived.notify_all()
+
+    async def wait_for(
+        self,
+        event_type: EventType,
+        count: int = 1,
+        timeout: float = 2.0
+    ) -> bool:
+        """
+        Wait until count events of event_type have been tracked.
+
+        Returns:
+            bool: True if the count was reached before the timeout
+        """
+        events = self.events[event_type]
+        try:
+            async with self._arrived:
+                await asyncio.wait_for(
+                    self._arrived.wait_for(lambda: len(events) >= count),
+                    timeout=timeout
+                )
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def wait_idle(self, timeout: float = 2.0) -> None:
+        """Wait until every queued event, and any event it caused, is dispatched."""
+        await asyncio.wait_for(self.event_bus.drain(), timeout=timeout)
 
     def get_events(self, event_type: EventType) -> List[Event]:
         """Get all events of a specific type."""
@@ -98,83 +166,104 @@ class EventTracker:
 
     def clear(self):
         """Clear all tracked events."""
-        for event_type in EventType:
-            self.events[event_type].clear()
+        for events in self.events.values():
+            events.clear()
 
 
-def create_bullish_candle_setup() -> List[Dict[str, Any]]:
-    """
-    Create 3-candle setup that should trigger bullish Order Block and FVG.
+# Candle fixtures are built once at import and shared by every test. The
+# processors never mutate candle payloads or depend on timestamps advancing,
+# so one fixed timestamp is enough; no test asserts on wall-clock time.
+_BASE_TS = datetime(2024, 1, 1)
+
+# 3-candle setup that should trigger bullish Order Block and FVG
+_BULLISH_CANDLES = (
+    # Candle 0 - Setup for FVG
+    {
+        "symbol": "BTCUSDT",
+        "open": 44000.0,
+        "high": 44200.0,
+        "low": 43900.0,
+        "close": 44100.0,
+        "volume": 100.0,
+        "timestamp": _BASE_TS,
+    },
+    # Candle 1 - Strong bullish candle (creates Order Block)
+    {
+        "symbol": "BTCUSDT",
+        "open": 44100.0,
+        "high": 45500.0,  # Large body
+        "low": 44000.0,
+        "close": 45200.0,  # Strong close
+        "volume": 500.0,  # High volume
+        "timestamp": _BASE_TS,
+    },
+    # Candle 2 - Creates FVG with candle 0
+    {
+        "symbol": "BTCUSDT",
+        "open": 45200.0,
+        "high": 45400.0,
+        "low": 44500.0,  # Gap: candle[0].high (44200) < candle[2].low (44500)
+        "close": 45300.0,
+        "volume": 200.0,
+        "timestamp": _BASE_TS,
+    },
+)
+
+# Single candle: no FVG possible, but might create Order Block
+_LONE_CANDLE = {
+    "symbol": "BTCUSDT",
+    "open": 44000.0,
+    "high": 45000.0,
+    "low": 43900.0,
+    "close": 44800.0,
+    "volume": 500.0,
+    "timestamp": _BASE_TS,
+}
+
+# Invalid candle (should be handled gracefully)
+_INVALID_CANDLE = {
+    "symbol": "BTCUSDT",
+    "open": -100,  # Invalid negative price
+    "high": 45000.0,
+    "low": 43900.0,
+    "close": 44800.0,
+    "volume": 500.0,
+    "timestamp": _BASE_TS,
+}
+
+# Publisher tasks allowed in flight at once by the concurrent burst test
+_MAX_CONCURRENT_PUBLISHERS = 16
+
+# Plain candle repeated by the performance test
+_PERF_CANDLE = {
+    "symbol": "BTCUSDT",
+    "open": 44000.0,
+    "high": 44500.0,
+    "low": 43900.0,
+    "close": 44300.0,
+    "volume": 100.0,
+    "timestamp": _BASE_TS,
+}
+
 
-    Returns:
-        List of candle data dictionaries
-    """
-    base_time = datetime.utcnow()
-
-    candles = [
-        # Candle 0 - Setup for FVG
-        {
-            "symbol": "BTCUSDT",
-            "open": 44000.0,
-            "high": 44200.0,
-            "low": 43900.0,
-            "close": 44100.0,
-            "volume": 100.0,
-            "timestamp": base_time
-        },
-        # Candle 1 - Strong bullish candle (creates Order Block)
-        {
-            "symbol": "BTCUSDT",
-            "open": 44100.0,
-            "high": 45500.0,  # Large body
-            "low": 44000.0,
-            "close": 45200.0,  # Strong close
-            "volume": 500.0,  # High volume
-            "timestamp": base_time
-        },
-        # Candle 2 - Creates FVG with candle 0
-        {
-            "symbol": "BTCUSDT",
-            "open": 45200.0,
-            "high": 45400.0,
-            "low": 44500.0,  # Gap: candle[0].high (44200) < candle[2].low (44500)
-            "close": 45300.0,
-            "volume": 200.0,
-            "timestamp": base_time
-        },
-    ]
-
-    return candles
-
-
-@pytest.mark.asyncio
 async def test_full_pipeline_bullish_signal(event_pipeline):
     """Test complete pipeline from candle to order placement (bullish)."""
     bus, orchestrator, tracker = event_pipeline
 
-    # Create bullish candle setup
-    candles = create_bullish_candle_setup()
+    # Enqueue candles without yielding; the queue keeps publication order
+    for candle_data in _BULLISH_CANDLES:
+        bus.publish_nowait(Event(EventType.CANDLE_CLOSED, candle_data, "test"))
 
-    # Emit candles
-    for candle_data in candles:
-        event = Event(
-            EventType.CANDLE_CLOSED,
-            candle_data,
-            "test"
-        )
-        await bus.publish(event)
-        await asyncio.sleep(0.1)  # Allow processing
-
-    # Wait for full pipeline processing
-    await asyncio.sleep(0.5)
+    # Dispatch the whole cascade, then check it reached its terminal event
+    await tracker.wait_idle()
+    assert await tracker.wait_for(EventType.POSITION_CLOSED)
 
     # Verify events were emitted in correct order
     assert tracker.event_count(EventType.CANDLE_CLOSED) == 3
     assert tracker.event_count(EventType.ORDER_BLOCK_DETECTED) >= 1
     assert tracker.event_count(EventType.FVG_DETECTED) >= 1
     assert tracker.event_count(EventType.ENTRY_SIGNAL) >= 1
-    assert tracker.event_count(EventType.ORDER_PLACED) >= 1
-    assert tracker.event_count(EventType.ORDER_FILLED) >= 1
+    assert tracker.event_count(EventType.ORDER_PLACED_FILLED) >= 1
     assert tracker.event_count(EventType.POSITION_CLOSED) >= 1  # Auto-closed
 
     # Verify signal data integrity
@@ -188,7 +277,7 @@ async def test_full_pipeline_bullish_signal(event_pipeline):
     assert signal_data["confidence"] >= 70
 
     # Verify order data integrity
-    orders = tracker.get_events(EventType.ORDER_PLACED)
+    orders = tracker.get_events(EventType.ORDER_PLACED_FILLED)
     assert len(orders) > 0
     order_data = orders[0].data
     assert order_data["side"] == "long"
@@ -197,21 +286,28 @@ async def test_full_pipeline_bullish_signal(event_pipeline):
     assert order_data["take_profit"] == signal_data["take_profit"]
 
 
-@pytest.mark.asyncio
+@pytest.mark.skipif(FAST_TEST_BUS, reason="inline-dispatch bus does not exercise concurrency")
 async def test_pipeline_concurrent_candles(event_pipeline):
     """Test pipeline handles multiple concurrent candles."""
     bus, orchestrator, tracker = event_pipeline
 
-    # Emit multiple candle sets concurrently
-    candle_sets = [create_bullish_candle_setup() for _ in range(3)]
+    # Emit multiple candle sets as a burst of concurrent publishers, with at
+    # most _MAX_CONCURRENT_PUBLISHERS in flight at once
+    publish_slots = asyncio.Semaphore(_MAX_CONCURRENT_PUBLISHERS)
 
-    for candle_set in candle_sets:
-        for candle_data in candle_set:
-            event = Event(EventType.CANDLE_CLOSED, candle_data, "test")
+    async def publish(event: Event) -> None:
+        async with publish_slots:
             await bus.publish(event)
 
+    await asyncio.gather(*(
+        publish(Event(EventType.CANDLE_CLOSED, candle_data, "test"))
+        for candle_data in chain.from_iterable(repeat(_BULLISH_CANDLES, 3))
+    ))
+
     # Wait for processing
-    await asyncio.sleep(1.0)
+    assert await tracker.wait_for(EventType.CANDLE_CLOSED, 9)
+    assert await tracker.wait_for(EventType.ENTRY_SIGNAL)
+    await tracker.wait_idle()
 
     # Should process all candles without loss
     assert tracker.event_count(EventType.CANDLE_CLOSED) == 9  # 3 sets * 3 candles
@@ -219,14 +315,10 @@ async def test_pipeline_concurrent_candles(event_pipeline):
     assert tracker.event_count(EventType.ENTRY_SIGNAL) >= 1
 
 
-@pytest.mark.asyncio
 async def test_pipeline_event_order(event_pipeline):
     """Test events are processed in correct order."""
     bus, orchestrator, tracker = event_pipeline
 
-    # Create candle setup
-    candles = create_bullish_candle_setup()
-
     # Track event timestamps
     event_times = []
 
@@ -234,17 +326,21 @@ async def test_pipeline_event_order(event_pipeline):
     async def time_tracker(event: Event):
         event_times.append((event.event_type, event.timestamp))
 
-    for event_type in EventType:
-        bus.subscribe(event_type, time_tracker)
+    bus.subscribe_all(time_tracker)
 
-    # Emit candles
-    for candle_data in candles:
-        event = Event(EventType.CANDLE_CLOSED, candle_data, "test")
-        await bus.publish(event)
-        await asyncio.sleep(0.1)
+    try:
+        # Emit candles in one batch; the queue keeps publication order
+        await bus.publish_batch(
+            Event(EventType.CANDLE_CLOSED, candle_data, "test")
+            for candle_data in _BULLISH_CANDLES
+        )
 
-    # Wait for processing
-    await asyncio.sleep(0.5)
+        # Wait for the pipeline to reach its terminal event
+        assert await tracker.wait_for(EventType.POSITION_CLOSED)
+        await tracker.wait_idle()
+    finally:
+        # The bus is shared with later tests
+        bus.unsubscribe_all(time_tracker)
 
     # Verify logical event order (timestamps should be ascending for same flow)
     # CANDLE_CLOSED should come before ORDER_BLOCK_DETECTED
@@ -255,27 +351,15 @@ async def test_pipeline_event_order(event_pipeline):
         assert min(ob_times) >= min(candle_times)
 
 
-@pytest.mark.asyncio
 async def test_pipeline_no_signal_without_confluence(event_pipeline):
     """Test signal processor doesn't emit without pattern confluence."""
     bus, orchestrator, tracker = event_pipeline
 
     # Emit single candle (no FVG possible, but might create Order Block)
-    candle_data = {
-        "symbol": "BTCUSDT",
-        "open": 44000.0,
-        "high": 45000.0,
-        "low": 43900.0,
-        "close": 44800.0,
-        "volume": 500.0,
-        "timestamp": datetime.utcnow()
-    }
-
-    event = Event(EventType.CANDLE_CLOSED, candle_data, "test")
-    await bus.publish(event)
+    bus.publish_nowait(Event(EventType.CANDLE_CLOSED, _LONE_CANDLE, "test"))
 
-    # Wait for processing
-    await asyncio.sleep(0.5)
+    # Wait for processing, including any pattern events it triggers
+    await tracker.wait_idle()
 
     # Should process candle
     assert tracker.event_count(EventType.CANDLE_CLOSED) == 1
@@ -284,34 +368,18 @@ async def test_pipeline_no_signal_without_confluence(event_pipeline):
     assert tracker.event_count(EventType.ENTRY_SIGNAL) == 0
 
 
-@pytest.mark.asyncio
 async def test_pipeline_error_resilience(event_pipeline):
     """Test pipeline continues processing despite errors."""
     bus, orchestrator, tracker = event_pipeline
 
-    # Emit invalid candle (should be handled gracefully)
-    invalid_candle = {
-        "symbol": "BTCUSDT",
-        "open": -100,  # Invalid negative price
-        "high": 45000.0,
-        "low": 43900.0,
-        "close": 44800.0,
-        "volume": 500.0,
-        "timestamp": datetime.utcnow()
-    }
-
-    invalid_event = Event(EventType.CANDLE_CLOSED, invalid_candle, "test")
-    await bus.publish(invalid_event)
-    await asyncio.sleep(0.2)
+    # Emit the invalid candle followed by valid candles in one batch
+    await bus.publish_batch(
+        Event(EventType.CANDLE_CLOSED, candle_data, "test")
+        for candle_data in (_INVALID_CANDLE, *_BULLISH_CANDLES)
+    )
 
-    # Then emit valid candles
-    valid_candles = create_bullish_candle_setup()
-    for candle_data in valid_candles:
-        event = Event(EventType.CANDLE_CLOSED, candle_data, "test")
-        await bus.publish(event)
-        await asyncio.sleep(0.1)
-
-    await asyncio.sleep(0.5)
+    assert await tracker.wait_for(EventType.ENTRY_SIGNAL, timeout=1.0)
+    await tracker.wait_idle()
 
     # Should process valid candles despite invalid one
     assert tracker.event_count(EventType.CANDLE_CLOSED) == 4  # 1 invalid + 3 valid
@@ -319,7 +387,6 @@ async def test_pipeline_error_resilience(event_pipeline):
     assert tracker.event_count(EventType.ENTRY_SIGNAL) >= 1
 
 
-@pytest.mark.asyncio
 async def test_pipeline_processor_states(event_pipeline):
     """Test all processors maintain correct state."""
     bus, orchestrator, tracker = event_pipeline
@@ -328,19 +395,15 @@ async def test_pipeline_processor_states(event_pipeline):
     assert orchestrator.running_count == 3
 
     # Emit candles to generate activity
-    candles = create_bullish_candle_setup()
-    for candle_data in candles:
-        event = Event(EventType.CANDLE_CLOSED, candle_data, "test")
-        await bus.publish(event)
-        await asyncio.sleep(0.1)
+    for candle_data in _BULLISH_CANDLES:
+        bus.publish_nowait(Event(EventType.CANDLE_CLOSED, candle_data, "test"))
 
-    await asyncio.sleep(0.5)
+    await tracker.wait_idle()
 
     # Processors should still be running after activity
     assert orchestrator.running_count == 3
 
 
-@pytest.mark.asyncio
 async def test_pipeline_performance(event_pipeline):
     """Test pipeline processes events within acceptable time."""
     bus, orchestrator, tracker = event_pipeline
@@ -348,21 +411,12 @@ async def test_pipeline_performance(event_pipeline):
     # Emit large number of candles
     start_time = asyncio.get_event_loop().time()
 
-    for _ in range(10):
-        candle_data = {
-            "symbol": "BTCUSDT",
-            "open": 44000.0,
-            "high": 44500.0,
-            "low": 43900.0,
-            "close": 44300.0,
-            "volume": 100.0,
-            "timestamp": datetime.utcnow()
-        }
-        event = Event(EventType.CANDLE_CLOSED, candle_data, "test")
-        await bus.publish(event)
+    events = [Event(EventType.CANDLE_CLOSED, _PERF_CANDLE, "test") for _ in range(10)]
+    await bus.publish_batch(events)
 
     # Wait for processing
-    await asyncio.sleep(1.0)
+    assert await tracker.wait_for(EventType.CANDLE_CLOSED, 10)
+    await tracker.wait_idle()
 
     end_time = asyncio.get_event_loop().time()
     elapsed = end_time - start_time
@@ -0,0 +1,216 @@
+"""
+BinanceWebSocket event flow tests against a fake Binance transport.
+
+These tests exercise the real connect, kline stream, reconnect, CANDLE_CLOSED
+publishing and shutdown code paths, but AsyncClient and
+BinanceSocketManager are replaced by the fakes in fake_bsm.py. Precanned
+kline frames arrive a few milliseconds apart, so payload-shape and
+interval checks that used to wait minutes for testnet candles run in well
+under a second and need no credentials or network.
+
+End-to-end coverage against the real testnet stays in
+test_binance_testnet_integration.py.
+"""
+
+import pytest
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from collections import deque
+from typing import Deque
+
+from src.core.event_bus import EventBus, Event, EventType
+from src.data.websocket_client import BinanceWebSocket
+from src.strategy.patterns import validate_candles
+from tests.integration.fake_bsm import (
+    DEFAULT_CANDLES,
+    FakeAsyncClient,
+    FakeBinanceSocketManager,
+)
+from tests.integration.stream_helpers import drain_stream
+
+
+@pytest.fixture
+def fake_binance(monkeypatch):
+    """Swap the Binance transport for fakes and provide dummy credentials."""
+    monkeypatch.setattr("src.data.websocket_client.AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(
+        "src.data.websocket_client.BinanceSocketManager", FakeBinanceSocketManager
+    )
+    monkeypatch.setenv("BINANCE_TESTNET_API_KEY", "fake-testnet-key")
+    monkeypatch.setenv("BINANCE_TESTNET_API_SECRET", "fake-testnet-secret")
+
+
+@pytest.fixture(scope="session")
+def config_path():
+    """Use the project config.yaml (use_testnet: true)."""
+    config_file = Path(__file__).parent.parent.parent / "config.yaml"
+    if not config_file.exists():
+        pytest.skip(f"Configuration file not found: {config_file}")
+    return str(config_file)
+
+
+async def _run_candle_capture(
+    config_path: str,
+    interval: str,
+    target: int,
+    timeout: float
+) -> Deque[Event]:
+    """
+    Stream fake candles through a BinanceWebSocket until target events arrive.
+
+    Subscribes a collector, connects, runs start_kline_stream() until target
+    CANDLE_CLOSED events have been published (or timeout expires), then stops
+    the stream and drains the EventBus so late events would still be counted.
+    Only the most recent target * 4 events are kept, so memory stays bounded
+    however fast the stream runs.
+    """
+    event_bus = EventBus()
+    await event_bus.start()
+
+    received_events: Deque[Event] = deque(maxlen=target * 4)
+    done = asyncio.Event()
+
+    async def event_handler(event: Event):
+        received_events.append(event)
+        if len(received_events) >= target:
+            done.set()
+
+    event_bus.subscribe(EventType.CANDLE_CLOSED, event_handler)
+
+    try:
+        async with BinanceWebSocket(
+            event_bus=event_bus,
+            symbol='BTCUSDT',
+            interval=interval,
+            config_path=config_path
+        ) as ws:
+            stream_task = asyncio.create_task(ws.start_kline_stream())
+            try:
+                await asyncio.wait_for(done.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            await drain_stream(ws, stream_task)
+    finally:
+        await event_bus.stop()
+
+    return received_events
+
+
+class TestFakeCandleClosedEventFlow:
+    """Test CANDLE_CLOSED publishing, intervals and payload shape without the testnet."""
+
+    @pytest.mark.parametrize("interval,target,timeout", [
+        ('1m', len(DEFAULT_CANDLES), 5.0),
+        ('5m', len(DEFAULT_CANDLES), 5.0),
+    ])
+    async def test_candle_closed_events_published(
+        self, fake_binance, config_path, interval, target, timeout
+    ):
+        """Test one CANDLE_CLOSED event per closed frame, tagged with the interval."""
+        received_events = await _run_candle_capture(config_path, interval, target, timeout)
+
+        assert len(received_events) == target
+        for event in received_events:
+            assert event.event_type == EventType.CANDLE_CLOSED
+            assert event.source == 'BinanceWebSocket'
+            assert event.data['interval'] == interval
+
+    async def test_event_data_structure_validation(self, fake_binance, config_path):
+        """
+        Test that CANDLE_CLOSED event data contains all required OHLCV fields.
+
+        Validates field presence and types on the first event, then OHLCV
+        relationships and the parsed float values across all events as
+        columns rather than event by event.
+        """
+        received_events = await _run_candle_capture(
+            config_path, '1m', len(DEFAULT_CANDLES), 5.0
+        )
+
+        assert len(received_events) == len(DEFAULT_CANDLES), "No candle events received"
+
+        # Field presence and types are fixed by _handle_kline, so check the
+        # first event only
+        data = received_events[0].data
+        required_fields = ['symbol', 'interval', 'open', 'high', 'low', 'close', 'volume', 'timestamp']
+        for field in required_fields:
+            assert field in data, f"Missing required field: {field}"
+
+        assert isinstance(data['symbol'], str)
+        assert isinstance(data['interval'], str)
+        assert isinstance(data['open'], float)
+        assert isinstance(data['high'], float)
+        assert isinstance(data['low'], float)
+        assert isinstance(data['close'], float)
+        assert isinstance(data['volume'], float)
+        assert isinstance(data['timestamp'], datetime)
+
+        # Validate OHLCV relationships column by column
+        columns = {
+            field: [event.data[field] for event in received_events]
+            for field in ('open', 'high', 'low', 'close', 'volume')
+        }
+        opens, highs, lows, closes, volumes = columns.values()
+        assert all(validate_candles(columns))
+        assert all(map(lambda h, o, c: h >= max(o, c), highs, opens, closes))
+        assert all(map(lambda l, o, c: l <= min(o, c), lows, opens, closes))
+        assert min(volumes) >= 0
+
+        # Validate parsed values, symbol and interval
+        assert list(zip(opens, highs, lows, closes, volumes)) == DEFAULT_CANDLES
+        assert {event.data['symbol'] for event in received_events} == {'BTCUSDT'}
+        assert {event.data['interval'] for event in received_events} == {'1m'}
+
+
+class TestFakeReconnection:
+    """Test stream recovery after a dropped connection."""
+
+    async def test_stream_reconnects_after_disconnect(
+        self, fake_binance, config_path, monkeypatch
+    ):
+        """
+        Test that start_kline_stream() reopens the stream after it drops.
+
+        The first fake stream drops after delivering one closed candle; the
+        reconnect attempt opens a fresh stream that replays every candle.
+        Backoff is zeroed so the retry happens immediately.
+        """
+        monkeypatch.setattr(FakeBinanceSocketManager, "drop_first_after", 2)
+
+        event_bus = EventBus()
+        await event_bus.start()
+
+        target = len(DEFAULT_CANDLES) + 1
+        received_events: Deque[Event] = deque(maxlen=target * 4)
+        done = asyncio.Event()
+
+        async def event_handler(event: Event):
+            received_events.append(event)
+            if len(received_events) >= target:
+                done.set()
+
+        event_bus.subscribe(EventType.CANDLE_CLOSED, event_handler)
+
+        try:
+            async with BinanceWebSocket(
+                event_bus=event_bus,
+                symbol='BTCUSDT',
+                interval='1m',
+                config_path=config_path
+            ) as ws:
+                monkeypatch.setattr(ws, "_calculate_backoff", lambda attempt: 0.0)
+                stream_task = asyncio.create_task(ws.start_kline_stream(max_retries=3))
+
+                await asyncio.wait_for(done.wait(), timeout=5.0)
+
+                await ws.stop()
+                await asyncio.wait_for(stream_task, timeout=5.0)
+
+                assert ws.bsm.streams_opened == 2
+        finally:
+            await event_bus.stop()
+
+        closes = [event.data['close'] for event in received_events]
+        assert closes == [DEFAULT_CANDLES[0][3]] + [candle[3] for candle in DEFAULT_CANDLES]
@@ -12,12 +12,28 @@ including:
 import asyncio
 import pytest
 import os
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
+
+from binance import AsyncClient
 
 from src.core.event_bus import EventBus
 from src.data.websocket_client import BinanceWebSocket
 
 
+# Closed kline frame returned by the fake stream, built once
+_CLOSED_KLINE_FRAME = {
+    'k': {
+        'o': '45000.0',
+        'h': '45100.0',
+        'l': '44900.0',
+        'c': '45050.0',
+        'v': '100.5',
+        'x': True,
+        'T': 1234567890000
+    }
+}
+
+
 @pytest.fixture
 def event_bus():
     """Create EventBus instance for testing."""
@@ -31,6 +47,24 @@ def mock_env(monkeypatch):
     monkeypatch.setenv('BINANCE_TESTNET_API_SECRET', 'test_secret')
 
 
+@pytest.fixture
+def patched_ws_deps():
+    """
+    Patch AsyncClient and BinanceSocketManager in the websocket client module.
+
+    Yields:
+        Tuple: (mock_client, mock_client_cls, mock_bsm_cls), where
+        mock_client_cls.create() resolves to mock_client
+    """
+    with patch('src.data.websocket_client.AsyncClient') as mock_client_cls, \
+         patch('src.data.websocket_client.BinanceSocketManager') as mock_bsm_cls:
+        # spec limits the mock to AsyncClient's real API, so a misspelt
+        # method raises AttributeError instead of passing silently
+        mock_client = AsyncMock(spec=AsyncClient)
+        mock_client_cls.create = AsyncMock(return_value=mock_client)
+        yield mock_client, mock_client_cls, mock_bsm_cls
+
+
 @pytest.fixture
 def websocket_client(event_bus, mock_env):
     """Create BinanceWebSocket instance for testing."""
@@ -87,7 +121,9 @@ class TestGracefulShutdown:
         assert websocket_client._running is False
 
     @pytest.mark.asyncio
-    async def test_context_manager_entry_connects(self, event_bus, mock_env):
+    async def test_context_manager_entry_connects(
+        self, event_bus, mock_env, patched_ws_deps
+    ):
         """
         Test that async context manager calls connect() on entry.
 
@@ -95,19 +131,15 @@ class TestGracefulShutdown:
         - __aenter__ establishes connection
         - Connection is ready for use
         """
-        with patch('src.data.websocket_client.AsyncClient') as mock_client_cls, \
-             patch('src.data.websocket_client.BinanceSocketManager'):
-
-            mock_client = AsyncMock()
-            mock_client_cls.create = AsyncMock(return_value=mock_client)
-
-            # Use context manager
-            async with BinanceWebSocket(event_bus, 'BTCUSDT', '15m') as ws:
-                # Inside context - should be connected
-                assert ws.is_connected is True
+        # Use context manager
+        async with BinanceWebSocket(event_bus, 'BTCUSDT', '15m') as ws:
+            # Inside context - should be connected
+            assert ws.is_connected is True
 
     @pytest.mark.asyncio
-    async def test_context_manager_exit_disconnects(self, event_bus, mock_env):
+    async def test_context_manager_exit_disconnects(
+        self, event_bus, mock_env, patched_ws_deps
+    ):
         """
         Test that async context manager calls disconnect() on exit.
 
@@ -116,22 +148,18 @@ class TestGracefulShutdown:
         - AsyncClient.close_connection() is called
         - Resources are properly released
         """
-        with patch('src.data.websocket_client.AsyncClient') as mock_client_cls, \
-             patch('src.data.websocket_client.BinanceSocketManager'):
-
-            mock_client = AsyncMock()
-            mock_client_cls.create = AsyncMock(return_value=mock_client)
+        mock_client, _, _ = patched_ws_deps
 
-            # Use context manager
-            async with BinanceWebSocket(event_bus, 'BTCUSDT', '15m') as ws:
-                pass  # Connection should happen here
+        # Use context manager
+        async with BinanceWebSocket(event_bus, 'BTCUSDT', '15m') as ws:
+            pass  # Connection should happen here
 
-            # Outside context - should be disconnected
-            assert ws.is_connected is False
-            mock_client.close_connection.assert_called_once()
+        # Outside context - should be disconnected
+        assert ws.is_connected is False
+        mock_client.close_connection.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_stream_loop_checks_running_flag(self, websocket_client):
+    async def test_stream_loop_checks_running_flag(self, websocket_client, patched_ws_deps):
         """
         Test that stream loop exits when _running becomes False.
 
@@ -142,55 +170,40 @@ class TestGracefulShutdown:
         message_count = 0
         max_messages = 5
 
-        async def mock_recv():
-            nonlocal message_count
-            message_count += 1
-
-            # Stop after a few messages
-            if message_count >= max_messages:
-                websocket_client._running = False
-
-            return {
-                'k': {
-                    'o': '45000.0',
-                    'h': '45100.0',
-                    'l': '44900.0',
-                    'c': '45050.0',
-                    'v': '100.5',
-                    'x': True,
-                    'T': 1234567890000
-                }
-            }
-
-        with patch('src.data.websocket_client.AsyncClient') as mock_client_cls, \
-             patch('src.data.websocket_client.BinanceSocketManager') as mock_bsm_cls:
-
-            mock_client = AsyncMock()
-            mock_client_cls.create = AsyncMock(return_value=mock_client)
-
-            mock_stream = AsyncMock()
-            mock_stream.recv = mock_recv
-
-            mock_bsm = MagicMock()
-            mock_bsm.kline_futures_socket = MagicMock()
-            mock_bsm.kline_futures_socket.return_value.__aenter__ = AsyncMock(
-                return_value=mock_stream
-            )
-            mock_bsm.kline_futures_socket.return_value.__aexit__ = AsyncMock()
-            mock_bsm_cls.return_value = mock_bsm
-
-            # Connect
-            await websocket_client.connect()
-
-            # Start stream - should exit after max_messages
-            await websocket_client.start_kline_stream(max_retries=1)
-
-            # Verify loop exited after processing messages
-            assert message_count == max_messages
-            assert websocket_client._running is False
+        class _FakeStream:
+            """Plain async context manager serving a constant closed-kline frame."""
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def recv(self):
+                nonlocal message_count
+                message_count += 1
+
+                # Stop after a few messages
+                if message_count >= max_messages:
+                    websocket_client._running = False
+
+                return _CLOSED_KLINE_FRAME
+
+        _, _, mock_bsm_cls = patched_ws_deps
+        mock_bsm_cls.return_value.kline_futures_socket = lambda **_kwargs: _FakeStream()
+
+        # Connect
+        await websocket_client.connect()
+
+        # Start stream - should exit after max_messages
+        await websocket_client.start_kline_stream(max_retries=1)
+
+        # Verify loop exited after processing messages
+        assert message_count == max_messages
+        assert websocket_client._running is False
 
     @pytest.mark.asyncio
-    async def test_no_resource_leak_after_disconnect(self, websocket_client):
+    async def test_no_resource_leak_after_disconnect(self, websocket_client, patched_ws_deps):
         """
         Test that no resource leaks occur after disconnect.
 
@@ -199,23 +212,19 @@ class TestGracefulShutdown:
         - BinanceSocketManager is cleared
         - Connection state is clean
         """
-        with patch('src.data.websocket_client.AsyncClient') as mock_client_cls, \
-             patch('src.data.websocket_client.BinanceSocketManager'):
-
-            mock_client = AsyncMock()
-            mock_client_cls.create = AsyncMock(return_value=mock_client)
-
-            # Connect and disconnect
-            await websocket_client.connect()
-            await websocket_client.disconnect()
+        # Connect and disconnect
+        await websocket_client.connect()
+        await websocket_client.disconnect()
 
-            # Verify no resource leaks
-            assert websocket_client.client is None
-            assert websocket_client.bsm is None
-            assert websocket_client._running is False
+        # Verify no resource leaks
+        assert websocket_client.client is None
+        assert websocket_client.bsm is None
+        assert websocket_client._running is False
 
     @pytest.mark.asyncio
-    async def test_context_manager_exception_propagation(self, event_bus, mock_env):
+    async def test_context_manager_exception_propagation(
+        self, event_bus, mock_env, patched_ws_deps
+    ):
         """
         Test that __aexit__ doesn't suppress exceptions.
 
@@ -223,17 +232,13 @@ class TestGracefulShutdown:
         - Exceptions in context are propagated
         - Cleanup still happens
         """
-        with patch('src.data.websocket_client.AsyncClient') as mock_client_cls, \
-             patch('src.data.websocket_client.BinanceSocketManager'):
-
-            mock_client = AsyncMock()
-            mock_client_cls.create = AsyncMock(return_value=mock_client)
+        mock_client, _, _ = patched_ws_deps
 
-            # Exception should propagate
-            with pytest.raises(ValueError):
-                async with BinanceWebSocket(event_bus, 'BTCUSDT', '15m') as ws:
-                    raise ValueError("Test exception")
+        # Exception should propagate
+        with pytest.raises(ValueError):
+            async with BinanceWebSocket(event_bus, 'BTCUSDT', '15m'):
+                raise ValueError("Test exception")
 
-            # Cleanup should still have happened
-            mock_client.close_connection.assert_called_once()
+        # Cleanup should still have happened
+        mock_client.close_connection.assert_called_once()
 
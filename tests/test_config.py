@@ -3,31 +3,96 @@ Test suite for configuration file validation.
 Tests .env and config.yaml parsing and required keys.
 """
 
-import os
-import yaml
 import pytest
+from dataclasses import dataclass
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Any, Dict
+from dotenv import dotenv_values
+from yaml import load as yaml_load
+
+# Prefer the libyaml C parser; fall back to pure Python when PyYAML was
+# built without it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+PROJECT_ROOT = Path(__file__).parent.parent
+ENV_EXAMPLE_PATH = PROJECT_ROOT / ".env.example"
+CONFIG_YAML_PATH = PROJECT_ROOT / "config.yaml"
+
+
+def _is_positive_number(value: Any) -> bool:
+    """Return True for a positive int or float (bools excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
+def _is_positive_int(value: Any) -> bool:
+    """Return True for a positive int (bools excluded)."""
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+# (key, predicate, failure message) checks against the parsed config.yaml
+CONFIG_VALUE_CASES = [
+    pytest.param(
+        'symbol', lambda v: v == 'BTCUSDT',
+        "symbol should be the string BTCUSDT for initial setup",
+        id='symbol'
+    ),
+    pytest.param(
+        'interval', lambda v: v == '15m',
+        "interval should be the string 15m for initial setup",
+        id='interval'
+    ),
+    pytest.param(
+        'use_testnet', lambda v: v is True,
+        "use_testnet should be True for initial setup",
+        id='use_testnet'
+    ),
+    *(
+        pytest.param(param, _is_positive_number, f"{param} should be a positive number", id=param)
+        for param in (
+            'risk_per_trade',
+            'max_daily_loss_percent',
+            'max_position_percent',
+            'min_body_ratio',
+            'fvg_min_gap_percent',
+        )
+    ),
+    pytest.param(
+        'max_trades_per_day', _is_positive_int,
+        "max_trades_per_day should be a positive integer",
+        id='max_trades_per_day'
+    ),
+]
+
+
+@dataclass(frozen=True)
+class ConfigFiles:
+    """Contents of the configuration files, read once per test class."""
+
+    env_content: str
+    config: Dict[str, Any]
 
 
 class TestConfigurationFiles:
     """Test configuration file structure and parsing."""
 
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Set up test environment."""
-        self.project_root = Path(__file__).parent.parent
-        self.env_example_path = self.project_root / ".env.example"
-        self.config_yaml_path = self.project_root / "config.yaml"
+    @pytest.fixture(scope="class")
+    def config_files(self) -> ConfigFiles:
+        """Read .env.example and parse config.yaml once for the whole class."""
+        env_content = ENV_EXAMPLE_PATH.read_text()
+        with open(CONFIG_YAML_PATH, 'r') as f:
+            config = yaml_load(f, _Loader)
+        return ConfigFiles(env_content=env_content, config=config)
 
     def test_env_example_exists(self):
         """Test that .env.example file exists."""
-        assert self.env_example_path.exists(), ".env.example file not found"
+        assert ENV_EXAMPLE_PATH.exists(), ".env.example file not found"
 
-    def test_env_example_has_required_keys(self):
+    def test_env_example_has_required_keys(self, config_files):
         """Test that .env.example contains all required environment variables."""
-        with open(self.env_example_path, 'r') as f:
-            content = f.read()
+        content = config_files.env_content
 
         # Testnet API keys (required)
         testnet_keys = [
@@ -52,50 +117,35 @@ class TestConfigurationFiles:
             assert key in content, f"Required key '{key}' not found in .env.example"
 
     def test_env_example_loads_without_error(self):
-        """Test that .env.example can be loaded by python-dotenv."""
-        # Create a temporary .env file for testing
-        temp_env = self.project_root / ".env.test"
-        try:
-            # Copy .env.example to .env.test
-            with open(self.env_example_path, 'r') as src:
-                with open(temp_env, 'w') as dst:
-                    dst.write(src.read())
-
-            # Load the temporary .env file
-            load_dotenv(temp_env)
-
-            # Verify we can read the testnet variables (even if they're placeholder values)
-            assert os.getenv('BINANCE_TESTNET_API_KEY') is not None
-            assert os.getenv('BINANCE_TESTNET_API_SECRET') is not None
-
-            # Verify we can read the mainnet variables
-            assert os.getenv('BINANCE_MAINNET_API_KEY') is not None
-            assert os.getenv('BINANCE_MAINNET_API_SECRET') is not None
-
-            # Verify Discord webhook
-            assert os.getenv('DISCORD_WEBHOOK_URL') is not None
-
-        finally:
-            # Clean up temporary file
-            if temp_env.exists():
-                temp_env.unlink()
+        """Test that .env.example can be parsed by python-dotenv."""
+        # Parse in place; nothing is copied or written to os.environ
+        values = dotenv_values(ENV_EXAMPLE_PATH)
+
+        # Verify we can read the testnet variables (even if they're placeholder values)
+        assert values.get('BINANCE_TESTNET_API_KEY') is not None
+        assert values.get('BINANCE_TESTNET_API_SECRET') is not None
+
+        # Verify we can read the mainnet variables
+        assert values.get('BINANCE_MAINNET_API_KEY') is not None
+        assert values.get('BINANCE_MAINNET_API_SECRET') is not None
+
+        # Verify Discord webhook
+        assert values.get('DISCORD_WEBHOOK_URL') is not None
 
     def test_config_yaml_exists(self):
         """Test that config.yaml file exists."""
-        assert self.config_yaml_path.exists(), "config.yaml file not found"
+        assert CONFIG_YAML_PATH.exists(), "config.yaml file not found"
 
-    def test_config_yaml_parses_correctly(self):
+    def test_config_yaml_parses_correctly(self, config_files):
         """Test that config.yaml can be parsed by PyYAML."""
-        with open(self.config_yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = config_files.config
 
         assert config is not None, "config.yaml failed to parse"
         assert isinstance(config, dict), "config.yaml should parse to a dictionary"
 
-    def test_config_yaml_has_required_keys(self):
+    def test_config_yaml_has_required_keys(self, config_files):
         """Test that config.yaml contains all required configuration keys."""
-        with open(self.config_yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = config_files.config
 
         # Required top-level keys
         required_keys = [
@@ -113,56 +163,8 @@ class TestConfigurationFiles:
         for key in required_keys:
             assert key in config, f"Required key '{key}' not found in config.yaml"
 
-    def test_config_yaml_symbol_format(self):
-        """Test that symbol is in correct format."""
-        with open(self.config_yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
-
-        symbol = config.get('symbol')
-        assert isinstance(symbol, str), "symbol should be a string"
-        assert symbol == 'BTCUSDT', "symbol should be BTCUSDT for initial setup"
-
-    def test_config_yaml_interval_format(self):
-        """Test that interval is in correct format."""
-        with open(self.config_yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
-
-        interval = config.get('interval')
-        assert isinstance(interval, str), "interval should be a string"
-        assert interval == '15m', "interval should be 15m for initial setup"
-
-    def test_config_yaml_use_testnet_is_true(self):
-        """Test that use_testnet is set to true for safety."""
-        with open(self.config_yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
-
-        use_testnet = config.get('use_testnet')
-        assert isinstance(use_testnet, bool), "use_testnet should be a boolean"
-        assert use_testnet is True, "use_testnet should be True for initial setup"
-
-    def test_config_yaml_risk_parameters_are_numeric(self):
-        """Test that all risk parameters are numeric values."""
-        with open(self.config_yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
-
-        numeric_params = [
-            'risk_per_trade',
-            'max_daily_loss_percent',
-            'max_position_percent',
-            'min_body_ratio',
-            'fvg_min_gap_percent'
-        ]
-
-        for param in numeric_params:
-            value = config.get(param)
-            assert isinstance(value, (int, float)), f"{param} should be numeric"
-            assert value > 0, f"{param} should be positive"
-
-    def test_config_yaml_max_trades_is_integer(self):
-        """Test that max_trades_per_day is an integer."""
-        with open(self.config_yaml_path, 'r') as f:
-            config = yaml.safe_load(f)
-
-        max_trades = config.get('max_trades_per_day')
-        assert isinstance(max_trades, int), "max_trades_per_day should be an integer"
-        assert max_trades > 0, "max_trades_per_day should be positive"
+    @pytest.mark.parametrize("key,predicate,message", CONFIG_VALUE_CASES)
+    def test_config_yaml_value(self, config_files, key, predicate, message):
+        """Test that each config.yaml value has the expected type and range."""
+        value = config_files.config.get(key)
+        assert predicate(value), message
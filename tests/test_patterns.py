@@ -5,13 +5,23 @@ Tests cover normal cases, edge cases, and error handling for all
 pattern analysis utility functions.
 """
 
+import random
+
 import pytest
 from src.strategy.patterns import (
     validate_candle_data,
     calculate_body_ratio,
     is_bullish_candle,
     is_bearish_candle,
-    get_candle_body_size
+    get_candle_body_size,
+    validate_candles,
+    calculate_body_ratios,
+    is_bullish_candles,
+    is_bearish_candles,
+    get_candle_body_sizes,
+    analyze_candle,
+    analyze_candles,
+    CandleSeries
 )
 
 
@@ -215,6 +225,151 @@ class TestGetCandleBodySize:
         assert abs(get_candle_body_size(candle) - 2.7) < 0.0001
 
 
+class TestAnalyzeCandle:
+    """Test suite for analyze_candle function."""
+
+    def test_matches_individual_helpers(self):
+        """Test fused metrics equal the individual helper results."""
+        candle = {'open': 100.0, 'high': 110.0, 'low': 95.0, 'close': 105.0}
+        assert analyze_candle(candle) == {
+            'valid': True,
+            'body_ratio': calculate_body_ratio(candle),
+            'body_size': get_candle_body_size(candle),
+            'is_bullish': True,
+            'is_bearish': False,
+        }
+
+    def test_invalid_data(self):
+        """Test invalid candles report zero metrics and no direction."""
+        candle = {'open': 100.0, 'high': 95.0, 'low': 105.0, 'close': 103.0}
+        result = analyze_candle(candle)
+        assert result['valid'] is False
+        assert result['body_ratio'] == 0.0
+        assert result['is_bullish'] is False
+
+
+class TestColumnHelpers:
+    """Test suite for the column-oriented candle helpers."""
+
+    CANDLES = [
+        {'open': 100.0, 'high': 110.0, 'low': 95.0, 'close': 105.0},
+        {'open': 100.0, 'high': 100.0, 'low': 100.0, 'close': 100.0},
+        {'open': 100.0, 'high': 95.0, 'low': 105.0, 'close': 103.0},
+        {'open': 100.0, 'high': 105.0, 'low': 99.0, 'close': 98.0},
+    ]
+
+    @staticmethod
+    def to_columns(candles):
+        return {field: [c[field] for c in candles] for field in ('open', 'high', 'low', 'close')}
+
+    def test_matches_scalar_helpers(self):
+        """Test column results equal the per-candle helpers row by row."""
+        columns = self.to_columns(self.CANDLES)
+        assert validate_candles(columns) == [validate_candle_data(c) for c in self.CANDLES]
+        assert calculate_body_ratios(columns) == [calculate_body_ratio(c) for c in self.CANDLES]
+        assert is_bullish_candles(columns) == [is_bullish_candle(c) for c in self.CANDLES]
+        assert is_bearish_candles(columns) == [is_bearish_candle(c) for c in self.CANDLES]
+        assert get_candle_body_sizes(columns) == [get_candle_body_size(c) for c in self.CANDLES]
+
+    def test_matches_scalar_helpers_on_large_sample(self):
+        """Test parity with the per-candle helpers on 10k random candles."""
+        rng = random.Random(42)
+        candles = []
+        for _ in range(10_000):
+            open_price, close = rng.uniform(90, 110), rng.uniform(90, 110)
+            # A negative spread can invert the candle (high < low)
+            spread = rng.uniform(-1, 10)
+            high = max(open_price, close) + spread
+            low = min(open_price, close) - spread
+            candles.append({'open': open_price, 'high': high, 'low': low, 'close': close})
+        candles.append({'open': 100.0, 'high': float('nan'), 'low': 95.0, 'close': 103.0})
+
+        columns = self.to_columns(candles)
+        assert validate_candles(columns) == [validate_candle_data(c) for c in candles]
+        assert calculate_body_ratios(columns) == [calculate_body_ratio(c) for c in candles]
+        assert is_bullish_candles(columns) == [is_bullish_candle(c) for c in candles]
+        assert is_bearish_candles(columns) == [is_bearish_candle(c) for c in candles]
+        assert get_candle_body_sizes(columns) == [get_candle_body_size(c) for c in candles]
+
+    def test_analyze_candles_matches_analyze_candle(self):
+        """Test the fused column scan equals analyze_candle row by row."""
+        rng = random.Random(7)
+        candles = []
+        for _ in range(5_000):
+            open_price, close = rng.uniform(90, 110), rng.uniform(90, 110)
+            spread = rng.uniform(-1, 10)
+            candles.append({
+                'open': open_price,
+                'high': max(open_price, close) + spread,
+                'low': min(open_price, close) - spread,
+                'close': close,
+            })
+        candles.append({'open': 100.0, 'high': 100.0, 'low': 100.0, 'close': 100.0})
+        expected = [analyze_candle(c) for c in candles]
+
+        for columns in (self.to_columns(candles), CandleSeries.from_candles(candles)):
+            result = analyze_candles(columns)
+            assert [dict(zip(result, row)) for row in zip(*result.values())] == expected
+
+    def test_analyze_candles_non_numeric_fallback(self):
+        """Test analyze_candles falls back per row on non-numeric columns."""
+        candles = self.CANDLES + [{'open': 'invalid', 'high': 105.0, 'low': 95.0, 'close': 103.0}]
+        result = analyze_candles(self.to_columns(candles))
+        assert result['valid'] == [True, True, False, True, False]
+        assert result['body_size'][-1] == 0.0
+
+    def test_non_numeric_values_fall_back(self):
+        """Test a non-numeric value only invalidates its own row."""
+        candles = self.CANDLES + [{'open': 'invalid', 'high': 105.0, 'low': 95.0, 'close': 103.0}]
+        columns = self.to_columns(candles)
+        assert validate_candles(columns) == [True, True, False, True, False]
+        assert calculate_body_ratios(columns)[-1] == 0.0
+        assert is_bullish_candles(columns)[-1] is False
+        assert is_bearish_candles(columns)[-1] is False
+        assert get_candle_body_sizes(columns)[-1] == 0.0
+
+    def test_missing_column(self):
+        """Test a missing OHLC column raises KeyError."""
+        with pytest.raises(KeyError):
+            validate_candles({'open': [100.0], 'high': [105.0], 'low': [95.0]})
+
+    @pytest.mark.parametrize("helper", [
+        validate_candles,
+        calculate_body_ratios,
+        is_bullish_candles,
+        is_bearish_candles,
+        get_candle_body_sizes,
+        analyze_candles,
+    ])
+    @pytest.mark.parametrize("opens", [[1, 2, 3], [1, 'invalid', 3]], ids=['numeric', 'fallback'])
+    def test_unequal_columns_raise(self, helper, opens):
+        """Test ragged columns raise ValueError instead of being truncated."""
+        with pytest.raises(ValueError):
+            helper({'open': opens, 'high': [5, 5], 'low': [0], 'close': [2, 2, 2]})
+
+    def test_candle_series_matches_columns(self):
+        """Test a CandleSeries gives the same results as plain columns."""
+        series = CandleSeries.from_candles(self.CANDLES)
+        columns = self.to_columns(self.CANDLES)
+
+        assert len(series) == len(self.CANDLES)
+        assert CandleSeries.from_columns(columns) == series
+        assert validate_candles(series) == validate_candles(columns)
+        assert calculate_body_ratios(series) == calculate_body_ratios(columns)
+        assert is_bullish_candles(series) == is_bullish_candles(columns)
+        assert is_bearish_candles(series) == is_bearish_candles(columns)
+        assert get_candle_body_sizes(series) == get_candle_body_sizes(columns)
+
+    def test_candle_series_rejects_bad_input(self):
+        """Test CandleSeries rejects non-numeric values and ragged columns."""
+        with pytest.raises(ValueError):
+            CandleSeries.from_candles([{'open': 'invalid', 'high': 105.0, 'low': 95.0, 'close': 103.0}])
+        with pytest.raises(ValueError):
+            CandleSeries.from_columns({'open': [100.0, 101.0], 'high': [105.0], 'low': [95.0], 'close': [103.0]})
+        with pytest.raises(KeyError):
+            CandleSeries.from_candles([])['volume']
+
+
 class TestIntegrationScenarios:
     """Integration tests combining multiple helper functions."""
 
@@ -249,3 +404,18 @@ class TestIntegrationScenarios:
         assert get_candle_body_size(candle) == 1.0
         # Small body ratio (1/10 = 0.1)
         assert calculate_body_ratio(candle) == 0.1
+
+    def test_scenarios_match_candle_series(self):
+        """Test the scenario candles give identical results through a CandleSeries."""
+        candles = [
+            {'open': 100.0, 'high': 110.0, 'low': 99.0, 'close': 109.0},
+            {'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 99.0},
+            {'open': 100.0, 'high': 105.0, 'low': 95.0, 'close': 101.0},
+        ]
+        series = CandleSeries.from_candles(candles)
+
+        assert validate_candles(series) == [validate_candle_data(c) for c in candles]
+        assert is_bullish_candles(series) == [is_bullish_candle(c) for c in candles]
+        assert is_bearish_candles(series) == [is_bearish_candle(c) for c in candles]
+        assert get_candle_body_sizes(series) == [get_candle_body_size(c) for c in candles]
+        assert calculate_body_ratios(series) == [calculate_body_ratio(c) for c in candles]
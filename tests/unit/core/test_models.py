@@ -12,7 +12,7 @@ Tests cover:
 import pytest
 from datetime import datetime
 from pydantic import ValidationError
-from src.core.models import OrderBlock, FVG, Position
+from src.core.models import OrderBlock, FVG, Position, Side, Direction
 
 
 class TestOrderBlock:
@@ -455,3 +455,26 @@ class TestPosition:
                 stop_loss=44500.0,
                 take_profit=46000.0
             )
+
+
+class TestSide:
+    """Test Side integer direction encoding."""
+
+    def test_side_values(self):
+        """Test LONG/SHORT map to 0/1."""
+        assert Side.LONG == 0
+        assert Side.SHORT == 1
+
+    def test_side_sign_arithmetic(self):
+        """Test branchless sign expression yields +1/-1."""
+        assert 1 - 2 * Side.LONG == 1
+        assert 1 - 2 * Side.SHORT == -1
+
+
+class TestDirection:
+    """Test Direction integer pattern encoding."""
+
+    def test_direction_values(self):
+        """Test BULLISH/BEARISH map to 0/1."""
+        assert Direction.BULLISH == 0
+        assert Direction.BEARISH == 1
@@ -0,0 +1,451 @@
+"""
+Unit tests for OrderProcessor.
+
+Tests cover:
+- Order placement and simulated fills from ENTRY_SIGNAL events
+- Integer-keyed position storage and lookup by public order ID
+- Auto-close lifecycle
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+
+from src.core.event_bus import EventBus, Event, EventType
+from src.core.models import Side
+from src.processors.order_processor import (
+    OrderProcessor,
+    _validate_prices,
+    _validate_prices_batch,
+)
+
+
+def make_signal(**overrides):
+    """Build a valid long ENTRY_SIGNAL payload."""
+    signal = {
+        "direction": "long",
+        "entry_price": 45000.0,
+        "stop_loss": 44500.0,
+        "take_profit": 46000.0,
+        "confidence": 80.0,
+    }
+    signal.update(overrides)
+    return signal
+
+
+@pytest_asyncio.fixture
+async def event_bus():
+    """Provide a started EventBus."""
+    bus = EventBus()
+    await bus.start()
+    yield bus
+    await bus.stop()
+
+
+@pytest_asyncio.fixture
+async def processor(event_bus):
+    """Provide a started OrderProcessor."""
+    proc = OrderProcessor(event_bus)
+    await proc.start()
+    yield proc
+    await proc.stop()
+
+
+class TestOrderPlacement:
+    """Test order placement and position tracking."""
+
+    async def test_signal_creates_position(self, processor):
+        """Test a valid signal places, fills and tracks a position."""
+        await processor._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+
+        assert processor.orders_placed_count == 1
+        assert processor.orders_filled_count == 1
+        assert processor.open_positions_count == 1
+
+    async def test_invalid_signal_is_ignored(self, processor):
+        """Test an invalid signal does not place an order."""
+        await processor._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(stop_loss=46000.0), "test")
+        )
+
+        assert processor.orders_placed_count == 0
+        assert processor.open_positions_count == 0
+
+    async def test_get_position_by_string_and_int_id(self, processor):
+        """Test positions are retrievable by "order_N" and by N."""
+        await processor._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+
+        position = processor.get_position("order_1")
+        assert position is not None
+        assert position.side == "long"
+        assert processor.get_position(1) is position
+
+    async def test_get_position_unknown_id(self, processor):
+        """Test unknown or malformed IDs return None."""
+        await processor._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+
+        assert processor.get_position("order_99") is None
+        assert processor.get_position("bogus") is None
+        assert processor.get_position("order_x") is None
+
+
+class TestPositionLifecycle:
+    """Test position auto-close behaviour."""
+
+    async def test_auto_close_removes_position(self, event_bus):
+        """Test auto-closed positions are removed from tracking."""
+        proc = OrderProcessor(event_bus, config={"auto_close_positions": True})
+        await proc.start()
+
+        await proc._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+
+        assert proc.positions_closed_count == 1
+        assert proc.open_positions_count == 0
+        assert proc.get_position("order_1") is None
+
+        await proc.stop()
+
+    async def test_accessors_before_start(self, event_bus):
+        """Test accessors work on a processor that was never started."""
+        proc = OrderProcessor(event_bus)
+
+        assert proc.open_positions_count == 0
+        assert proc.get_position("order_1") is None
+
+    async def test_restart_clears_positions(self, event_bus):
+        """Test restarting the processor drops previously tracked positions."""
+        proc = OrderProcessor(event_bus)
+        await proc.start()
+        await proc._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+        positions = proc._positions
+
+        await proc.stop()
+        await proc.start()
+
+        assert proc.open_positions_count == 0
+        assert proc._positions is positions
+
+        await proc.stop()
+
+    async def test_restart_resets_order_ids(self, event_bus):
+        """Test order numbering starts again from 1 after a restart."""
+        proc = OrderProcessor(event_bus)
+        await proc.start()
+        await proc._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+        await proc.stop()
+
+        await proc.start()
+        await proc._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+
+        assert proc.get_position("order_1") is not None
+
+        await proc.stop()
+
+    async def test_reset_clears_positions_and_counters(self, processor):
+        """Test reset drops positions and restarts order ids without a restart."""
+        await processor._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+        assert processor.orders_placed_count == 1
+
+        processor.reset()
+
+        assert processor.open_positions_count == 0
+        assert processor.orders_placed_count == 0
+        assert processor.orders_filled_count == 0
+        assert processor.positions_closed_count == 0
+
+        await processor._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+        assert processor.get_position("order_1") is not None
+
+    def test_reset_before_start_raises(self, event_bus):
+        """Test reset requires initialized state, like the other processors."""
+        with pytest.raises(RuntimeError):
+            OrderProcessor(event_bus).reset()
+
+
+class TestCommission:
+    """Test simulated commission calculation."""
+
+    async def test_default_commission(self, event_bus):
+        """Test default commission is 0.1% of the fixed position size."""
+        proc = OrderProcessor(event_bus)
+        await proc.start()
+        fills = []
+
+        async def on_fill(event):
+            fills.append(event)
+
+        event_bus.subscribe(EventType.ORDER_PLACED_FILLED, on_fill)
+        await proc._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+        await event_bus.stop()
+
+        assert len(fills) == 1
+        assert fills[0].data["commission"] == pytest.approx(0.1 * 0.001)
+        await proc.stop()
+
+    async def test_configured_commission_rate(self, event_bus):
+        """Test commission_rate config overrides the default."""
+        proc = OrderProcessor(
+            event_bus, config={"max_position_size": 0.5, "commission_rate": 0.002}
+        )
+        await proc.start()
+        fills = []
+
+        async def on_fill(event):
+            fills.append(event)
+
+        event_bus.subscribe(EventType.ORDER_PLACED_FILLED, on_fill)
+        await proc._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+        await event_bus.stop()
+
+        assert fills[0].data["filled_size"] == 0.5
+        assert fills[0].data["commission"] == pytest.approx(0.5 * 0.002)
+        await proc.stop()
+
+
+class TestPriceValidation:
+    """Test the numeric signal price validator."""
+
+    @pytest.mark.parametrize("direction,entry,sl,tp,expected", [
+        (Side.LONG, 100.0, 99.0, 102.0, True),
+        (Side.LONG, 100.0, 101.0, 102.0, False),
+        (Side.LONG, 100.0, 99.0, 100.0, False),
+        (Side.SHORT, 100.0, 101.0, 98.0, True),
+        (Side.SHORT, 100.0, 99.0, 98.0, False),
+        (Side.SHORT, 100.0, 101.0, 100.0, False),
+        (Side.LONG, -1.0, 99.0, 102.0, False),
+    ])
+    def test_validate_prices(self, direction, entry, sl, tp, expected):
+        """Test SL/TP placement rules per direction."""
+        assert _validate_prices(direction, entry, sl, tp) is expected
+
+    def test_validate_prices_batch(self):
+        """Test batch validation matches per-signal results."""
+        results = _validate_prices_batch(
+            [Side.LONG, Side.SHORT, Side.LONG],
+            [100.0, 100.0, 100.0],
+            [99.0, 101.0, 101.0],
+            [102.0, 98.0, 102.0],
+        )
+        assert results == [True, True, False]
+
+
+class TestSlots:
+    """Test OrderProcessor uses __slots__ for its state."""
+
+    def test_no_instance_dict(self):
+        """Test instances carry no per-instance __dict__."""
+        proc = OrderProcessor(EventBus())
+        assert not hasattr(proc, "__dict__")
+
+
+class TestTimestamps:
+    """Test event payload timestamps."""
+
+    async def test_payload_timestamps_are_int_nanoseconds(self, event_bus, processor):
+        """Test order and fill payloads carry time_ns() integers."""
+        received = []
+
+        async def on_event(event):
+            received.append(event)
+
+        event_bus.subscribe(EventType.ORDER_PLACED_FILLED, on_event)
+        before = time.time_ns()
+        await processor._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+        await event_bus.stop()
+
+        assert len(received) == 1
+        for event in received:
+            assert isinstance(event.data["timestamp"], int)
+            assert event.data["timestamp"] >= before
+        assert isinstance(processor.get_position(1).timestamp, datetime)
+
+
+class TestFillEvents:
+    """Test which events a simulated fill publishes."""
+
+    async def _collect(self, event_bus, proc):
+        received = []
+
+        async def on_event(event):
+            received.append(event.event_type)
+
+        for event_type in (
+            EventType.ORDER_PLACED,
+            EventType.ORDER_FILLED,
+            EventType.ORDER_PLACED_FILLED,
+        ):
+            event_bus.subscribe(event_type, on_event)
+        await proc.start()
+        await proc._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+        await event_bus.stop()
+        await proc.stop()
+        return received
+
+    async def test_simulation_publishes_combined_event(self, event_bus):
+        """Test simulated fills publish a single ORDER_PLACED_FILLED."""
+        received = await self._collect(event_bus, OrderProcessor(event_bus))
+        assert received == [EventType.ORDER_PLACED_FILLED]
+
+    async def test_legacy_fill_events(self, event_bus):
+        """Test emit_legacy_fill_events restores ORDER_PLACED + ORDER_FILLED."""
+        proc = OrderProcessor(event_bus, config={"emit_legacy_fill_events": True})
+        received = await self._collect(event_bus, proc)
+        assert received == [EventType.ORDER_PLACED, EventType.ORDER_FILLED]
+
+    async def test_no_simulation_publishes_order_placed_only(self, event_bus):
+        """Test disabling simulation publishes ORDER_PLACED without a fill."""
+        proc = OrderProcessor(event_bus, config={"enable_simulation": False})
+        received = await self._collect(event_bus, proc)
+        assert received == [EventType.ORDER_PLACED]
+
+    async def test_unsubscribed_events_are_not_published(self, event_bus):
+        """Test events without subscribers are never queued."""
+        published = []
+        original_publish = event_bus.publish
+
+        async def spy(event):
+            published.append(event.event_type)
+            await original_publish(event)
+
+        event_bus.publish = spy
+        proc = OrderProcessor(event_bus, config={"auto_close_positions": True})
+        await proc.start()
+        await proc._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+        await proc.stop()
+
+        assert published == []
+        assert proc.positions_closed_count == 1
+
+
+class TestClosePnl:
+    """Test realized P&L on auto-close."""
+
+    @pytest.mark.parametrize("signal,expected_pnl", [
+        (make_signal(), (46000.0 - 45000.0) * 0.1),
+        (
+            make_signal(direction="short", stop_loss=45500.0, take_profit=44000.0),
+            (45000.0 - 44000.0) * 0.1,
+        ),
+    ])
+    async def test_pnl_sign_per_side(self, event_bus, signal, expected_pnl):
+        """Test P&L is positive at take profit for both longs and shorts."""
+        proc = OrderProcessor(event_bus, config={"auto_close_positions": True})
+        await proc.start()
+        closed = []
+
+        async def on_close(event):
+            closed.append(event)
+
+        event_bus.subscribe(EventType.POSITION_CLOSED, on_close)
+        await proc._on_entry_signal(Event(EventType.ENTRY_SIGNAL, signal, "test"))
+        await event_bus.stop()
+
+        assert closed[0].data["realized_pnl"] == pytest.approx(expected_pnl)
+        await proc.stop()
+
+
+class TestBacktestBatch:
+    """Test batch replay of historical signals."""
+
+    async def test_batch_results_and_counters(self, processor):
+        """Test valid signals are filled and closed, invalid ones skipped."""
+        result = await processor.process_signals_batch(
+            [Side.LONG, Side.SHORT, Side.LONG],
+            [100.0, 100.0, 100.0],
+            [99.0, 101.0, 101.0],
+            [102.0, 98.0, 102.0],
+        )
+
+        assert result["signals"] == 3
+        assert result["orders"] == 2
+        assert result["order_ids"] == ["order_1", "order_2"]
+        assert result["sides"] == [Side.LONG, Side.SHORT]
+        assert result["realized_pnl"] == pytest.approx([0.2, 0.2])
+        assert result["total_pnl"] == pytest.approx(0.4)
+        assert processor.orders_placed_count == 2
+        assert processor.positions_closed_count == 2
+        assert processor.open_positions_count == 0
+
+    async def test_batch_publishes_single_event(self, event_bus, processor):
+        """Test one BACKTEST_COMPLETED event is published per batch."""
+        received = []
+
+        async def on_event(event):
+            received.append(event)
+
+        event_bus.subscribe(EventType.BACKTEST_COMPLETED, on_event)
+        event_bus.subscribe(EventType.POSITION_CLOSED, on_event)
+
+        await processor.process_signals_batch(
+            [Side.LONG] * 5, [100.0] * 5, [99.0] * 5, [102.0] * 5
+        )
+        await event_bus.stop()
+
+        assert [e.event_type for e in received] == [EventType.BACKTEST_COMPLETED]
+        assert received[0].data["orders"] == 5
+
+    async def test_order_ids_continue_after_batch(self, processor):
+        """Test live orders keep numbering after a batch replay."""
+        await processor.process_signals_batch(
+            [Side.LONG], [100.0], [99.0], [102.0]
+        )
+        await processor._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(), "test")
+        )
+
+        assert processor.get_position("order_2") is not None
+
+
+class TestErrorPath:
+    """Test errors raised on the order path."""
+
+    async def test_failure_publishes_error_event(self, event_bus, processor):
+        """Test an exception is reported as an ERROR event with its type."""
+        errors = []
+
+        async def on_error(event):
+            errors.append(event)
+
+        event_bus.subscribe(EventType.ERROR, on_error)
+
+        # Non-numeric prices make price validation raise TypeError
+        await processor._on_entry_signal(
+            Event(EventType.ENTRY_SIGNAL, make_signal(entry_price="bad"), "test")
+        )
+        await event_bus.stop()
+
+        assert len(errors) == 1
+        assert errors[0].data["error_type"] == "TypeError"
+        assert errors[0].data["component"] == "OrderProcessor"
+        assert errors[0].data["context"] == "entry_signal_processing"
+        assert processor.orders_placed_count == 0
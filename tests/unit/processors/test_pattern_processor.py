@@ -0,0 +1,350 @@
+"""
+Unit tests for PatternProcessor.
+
+Tests cover:
+- Rolling candle high/low window
+- Order Block detection from a single candle
+- Fair Value Gap detection from the last three candles
+- TTL expiry of detected patterns
+- Batch detection over candle columns
+- Pure Order Block / FVG arithmetic kernels
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from src.core.event_bus import EventBus, Event, EventType
+from src.core.models import OrderBlock
+from src.processors.pattern_processor import PatternProcessor
+from src.processors._pattern_kernels import _ob_kernel, _fvg_kernel
+
+
+BASE_TIME = datetime(2024, 1, 1)
+
+
+def make_candle(open_, high, low, close, minute=0, volume=100.0):
+    """Build a CANDLE_CLOSED payload."""
+    return {
+        "symbol": "BTCUSDT",
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+        "timestamp": BASE_TIME + timedelta(minutes=minute),
+    }
+
+
+def doji(price, minute=0):
+    """Build a small-bodied candle that never forms an Order Block."""
+    return make_candle(price, price + 10.0, price - 10.0, price + 1.0, minute)
+
+
+@pytest_asyncio.fixture
+async def event_bus():
+    """Provide a started EventBus."""
+    bus = EventBus()
+    await bus.start()
+    yield bus
+    await bus.stop()
+
+
+@pytest_asyncio.fixture
+async def processor(event_bus):
+    """Provide a started PatternProcessor."""
+    proc = PatternProcessor(event_bus)
+    await proc.start()
+    yield proc
+    await proc.stop()
+
+
+async def feed(proc, *candles):
+    """Deliver candles to the processor in order."""
+    for candle in candles:
+        await proc._on_candle_closed(Event(EventType.CANDLE_CLOSED, candle, "test"))
+
+
+class TestCandleWindow:
+    """Test the rolling high/low window used for FVG detection."""
+
+    async def test_window_rolls_previous_two_candles(self, processor):
+        """Test the window holds the highs/lows of the last two candles."""
+        await feed(
+            processor,
+            make_candle(100.0, 110.0, 90.0, 105.0, minute=0),
+            make_candle(200.0, 210.0, 190.0, 205.0, minute=1),
+            make_candle(300.0, 310.0, 290.0, 305.0, minute=2),
+        )
+
+        assert (processor._prev2_high, processor._prev2_low) == (210.0, 190.0)
+        assert (processor._prev1_high, processor._prev1_low) == (310.0, 290.0)
+        assert processor.candle_count == 3
+
+    @pytest.mark.parametrize("overrides,expected", [
+        ({}, True),
+        ({"open": 0.0}, False),
+        ({"close": -1.0}, False),
+        ({"low": 0.0}, False),
+        ({"high": 80.0}, False),
+        ({"volume": -1.0}, False),
+        ({"volume": 0.0}, True),
+    ])
+    def test_validate_candle(self, event_bus, overrides, expected):
+        """Test the combined candle value predicate."""
+        candle = {**make_candle(100.0, 110.0, 90.0, 105.0), **overrides}
+
+        assert PatternProcessor(event_bus)._validate_candle(candle) is expected
+
+    def test_validate_candle_missing_field(self, event_bus):
+        """Test candles missing a required field are rejected."""
+        candle = make_candle(100.0, 110.0, 90.0, 105.0)
+        del candle["timestamp"]
+
+        assert PatternProcessor(event_bus)._validate_candle(candle) is False
+
+    async def test_invalid_candle_does_not_roll_window(self, processor):
+        """Test candles failing validation never reach the window."""
+        await feed(processor, make_candle(100.0, 90.0, 110.0, 105.0))
+
+        assert processor._prev1_high == 0.0
+        assert processor.candle_count == 0
+
+    async def test_history_size_does_not_limit_detection(self, event_bus):
+        """Test max_candle_history no longer bounds the FVG lookback."""
+        proc = PatternProcessor(event_bus, config={"max_candle_history": 1})
+        await proc.start()
+
+        await feed(proc, doji(100.0, 0), doji(105.0, 1), doji(130.0, 2))
+
+        assert proc.fvg_count == 1
+
+        await proc.stop()
+
+
+class TestReset:
+    """Test in-place state reset for backtest sweeps."""
+
+    async def test_reset_clears_state_without_reallocating(self, processor):
+        """Test reset empties the window and patterns but keeps the columns."""
+        await feed(
+            processor,
+            doji(100.0, 0), doji(105.0, 1),
+            make_candle(130.0, 141.0, 129.0, 140.0, minute=2),
+        )
+        assert processor.order_block_count == 1
+        assert processor.fvg_count == 1
+        patterns = processor._ob_patterns
+
+        processor.reset()
+
+        assert processor._ob_patterns is patterns
+        assert processor._prev1_high == processor._prev2_high == 0.0
+        assert processor.candle_count == 0
+        assert processor.order_block_count == 0
+        assert processor.fvg_count == 0
+
+        # History from before the reset must not leak into FVG detection
+        await feed(processor, doji(130.0, 3), doji(131.0, 4))
+        assert processor.fvg_count == 0
+
+    def test_reset_before_start_raises(self, event_bus):
+        """Test reset requires initialized state."""
+        with pytest.raises(RuntimeError):
+            PatternProcessor(event_bus).reset()
+
+
+class TestOrderBlockDetection:
+    """Test Order Block detection."""
+
+    async def test_strong_candle_detects_order_block(self, processor):
+        """Test a large-bodied candle is tracked as an Order Block."""
+        await feed(processor, make_candle(100.0, 111.0, 99.0, 110.0))
+
+        assert processor.order_block_count == 1
+
+    async def test_small_body_is_ignored(self, processor):
+        """Test a candle below the body ratio threshold is ignored."""
+        await feed(processor, doji(100.0))
+
+        assert processor.order_block_count == 0
+
+    async def test_event_carries_model_without_dump(self, event_bus, processor):
+        """Test the event payload holds the OrderBlock model itself."""
+        received = []
+
+        async def on_event(event):
+            received.append(event)
+
+        event_bus.subscribe(EventType.ORDER_BLOCK_DETECTED, on_event)
+        await feed(processor, make_candle(100.0, 111.0, 99.0, 110.0))
+        await event_bus.stop()
+
+        data = received[0].data
+        assert isinstance(data["order_block"], OrderBlock)
+        assert data["order_block"] is processor._ob_patterns[0]
+        assert (data["type"], data["top"], data["bottom"]) == ("bullish", 111.0, 99.0)
+
+    async def test_unsubscribed_detection_is_tracked_not_published(
+        self, event_bus, processor
+    ):
+        """Test detections without subscribers are tracked but never queued."""
+        published = []
+        original_publish = event_bus.publish
+
+        async def spy(event):
+            published.append(event.event_type)
+            await original_publish(event)
+
+        event_bus.publish = spy
+        await feed(processor, make_candle(100.0, 111.0, 99.0, 110.0))
+
+        assert published == []
+        assert processor.order_block_count == 1
+
+
+class TestFvgDetection:
+    """Test Fair Value Gap detection."""
+
+    @pytest.mark.parametrize("candles", [
+        # Bullish: candle 0 high below candle 2 low
+        [doji(100.0, 0), doji(105.0, 1), doji(130.0, 2)],
+        # Bearish: candle 0 low above candle 2 high
+        [doji(130.0, 0), doji(125.0, 1), doji(100.0, 2)],
+    ])
+    async def test_gap_detected(self, processor, candles):
+        """Test bullish and bearish gaps across three candles."""
+        await feed(processor, *candles)
+
+        assert processor.fvg_count == 1
+
+    async def test_overlapping_candles_have_no_gap(self, processor):
+        """Test overlapping ranges do not form an FVG."""
+        await feed(processor, doji(100.0, 0), doji(101.0, 1), doji(102.0, 2))
+
+        assert processor.fvg_count == 0
+
+    async def test_gap_uses_candle_two_steps_back(self, processor):
+        """Test the FVG lookback compares against the candle two steps back."""
+        await feed(
+            processor,
+            doji(100.0, 0), doji(100.0, 1),
+            doji(100.0, 2), doji(105.0, 3), doji(130.0, 4),
+        )
+
+        assert processor.fvg_count == 1
+        assert processor._fvg_patterns[0].bottom == 110.0
+
+
+class TestPatternExpiry:
+    """Test TTL-based pattern cleanup."""
+
+    async def test_patterns_expire_after_ttl(self, event_bus):
+        """Test patterns are evicted once older than pattern_ttl_candles."""
+        proc = PatternProcessor(event_bus, config={"pattern_ttl_candles": 2})
+        await proc.start()
+
+        await feed(proc, make_candle(100.0, 111.0, 99.0, 110.0, minute=0))
+        await feed(proc, doji(200.0, 1))
+        assert proc.order_block_count == 1
+
+        await feed(proc, doji(200.0, 2))
+        assert proc.order_block_count == 0
+        assert len(proc._ob_detected_at) == 0
+
+        await proc.stop()
+
+    async def test_only_expired_prefix_is_dropped(self, event_bus):
+        """Test newer patterns survive when older ones expire."""
+        proc = PatternProcessor(event_bus, config={"pattern_ttl_candles": 3})
+        await proc.start()
+
+        await feed(
+            proc,
+            make_candle(100.0, 111.0, 99.0, 110.0, minute=0),
+            make_candle(300.0, 311.0, 299.0, 310.0, minute=1),
+            doji(500.0, 2),
+            doji(500.0, 3),
+        )
+
+        assert proc.order_block_count == 1
+        assert proc._ob_patterns[0].top == 311.0
+        assert list(proc._ob_detected_at) == [2]
+
+        await proc.stop()
+
+
+class TestDetectBatch:
+    """Test batch pattern detection over a candle series."""
+
+    async def test_batch_matches_live_detection(self, event_bus, processor):
+        """Test batch results equal those found candle by candle."""
+        candles = [
+            doji(100.0, 0),
+            make_candle(105.0, 116.0, 104.0, 115.0, minute=1),
+            doji(130.0, 2),
+            doji(131.0, 3),
+            doji(100.0, 4),
+        ]
+        columns = [
+            [c[field] for c in candles]
+            for field in ("open", "high", "low", "close", "timestamp")
+        ]
+
+        order_blocks, fvgs = processor.detect_batch(*columns)
+        await feed(processor, *candles)
+
+        assert len(order_blocks) == processor.order_block_count == 1
+        assert len(fvgs) == processor.fvg_count == 3
+        assert order_blocks[0].timestamp == candles[1]["timestamp"]
+        assert [f.type for f in fvgs] == ["bullish", "bullish", "bearish"]
+
+    def test_batch_leaves_live_state_untouched(self, event_bus):
+        """Test batch detection does not touch history or counters."""
+        proc = PatternProcessor(event_bus)
+
+        order_blocks, fvgs = proc.detect_batch(
+            [100.0], [111.0], [99.0], [110.0], [BASE_TIME]
+        )
+
+        assert len(order_blocks) == 1
+        assert fvgs == []
+        assert proc.candle_count == 0
+
+
+class TestKernels:
+    """Test the scalar detection kernels."""
+
+    @pytest.mark.parametrize("ohlc,expected", [
+        ((100.0, 111.0, 99.0, 110.0), (True, True)),
+        ((110.0, 111.0, 99.0, 100.0), (True, False)),
+        ((100.0, 110.0, 90.0, 101.0), (False, True)),
+        ((100.0, 100.0, 100.0, 100.0), (False, False)),
+    ])
+    def test_ob_kernel(self, ohlc, expected):
+        """Test Order Block classification and zero-range handling."""
+        is_ob, is_bullish, top, bottom, _ = _ob_kernel(*ohlc, 0.6)
+
+        assert (is_ob, is_bullish) == expected
+        assert (top, bottom) == (ohlc[1], ohlc[2])
+
+    def test_fvg_kernel_bullish(self):
+        """Test a bullish gap spans candle 0 high to candle 2 low."""
+        result = _fvg_kernel(110.0, 90.0, 140.0, 120.0, 0.3)
+
+        assert result[:4] == (True, True, 120.0, 110.0)
+        assert result[4] == pytest.approx(10.0 / 115.0 * 100)
+
+    def test_fvg_kernel_bearish(self):
+        """Test a bearish gap spans candle 2 high to candle 0 low."""
+        assert _fvg_kernel(140.0, 120.0, 110.0, 90.0, 0.3)[:4] == (
+            True, False, 120.0, 110.0
+        )
+
+    def test_fvg_kernel_below_threshold(self):
+        """Test small gaps are reported but not flagged."""
+        is_fvg, is_bullish, *_ = _fvg_kernel(100.0, 90.0, 110.0, 100.1, 0.3)
+
+        assert is_fvg is False
+        assert is_bullish is True
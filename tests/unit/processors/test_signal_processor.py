@@ -0,0 +1,183 @@
+"""
+Unit tests for SignalProcessor.
+
+Tests cover:
+- Order Block + FVG confluence producing ENTRY_SIGNAL
+- Direction and proximity filtering
+- Timeout-based eviction and the pending-pattern memory ceiling
+- In-place state reset
+"""
+
+import pytest
+import pytest_asyncio
+
+from src.core.event_bus import EventBus, Event, EventType
+from src.core.models import Direction
+from src.processors import signal_processor
+from src.processors.signal_processor import SignalProcessor
+
+
+def pattern_event(event_type, pattern_type, bottom, top):
+    """Build an ORDER_BLOCK_DETECTED / FVG_DETECTED event."""
+    return Event(event_type, {"type": pattern_type, "top": top, "bottom": bottom}, "test")
+
+
+def ob_event(pattern_type, bottom, top):
+    """Build an ORDER_BLOCK_DETECTED event."""
+    return pattern_event(EventType.ORDER_BLOCK_DETECTED, pattern_type, bottom, top)
+
+
+def fvg_event(pattern_type, bottom, top):
+    """Build an FVG_DETECTED event."""
+    return pattern_event(EventType.FVG_DETECTED, pattern_type, bottom, top)
+
+
+@pytest_asyncio.fixture
+async def event_bus():
+    """Provide a started EventBus."""
+    bus = EventBus()
+    await bus.start()
+    yield bus
+    await bus.stop()
+
+
+@pytest_asyncio.fixture
+async def processor(event_bus):
+    """Provide a started SignalProcessor."""
+    proc = SignalProcessor(event_bus)
+    await proc.start()
+    yield proc
+    await proc.stop()
+
+
+class TestConfluence:
+    """Test signal generation from pattern confluence."""
+
+    async def test_overlapping_patterns_generate_signal(self, event_bus, processor):
+        """Test an overlapping same-direction pair yields one long signal."""
+        signals = []
+
+        async def on_signal(event):
+            signals.append(event.data)
+
+        event_bus.subscribe(EventType.ENTRY_SIGNAL, on_signal)
+
+        await processor._on_pattern_detected(ob_event("bullish", 44000.0, 44500.0))
+        await processor._on_pattern_detected(fvg_event("bullish", 44200.0, 44600.0))
+        await event_bus.stop()
+
+        assert processor.signal_count == 1
+        assert signals[0]["direction"] == "long"
+        assert signals[0]["entry_price"] == 44400.0
+        assert processor.pending_order_blocks == 0
+        assert processor.pending_fvgs == 0
+
+    async def test_published_patterns_reach_single_handler(self, event_bus, processor):
+        """Test both pattern topics route to the one pattern handler."""
+        await event_bus.publish(ob_event("bearish", 44000.0, 44500.0))
+        await event_bus.publish(fvg_event("bearish", 43800.0, 44300.0))
+        await event_bus.stop()
+
+        assert event_bus.subscriber_count(EventType.ORDER_BLOCK_DETECTED) == 1
+        assert event_bus.subscriber_count(EventType.FVG_DETECTED) == 1
+        assert processor.signal_count == 1
+
+    async def test_opposite_directions_do_not_pair(self, processor):
+        """Test bullish and bearish patterns never form a signal."""
+        await processor._on_pattern_detected(ob_event("bullish", 44000.0, 44500.0))
+        await processor._on_pattern_detected(fvg_event("bearish", 44200.0, 44600.0))
+
+        assert processor.signal_count == 0
+        assert processor.pending_order_blocks == 1
+        assert processor.pending_fvgs == 1
+
+    async def test_distant_patterns_do_not_pair(self, processor):
+        """Test patterns beyond the proximity threshold are not combined."""
+        await processor._on_pattern_detected(ob_event("bullish", 40000.0, 40100.0))
+        await processor._on_pattern_detected(fvg_event("bullish", 44200.0, 44600.0))
+
+        assert processor.signal_count == 0
+
+    async def test_matched_pair_removed_others_kept(self, processor):
+        """Test only the matched patterns are consumed by a signal."""
+        await processor._on_pattern_detected(ob_event("bearish", 50000.0, 50500.0))
+        await processor._on_pattern_detected(ob_event("bullish", 44000.0, 44500.0))
+        await processor._on_pattern_detected(fvg_event("bullish", 44200.0, 44600.0))
+
+        assert processor.signal_count == 1
+        assert processor.pending_order_blocks == 1
+        assert len(processor._ob_by_dir[Direction.BEARISH]) == 1
+
+    async def test_incoming_pattern_pairs_with_oldest_nearby(self, processor):
+        """Test the new pattern pairs with the oldest counterpart in range."""
+        await processor._on_pattern_detected(fvg_event("bullish", 50000.0, 50400.0))
+        await processor._on_pattern_detected(fvg_event("bullish", 44200.0, 44600.0))
+        await processor._on_pattern_detected(fvg_event("bullish", 44300.0, 44700.0))
+        await processor._on_pattern_detected(ob_event("bullish", 44000.0, 44500.0))
+
+        assert processor.signal_count == 1
+        remaining = list(processor._fvg_by_dir[Direction.BULLISH].bottoms)
+        assert remaining == [50000.0, 44300.0]
+
+    async def test_patterns_within_threshold_pair(self, processor):
+        """Test a non-overlapping pair inside the proximity envelope pairs."""
+        # 0.5% gap between OB top and FVG bottom, threshold is 1%
+        await processor._on_pattern_detected(ob_event("bullish", 43800.0, 44000.0))
+        await processor._on_pattern_detected(fvg_event("bullish", 44220.0, 44600.0))
+
+        assert processor.signal_count == 1
+
+
+class TestPatternExpiry:
+    """Test timeout eviction and memory bounds."""
+
+    async def test_expired_patterns_are_evicted_before_matching(
+        self, processor, monkeypatch
+    ):
+        """Test a stale Order Block cannot pair with a fresh FVG."""
+        clock = iter([0, 600 * 1_000_000_000])
+        monkeypatch.setattr(signal_processor, "monotonic_ns", lambda: next(clock))
+
+        await processor._on_pattern_detected(ob_event("bullish", 44000.0, 44500.0))
+        await processor._on_pattern_detected(fvg_event("bullish", 44200.0, 44600.0))
+
+        assert processor.signal_count == 0
+        assert processor.pending_order_blocks == 0
+        assert processor.pending_fvgs == 1
+
+    async def test_pending_patterns_are_capped(self, event_bus):
+        """Test max_pending_patterns bounds stored patterns per direction."""
+        proc = SignalProcessor(event_bus, config={"max_pending_patterns": 3})
+        await proc.start()
+
+        for i in range(5):
+            await proc._on_pattern_detected(
+                ob_event("bullish", 1000.0 * (i + 1), 1000.0 * (i + 1) + 10)
+            )
+
+        assert proc.pending_order_blocks == 3
+        assert proc._ob_by_dir[Direction.BULLISH].bottoms[0] == 3000.0
+
+        await proc.stop()
+
+
+class TestReset:
+    """Test in-place state reset."""
+
+    async def test_reset_clears_pending_patterns(self, processor):
+        """Test reset empties every bucket but keeps the bucket objects."""
+        await processor._on_pattern_detected(ob_event("bullish", 44000.0, 44500.0))
+        await processor._on_pattern_detected(fvg_event("bearish", 44200.0, 44600.0))
+        buckets = processor._ob_by_dir
+
+        processor.reset()
+
+        assert processor._ob_by_dir is buckets
+        assert processor.pending_order_blocks == 0
+        assert processor.pending_fvgs == 0
+        assert processor.signal_count == 0
+
+    def test_reset_before_start_raises(self):
+        """Test reset requires initialized state."""
+        with pytest.raises(RuntimeError):
+            SignalProcessor(EventBus()).reset()
@@ -5,6 +5,7 @@ Tests the EventType enum, Event dataclass, and EventBus implementation
 to ensure reliable event-driven communication in the trading system.
 """
 
+import dataclasses
 import pytest
 from datetime import datetime
 from src.core.event_bus import EventType, Event, EventBus
@@ -14,7 +15,7 @@ class TestEventType:
     """Test cases for EventType enumeration"""
 
     def test_all_event_types_exist(self):
-        """Test that all 8 required event types are defined"""
+        """Test that all 10 required event types are defined"""
         required_events = [
             'CANDLE_CLOSED',
             'ORDER_BLOCK_DETECTED',
@@ -22,15 +23,17 @@ class TestEventType:
             'ENTRY_SIGNAL',
             'ORDER_PLACED',
             'ORDER_FILLED',
+            'ORDER_PLACED_FILLED',
             'POSITION_CLOSED',
+            'BACKTEST_COMPLETED',
             'ERROR'
         ]
 
         for event_name in required_events:
             assert hasattr(EventType, event_name), f"EventType.{event_name} not found"
 
-        # Verify exactly 8 event types (no more, no less)
-        assert len(EventType) == 8, f"Expected 8 event types, found {len(EventType)}"
+        # Verify exactly 10 event types (no more, no less)
+        assert len(EventType) == 10, f"Expected 10 event types, found {len(EventType)}"
 
     def test_event_type_values_are_strings(self):
         """Test that all event type values are string literals"""
@@ -40,6 +43,16 @@ class TestEventType:
             assert len(event_type.value) > 0, \
                 f"{event_type.name} value should not be empty"
 
+    def test_event_type_works_as_dict_key_after_pickling(self):
+        """Test identity hashing survives a pickle round trip"""
+        import pickle
+
+        lookup = {event_type: event_type.value for event_type in EventType}
+        for event_type in EventType:
+            restored = pickle.loads(pickle.dumps(event_type))
+            assert restored is event_type
+            assert lookup[restored] == event_type.value
+
     def test_event_type_values_are_snake_case(self):
         """Test that event values follow snake_case convention"""
         for event_type in EventType:
@@ -84,7 +97,7 @@ class TestEventType:
     def test_event_type_iteration(self):
         """Test that we can iterate over all event types"""
         event_types = list(EventType)
-        assert len(event_types) == 8
+        assert len(event_types) == 10
         assert EventType.CANDLE_CLOSED in event_types
         assert EventType.ERROR in event_types
 
@@ -96,7 +109,9 @@ class TestEventType:
         assert EventType.ENTRY_SIGNAL.value == 'entry_signal'
         assert EventType.ORDER_PLACED.value == 'order_placed'
         assert EventType.ORDER_FILLED.value == 'order_filled'
+        assert EventType.ORDER_PLACED_FILLED.value == 'order_placed_filled'
         assert EventType.POSITION_CLOSED.value == 'position_closed'
+        assert EventType.BACKTEST_COMPLETED.value == 'backtest_completed'
         assert EventType.ERROR.value == 'error'
 
 
@@ -165,6 +180,27 @@ class TestEvent:
         )
         assert event.data == {}
 
+    def test_event_is_immutable(self):
+        """Test that event fields cannot be reassigned"""
+        event = Event(
+            event_type=EventType.ERROR,
+            data={},
+            source='test'
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.source = 'other'
+
+    def test_event_is_slotted(self):
+        """Test that events carry no per-instance __dict__"""
+        event = Event(
+            event_type=EventType.ERROR,
+            data={},
+            source='test'
+        )
+
+        assert not hasattr(event, '__dict__')
+
     def test_event_data_types(self):
         """Test various data types in event payload"""
         event = Event(
@@ -237,6 +273,19 @@ class TestEventBus:
         assert event_bus.subscriber_count(EventType.CANDLE_CLOSED) == 1
         assert event_bus.subscriber_count(EventType.ERROR) == 0
 
+    def test_has_subscribers(self, event_bus):
+        """Test has_subscribers tracks subscribe and unsubscribe"""
+        callback = lambda e: None
+
+        assert event_bus.has_subscribers(EventType.ORDER_PLACED) is False
+
+        event_bus.subscribe(EventType.ORDER_PLACED, callback)
+        assert event_bus.has_subscribers(EventType.ORDER_PLACED) is True
+        assert event_bus.has_subscribers(EventType.ERROR) is False
+
+        event_bus.unsubscribe(EventType.ORDER_PLACED, callback)
+        assert event_bus.has_subscribers(EventType.ORDER_PLACED) is False
+
     def test_subscribe_multiple_callbacks(self, event_bus):
         """Test subscribing multiple callbacks to same event type"""
         callback1 = lambda e: None
@@ -4,8 +4,10 @@ Unit tests for EventBus async queue functionality.
 Tests async event publishing, queue processing, and graceful shutdown.
 """
 
+import gc
 import pytest
 import asyncio
+import warnings
 from src.core.event_bus import EventBus, Event, EventType
 
 
@@ -507,3 +509,400 @@ class TestEventBusAsync:
         assert results["sync2"] == 1
         assert results["async1"] == 1
         assert results["async2"] == 1
+
+    async def test_handlers_for_one_event_run_concurrently(self):
+        """Test that an event's handlers overlap instead of running back to back."""
+        bus = EventBus()
+        started = {1: asyncio.Event(), 2: asyncio.Event()}
+        met = []
+
+        def make_handler(own: int, other: int):
+            async def handler(event: Event):
+                # Rendezvous: only completes if the other handler is running
+                # at the same time; sequential dispatch times out here
+                started[own].set()
+                await asyncio.wait_for(started[other].wait(), timeout=0.5)
+                met.append(own)
+            return handler
+
+        bus.subscribe(EventType.CANDLE_CLOSED, make_handler(1, 2))
+        bus.subscribe(EventType.CANDLE_CLOSED, make_handler(2, 1))
+
+        await bus._dispatch(Event(EventType.CANDLE_CLOSED, {"price": 45000}, "test"))
+
+        assert sorted(met) == [1, 2]
+
+
+@pytest.mark.asyncio
+class TestEventBusBatching:
+    """Test suite for EventBus batched delivery."""
+
+    async def test_batch_flushes_when_full(self):
+        """Test that a full batch is delivered without waiting for the timer."""
+        bus = EventBus()
+        batches = []
+
+        async def handler(events):
+            batches.append([e.data["i"] for e in events])
+
+        bus.subscribe_batch(EventType.CANDLE_CLOSED, handler, max_batch=3, flush_ms=10_000)
+        await bus.start()
+
+        for i in range(3):
+            await bus.publish(Event(EventType.CANDLE_CLOSED, {"i": i}, "test"))
+
+        await asyncio.sleep(0.1)
+        assert batches == [[0, 1, 2]]
+        await bus.stop()
+
+    async def test_batch_flushes_after_flush_ms(self):
+        """Test that a partial batch is delivered once flush_ms elapses."""
+        bus = EventBus()
+        batches = []
+
+        def handler(events):
+            batches.append(len(events))
+
+        bus.subscribe_batch(EventType.CANDLE_CLOSED, handler, max_batch=32, flush_ms=20)
+        await bus.start()
+
+        await bus.publish(Event(EventType.CANDLE_CLOSED, {"i": 0}, "test"))
+        await bus.publish(Event(EventType.CANDLE_CLOSED, {"i": 1}, "test"))
+
+        await asyncio.sleep(0.2)
+        assert batches == [2]
+        await bus.stop()
+
+    async def test_slow_batch_callback_keeps_full_batches(self):
+        """Test a callback slower than the handler timeout still gets every batch, in order."""
+        bus = EventBus()
+        batches = []
+
+        async def slow_handler(events):
+            await asyncio.sleep(1.5)
+            batches.append([e.data["i"] for e in events])
+
+        bus.subscribe_batch(EventType.CANDLE_CLOSED, slow_handler, max_batch=2, flush_ms=10_000)
+        await bus.start()
+
+        for i in range(4):
+            await bus.publish(Event(EventType.CANDLE_CLOSED, {"i": i}, "test"))
+
+        # stop() waits for both size-triggered deliveries still in flight
+        await bus.stop()
+        assert batches == [[0, 1], [2, 3]]
+
+    async def test_stop_waits_for_timer_flush_in_flight(self):
+        """Test stop() does not return before a timer-triggered delivery finishes."""
+        bus = EventBus()
+        batches = []
+
+        async def slow_handler(events):
+            await asyncio.sleep(0.2)
+            batches.append(len(events))
+
+        bus.subscribe_batch(EventType.CANDLE_CLOSED, slow_handler, max_batch=32, flush_ms=10)
+        await bus.start()
+
+        await bus.publish(Event(EventType.CANDLE_CLOSED, {"i": 0}, "test"))
+        await asyncio.sleep(0.05)  # Timer fires; delivery is now in flight
+
+        await bus.stop()
+        assert batches == [1]
+
+    async def test_emit_skips_batch_subscribers(self):
+        """Test emit() leaves batch subscribers untouched and creates no coroutine."""
+        bus = EventBus()
+        batches = []
+        received = []
+
+        bus.subscribe_batch(EventType.CANDLE_CLOSED, batches.append)
+        bus.subscribe(EventType.CANDLE_CLOSED, received.append)
+
+        with warnings.catch_warnings(record=True) as caught:
+            # An un-awaited deliver() coroutine warns once it is collected
+            warnings.simplefilter("always")
+            bus.emit(Event(EventType.CANDLE_CLOSED, {}, "test"))
+            gc.collect()
+
+        assert not [w for w in caught if "never awaited" in str(w.message)]
+        assert len(received) == 1
+        assert batches == []
+
+    async def test_stop_flushes_buffered_events(self):
+        """Test that stop() delivers events still waiting in a batch."""
+        bus = EventBus()
+        received = []
+
+        async def handler(events):
+            received.extend(events)
+
+        bus.subscribe_batch(EventType.CANDLE_CLOSED, handler, max_batch=32, flush_ms=10_000)
+        await bus.start()
+
+        for i in range(5):
+            await bus.publish(Event(EventType.CANDLE_CLOSED, {"i": i}, "test"))
+
+        await bus.stop()
+        assert [e.data["i"] for e in received] == [0, 1, 2, 3, 4]
+
+    async def test_unsubscribe_batch_stops_delivery(self):
+        """Test that unsubscribe_batch() removes the batch subscriber."""
+        bus = EventBus()
+        received = []
+
+        def handler(events):
+            received.extend(events)
+
+        bus.subscribe_batch(EventType.CANDLE_CLOSED, handler)
+        assert bus.subscriber_count(EventType.CANDLE_CLOSED) == 1
+
+        bus.unsubscribe_batch(EventType.CANDLE_CLOSED, handler)
+        assert bus.subscriber_count(EventType.CANDLE_CLOSED) == 0
+
+        await bus.start()
+        await bus.publish(Event(EventType.CANDLE_CLOSED, {"i": 0}, "test"))
+        await bus.stop()
+        assert received == []
+
+    async def test_invalid_batch_size_raises_error(self):
+        """Test that max_batch must be positive."""
+        bus = EventBus()
+
+        with pytest.raises(ValueError):
+            bus.subscribe_batch(EventType.CANDLE_CLOSED, lambda events: None, max_batch=0)
+
+
+@pytest.mark.asyncio
+class TestEventBusFiltering:
+    """Test suite for predicate and symbol-filtered subscriptions."""
+
+    async def test_predicate_filters_events(self):
+        """Test that a predicate subscriber only receives matching events."""
+        bus = EventBus()
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.data["interval"])
+
+        bus.subscribe(
+            EventType.CANDLE_CLOSED, handler,
+            predicate=lambda e: e.data["interval"] == "5m"
+        )
+        await bus.start()
+
+        for interval in ("1m", "5m", "1m", "5m"):
+            await bus.publish(Event(EventType.CANDLE_CLOSED, {"interval": interval}, "test"))
+
+        await bus.stop()
+        assert received == ["5m", "5m"]
+
+    async def test_subscribe_symbol_routes_by_symbol(self):
+        """Test that symbol subscribers only see their own symbol."""
+        bus = EventBus()
+        btc, eth, everything = [], [], []
+
+        bus.subscribe_symbol(EventType.CANDLE_CLOSED, "BTCUSDT", lambda e: btc.append(e))
+        bus.subscribe_symbol(EventType.CANDLE_CLOSED, "ETHUSDT", lambda e: eth.append(e))
+        bus.subscribe(EventType.CANDLE_CLOSED, lambda e: everything.append(e))
+        await bus.start()
+
+        for symbol in ("BTCUSDT", "ETHUSDT", "BTCUSDT", "SOLUSDT"):
+            await bus.publish(Event(EventType.CANDLE_CLOSED, {"symbol": symbol}, "test"))
+
+        await bus.stop()
+        assert [e.data["symbol"] for e in btc] == ["BTCUSDT", "BTCUSDT"]
+        assert [e.data["symbol"] for e in eth] == ["ETHUSDT"]
+        assert len(everything) == 4
+
+    async def test_unsubscribe_removes_symbol_subscriber(self):
+        """Test that unsubscribe() also removes symbol subscribers."""
+        bus = EventBus()
+        received = []
+
+        def handler(event: Event):
+            received.append(event)
+
+        bus.subscribe_symbol(EventType.CANDLE_CLOSED, "BTCUSDT", handler)
+        assert bus.has_subscribers(EventType.CANDLE_CLOSED)
+
+        bus.unsubscribe(EventType.CANDLE_CLOSED, handler)
+        assert not bus.has_subscribers(EventType.CANDLE_CLOSED)
+
+        await bus.start()
+        await bus.publish(Event(EventType.CANDLE_CLOSED, {"symbol": "BTCUSDT"}, "test"))
+        await bus.stop()
+        assert received == []
+
+
+@pytest.mark.asyncio
+class TestEventBusPublishBatch:
+    """Test suite for EventBus.publish_batch()."""
+
+    async def test_publish_batch_delivers_in_order(self):
+        """Test that batched events reach subscribers in publish order."""
+        bus = EventBus()
+        received = []
+
+        def handler(event: Event):
+            received.append(event.data["i"])
+
+        bus.subscribe(EventType.CANDLE_CLOSED, handler)
+        await bus.start()
+
+        await bus.publish_batch(
+            Event(EventType.CANDLE_CLOSED, {"i": i}, "test") for i in range(5)
+        )
+
+        await bus.stop()
+        assert received == [0, 1, 2, 3, 4]
+
+    async def test_publish_batch_rejects_invalid_item(self):
+        """Test that an invalid item raises before anything is queued."""
+        bus = EventBus()
+        await bus.start()
+
+        with pytest.raises(TypeError):
+            await bus.publish_batch([Event(EventType.CANDLE_CLOSED, {}, "test"), "bad"])
+
+        assert bus.queue_size == 0
+        await bus.stop()
+
+    async def test_publish_batch_requires_start(self):
+        """Test that publish_batch() raises before start()."""
+        bus = EventBus()
+
+        with pytest.raises(RuntimeError):
+            await bus.publish_batch([Event(EventType.CANDLE_CLOSED, {}, "test")])
+
+
+@pytest.mark.asyncio
+class TestEventBusPublishNowait:
+    """Test suite for EventBus.publish_nowait() and drain()."""
+
+    async def test_publish_nowait_then_drain_dispatches_cascade(self):
+        """Test drain() returns after queued events and those they publish."""
+        bus = EventBus()
+        received = []
+
+        async def candle_handler(event: Event):
+            received.append(event.data["i"])
+            await bus.publish(Event(EventType.ENTRY_SIGNAL, event.data, "test"))
+
+        def signal_handler(event: Event):
+            received.append(("signal", event.data["i"]))
+
+        bus.subscribe(EventType.CANDLE_CLOSED, candle_handler)
+        bus.subscribe(EventType.ENTRY_SIGNAL, signal_handler)
+        await bus.start()
+
+        for i in range(3):
+            bus.publish_nowait(Event(EventType.CANDLE_CLOSED, {"i": i}, "test"))
+        assert received == []  # Nothing runs until the caller yields
+
+        await bus.drain()
+        assert received == [0, 1, 2, ("signal", 0), ("signal", 1), ("signal", 2)]
+        assert bus.queue_size == 0
+
+        await bus.stop()
+
+    async def test_publish_nowait_validation(self):
+        """Test publish_nowait() rejects non-events and requires start()."""
+        bus = EventBus()
+
+        with pytest.raises(RuntimeError):
+            bus.publish_nowait(Event(EventType.CANDLE_CLOSED, {}, "test"))
+        with pytest.raises(RuntimeError):
+            await bus.drain()
+
+        await bus.start()
+        with pytest.raises(TypeError):
+            bus.publish_nowait("not an event")
+        await bus.stop()
+
+
+@pytest.mark.asyncio
+class TestEventBusInlineDispatch:
+    """Test suite for EventBus(inline_dispatch=True)."""
+
+    async def test_publish_runs_handlers_before_returning(self):
+        """Test inline publish() has run every handler, cascade included, on return."""
+        bus = EventBus(inline_dispatch=True)
+        received = []
+
+        async def candle_handler(event: Event):
+            received.append("candle")
+            await bus.publish(Event(EventType.ENTRY_SIGNAL, {}, "test"))
+
+        def signal_handler(event: Event):
+            received.append("signal")
+
+        bus.subscribe(EventType.CANDLE_CLOSED, candle_handler)
+        bus.subscribe(EventType.ENTRY_SIGNAL, signal_handler)
+        await bus.start()
+
+        await bus.publish(Event(EventType.CANDLE_CLOSED, {}, "test"))
+
+        assert received == ["candle", "signal"]
+        assert bus.queue_size == 0
+        await bus.stop()
+
+    async def test_failing_handler_does_not_stop_others(self):
+        """Test an inline handler error is logged and later handlers still run."""
+        bus = EventBus(inline_dispatch=True)
+        received = []
+
+        def failing_handler(event: Event):
+            raise ValueError("boom")
+
+        def handler(event: Event):
+            received.append(event.data["i"])
+
+        bus.subscribe(EventType.CANDLE_CLOSED, failing_handler)
+        bus.subscribe(EventType.CANDLE_CLOSED, handler)
+        await bus.start()
+
+        await bus.publish_batch(
+            Event(EventType.CANDLE_CLOSED, {"i": i}, "test") for i in range(3)
+        )
+
+        assert received == [0, 1, 2]
+        await bus.stop()
+
+
+@pytest.mark.asyncio
+class TestEventBusGlobalSubscribers:
+    """Test suite for subscribe_all() global subscribers."""
+
+    async def test_global_subscriber_receives_every_type(self):
+        """Test one subscribe_all() registration sees events of all types."""
+        bus = EventBus()
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.event_type)
+
+        bus.subscribe_all(handler)
+        await bus.start()
+
+        await bus.publish(Event(EventType.CANDLE_CLOSED, {}, "test"))
+        await bus.publish(Event(EventType.ENTRY_SIGNAL, {}, "test"))
+        await bus.publish(Event(EventType.ERROR, {}, "test"))
+
+        await bus.stop()
+        assert received == [EventType.CANDLE_CLOSED, EventType.ENTRY_SIGNAL, EventType.ERROR]
+
+    async def test_global_subscriber_counts_for_every_type(self):
+        """Test global subscribers are reflected in the subscriber queries."""
+        bus = EventBus()
+
+        def handler(event: Event):
+            pass
+
+        bus.subscribe_all(handler)
+        assert bus.has_subscribers(EventType.ORDER_PLACED)
+        assert bus.subscriber_count(EventType.ORDER_PLACED) == 1
+
+        bus.unsubscribe_all(handler)
+        assert not bus.has_subscribers(EventType.ORDER_PLACED)
+        assert bus.subscriber_count(EventType.ORDER_PLACED) == 0